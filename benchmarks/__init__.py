@@ -0,0 +1 @@
+"""Benchmarks for the Safe-DS stubs generator."""
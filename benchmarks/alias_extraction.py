@@ -0,0 +1,61 @@
+"""Compare the alias extraction from the package ASTs with a scan of all expression types of the Mypy build.
+
+The Mypy build contains the expression types of all modules, including the standard library and third party packages.
+The old approach searched all of them, the current one only looks up the expressions of the package modules.
+
+Usage: `python -m benchmarks.alias_extraction [PACKAGE_PATH]`
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from mypy import nodes as mypy_nodes
+
+from safeds_stubgen.api_analyzer._get_api import _add_alias, _get_aliases, _get_mypy_asts, _get_mypy_build
+
+_default_package = Path(__file__).parent.parent / "tests" / "data" / "various_modules_package"
+_repetitions = 5
+
+
+def _get_aliases_from_all_types(result_types: dict, package_name: str) -> dict[str, set[str]]:
+    aliases: dict[str, set[str]] = defaultdict(set)
+    for key, type_value in result_types.items():
+        if isinstance(key, mypy_nodes.NameExpr | mypy_nodes.MemberExpr | mypy_nodes.TypeVarExpr):
+            _add_alias(aliases=aliases, key=key, type_value=type_value, package_name=package_name)
+    return aliases
+
+
+def main() -> None:
+    package_path = Path(sys.argv[1]).resolve() if len(sys.argv) > 1 else _default_package
+
+    files = [str(file_path) for file_path in package_path.glob("./**/*.py") if file_path.name != "__init__.py"]
+    package_paths = [str(file_path.parent) for file_path in package_path.glob("./**/__init__.py")]
+    build_result = _get_mypy_build(files=files, package_root=package_path)
+    mypy_asts = _get_mypy_asts(build_result=build_result, files=files, package_paths=package_paths)
+    package_name = package_path.stem
+
+    start_time = time.perf_counter()
+    for _ in range(_repetitions):
+        all_types_aliases = _get_aliases_from_all_types(result_types=build_result.types, package_name=package_name)
+    all_types_time = (time.perf_counter() - start_time) / _repetitions
+
+    start_time = time.perf_counter()
+    for _ in range(_repetitions):
+        package_aliases = _get_aliases(mypy_asts=mypy_asts, result_types=build_result.types, package_name=package_name)
+    package_time = (time.perf_counter() - start_time) / _repetitions
+
+    print(f"Package:                  {package_path}")  # noqa: T201
+    print(f"Expression types:         {len(build_result.types)}")  # noqa: T201
+    print(f"Aliases:                  {len(package_aliases)}")  # noqa: T201
+    print(f"Same aliases:             {dict(package_aliases) == dict(all_types_aliases)}")  # noqa: T201
+    print(f"Scan of all types:        {all_types_time * 1000:.2f}ms")  # noqa: T201
+    print(f"Package expressions only: {package_time * 1000:.2f}ms")  # noqa: T201
+    print(f"Speedup:                  {all_types_time / package_time:.2f}x")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Measure the memory that the entities of the API data of the test packages need.
+
+For every kind of entity the average size of an instance is reported, including its `__dict__` if it has one, but
+excluding the objects it references.
+
+Usage: `python -m benchmarks.api_memory`
+"""
+
+from __future__ import annotations
+
+import sys
+from collections import defaultdict
+from enum import Enum as PythonEnum
+from pathlib import Path
+from typing import Any
+
+from safeds_stubgen.api_analyzer import get_api
+from safeds_stubgen.docstring_parsing import DocstringStyle
+
+_test_data_dir = Path(__file__).parent.parent / "tests" / "data"
+_test_packages = ["main_package", "various_modules_package", "docstring_parser_package"]
+
+
+def _get_instance_size(obj: object) -> int:
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def _collect_entities(api_object: Any, entities: dict[int, object]) -> None:
+    """Collect all entities of the API and the docstrings and types they reference."""
+    if isinstance(api_object, list | tuple):
+        for item in api_object:
+            _collect_entities(item, entities)
+        return
+    if (
+        id(api_object) in entities
+        or not type(api_object).__module__.startswith("safeds_stubgen.")
+        or isinstance(api_object, PythonEnum)
+    ):
+        return
+
+    entities[id(api_object)] = api_object
+    for name in getattr(api_object, "__dataclass_fields__", None) or getattr(api_object, "__slots__", None) or []:
+        _collect_entities(getattr(api_object, name), entities)
+    if hasattr(api_object, "__dict__"):
+        for value in vars(api_object).values():
+            _collect_entities(value, entities)
+
+
+def main() -> None:
+    sizes: dict[str, list[int]] = defaultdict(list)
+
+    for package_name in _test_packages:
+        api = get_api(root=_test_data_dir / package_name, docstring_style=DocstringStyle.NUMPYDOC, is_test_run=True)
+
+        entities: dict[int, object] = {}
+        for entity_dict in [api.modules, api.classes, api.functions, api.results, api.enums, api.enum_instances]:
+            _collect_entities(list(entity_dict.values()), entities)
+        _collect_entities(list(api.attributes_.values()), entities)
+        _collect_entities(list(api.parameters_.values()), entities)
+
+        for entity in entities.values():
+            sizes[type(entity).__name__].append(_get_instance_size(entity))
+
+    total_size = 0
+    print(f"{'Entity':20} {'Count':>7} {'Bytes per entity':>17}")  # noqa: T201
+    for name, entity_sizes in sorted(sizes.items()):
+        total_size += sum(entity_sizes)
+        print(f"{name:20} {len(entity_sizes):7} {sum(entity_sizes) / len(entity_sizes):17.1f}")  # noqa: T201
+    print(f"Total: {total_size:,} bytes")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Compare storing and loading the API data of a synthetic package as JSON and in the binary format.
+
+Usage: `python -m benchmarks.api_serialization [CLASS_COUNT]`
+"""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from safeds_stubgen.api_analyzer import API, get_api
+
+from benchmarks.class_lookup import _create_package
+
+_default_class_count = 5000
+
+
+def main() -> None:
+    class_count = int(sys.argv[1]) if len(sys.argv) > 1 else _default_class_count
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        package_path = Path(tmp_dir) / "synthetic_package"
+        _create_package(package_path, class_count)
+        api = get_api(root=package_path)
+
+        formats = [
+            ("JSON", Path(tmp_dir) / "api.json", api.to_json_file, API.from_json_file),
+            ("Binary", Path(tmp_dir) / "api.bin", api.to_binary_file, API.from_binary_file),
+        ]
+        for name, path, store, load in formats:
+            start_time = time.perf_counter()
+            store(path)
+            store_time = time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            load(path)
+            load_time = time.perf_counter() - start_time
+
+            print(  # noqa: T201
+                f"{name + ':':8} store {store_time:.3f}s, load {load_time:.3f}s, size {path.stat().st_size:,} bytes",
+            )
+
+
+if __name__ == "__main__":
+    main()
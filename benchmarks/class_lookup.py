@@ -0,0 +1,66 @@
+"""Measure the stub generation for a synthetic package with many classes that reference each other.
+
+Every method of the package uses classes of other modules as parameter and result types, so the stub generator has to
+resolve the imports of tens of thousands of type references.
+
+Usage: `python -m benchmarks.class_lookup [CLASS_COUNT]`
+"""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from safeds_stubgen.api_analyzer import get_api
+from safeds_stubgen.stubs_generator import StubsStringGenerator, generate_stub_data
+
+_default_class_count = 5000
+_classes_per_module = 50
+_methods_per_class = 4
+
+
+def _create_package(root: Path, class_count: int) -> None:
+    module_count = max(class_count // _classes_per_module, 1)
+    root.mkdir()
+    root.joinpath("__init__.py").write_text("", encoding="utf-8")
+
+    for module_index in range(module_count):
+        # Each module uses the classes of the next module as types
+        other_module_index = (module_index + 1) % module_count
+        lines = [f"from .module_{other_module_index} import *\n" if module_count > 1 else ""]
+
+        for class_index in range(_classes_per_module):
+            lines.append(f"class Class{module_index}x{class_index}:")
+            for method_index in range(_methods_per_class):
+                other_class = f"Class{other_module_index}x{(class_index + method_index) % _classes_per_module}"
+                lines.append(f"    def method_{method_index}(self, a: {other_class}) -> {other_class}: ...")
+            lines.append("")
+
+        root.joinpath(f"module_{module_index}.py").write_text("\n".join(lines), encoding="utf-8")
+
+
+def main() -> None:
+    class_count = int(sys.argv[1]) if len(sys.argv) > 1 else _default_class_count
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        package_path = Path(tmp_dir) / "synthetic_package"
+        _create_package(package_path, class_count)
+
+        start_time = time.perf_counter()
+        api = get_api(root=package_path)
+        api_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        stubs_generator = StubsStringGenerator(api=api, convert_identifiers=True)
+        generate_stub_data(stubs_generator=stubs_generator, out_path=Path(tmp_dir) / "out")
+        stubs_time = time.perf_counter() - start_time
+
+    print(f"Classes:         {len(api.classes)}")  # noqa: T201
+    print(f"API creation:    {api_time:.3f}s")  # noqa: T201
+    print(f"Stub generation: {stubs_time:.3f}s")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
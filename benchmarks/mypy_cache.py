@@ -0,0 +1,41 @@
+"""Compare the wall time of `get_api` with a cold and a warm Mypy cache.
+
+Usage: `python -m benchmarks.mypy_cache [PACKAGE_PATH]`
+"""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from safeds_stubgen.api_analyzer import get_api
+
+_default_package = Path(__file__).parent.parent / "tests" / "data" / "various_modules_package"
+
+
+def _timed_get_api(package_path: Path, cache_dir: Path | None) -> float:
+    start_time = time.perf_counter()
+    get_api(root=package_path, is_test_run=True, cache_dir=cache_dir)
+    return time.perf_counter() - start_time
+
+
+def main() -> None:
+    package_path = Path(sys.argv[1]).resolve() if len(sys.argv) > 1 else _default_package
+
+    no_cache_time = _timed_get_api(package_path, cache_dir=None)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_dir = Path(tmp_dir)
+        cold_time = _timed_get_api(package_path, cache_dir=cache_dir)
+        warm_time = _timed_get_api(package_path, cache_dir=cache_dir)
+
+    print(f"Package:        {package_path}")  # noqa: T201
+    print(f"No cache:       {no_cache_time:.3f}s")  # noqa: T201
+    print(f"Cold cache:     {cold_time:.3f}s")  # noqa: T201
+    print(f"Warm cache:     {warm_time:.3f}s")  # noqa: T201
+    print(f"Speedup (warm): {cold_time / warm_time:.2f}x")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Compare the peak memory and wall time of `get_api` with and without the low memory mode.
+
+Each run happens in a new process, so that the peak resident set size of one run doesn't affect the other one. Packages
+with large dependencies, e.g. ones importing numpy or pandas, show the biggest difference.
+
+Usage: `python -m benchmarks.mypy_memory [PACKAGE_PATH]`
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from safeds_stubgen.api_analyzer import get_api
+
+_default_package = Path(__file__).parent.parent / "tests" / "data" / "various_modules_package"
+
+
+def _measure_get_api(package_path: Path, low_memory: bool) -> tuple[float, int, int]:
+    start_time = time.perf_counter()
+    get_api(root=package_path, is_test_run=True, low_memory=low_memory)
+    wall_time = time.perf_counter() - start_time
+
+    # The maximum resident set sizes are given in kilobytes on Linux. The low memory mode fills the Mypy cache in a
+    #  child process.
+    return (
+        wall_time,
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+
+
+def _measure_in_new_process(package_path: Path, low_memory: bool) -> tuple[float, int, int]:
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+        return executor.submit(_measure_get_api, package_path, low_memory).result()
+
+
+def main() -> None:
+    package_path = Path(sys.argv[1]).resolve() if len(sys.argv) > 1 else _default_package
+
+    default_time, default_peak, _ = _measure_in_new_process(package_path, low_memory=False)
+    low_memory_time, low_memory_peak, cache_process_peak = _measure_in_new_process(package_path, low_memory=True)
+
+    print(f"Package:                   {package_path}")  # noqa: T201
+    print(f"Default peak RSS:          {default_peak / 1024:.1f} MiB")  # noqa: T201
+    print(f"Low memory peak RSS:       {low_memory_peak / 1024:.1f} MiB")  # noqa: T201
+    print(f"Cache process peak RSS:    {cache_process_peak / 1024:.1f} MiB")  # noqa: T201
+    print(f"Default wall time:         {default_time:.3f}s")  # noqa: T201
+    print(f"Low memory wall time:      {low_memory_time:.3f}s")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Measure hashing and equality checks of nested types, as they are created for the types of docstrings.
+
+Usage: `python -m benchmarks.type_hashing [REPETITIONS]`
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+
+from safeds_stubgen.api_analyzer import (
+    AbstractType,
+    CallableType,
+    DictType,
+    ListType,
+    LiteralType,
+    NamedType,
+    TupleType,
+    UnionType,
+)
+
+_default_repetitions = 100_000
+
+
+def _create_nested_type(depth: int, offset: int = 0) -> AbstractType:
+    named_types = [NamedType(f"Class{i}", f"package.module.Class{i}") for i in range(offset, offset + 5)]
+    if depth == 0:
+        return UnionType([*named_types, LiteralType(["a", "b", 1])])
+
+    nested_type = _create_nested_type(depth - 1, offset)
+    return UnionType(
+        [
+            *named_types,
+            ListType([nested_type]),
+            TupleType([nested_type, named_types[0]]),
+            DictType(named_types[1], nested_type),
+            CallableType([nested_type], named_types[2]),
+        ],
+    )
+
+
+def main() -> None:
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else _default_repetitions
+
+    type_ = _create_nested_type(depth=4)
+    # Structurally equal, but with the members of the outer union in another order
+    equal_type = UnionType(list(reversed(type_.types)))  # type: ignore[attr-defined]
+    other_type = _create_nested_type(depth=4, offset=1)
+
+    benchmarks = {
+        "hash": lambda: hash(type_),
+        "== (same object)": lambda: type_ == type_,  # noqa: PLR0124
+        "== (equal)": lambda: type_ == equal_type,
+        "== (not equal)": lambda: type_ == other_type,
+        "set of 3 types": lambda: {type_, equal_type, other_type},
+    }
+    for name, benchmark in benchmarks.items():
+        seconds = timeit.timeit(benchmark, number=repetitions)
+        print(f"{name:20} {seconds / repetitions * 1_000_000:10.3f}µs")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from safeds_stubgen.api_analyzer import Module
+    from safeds_stubgen.api_analyzer import Module, ReexportIndex
 
 
 def is_internal(name: str) -> bool:
@@ -11,7 +11,7 @@ def is_internal(name: str) -> bool:
     return name.startswith("_")
 
 
-def get_reexported_by(qname: str, reexport_map: dict[str, set[Module]]) -> list[Module]:
+def get_reexported_by(qname: str, reexport_map: ReexportIndex) -> list[Module]:
     """Get all __init__ modules where a given function / class / enum was reexported."""
     path = qname.split(".")
 
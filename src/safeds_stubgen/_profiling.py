@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import json
+import re
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+_T = TypeVar("_T")
+
+PROFILE_REPORT_VERSION = 1
+
+# The profiler that records the phases, if profiling is enabled
+_active_profiler: Profiler | None = None
+
+
+@dataclass
+class PhaseProfile:
+    """The measurements of a phase of the pipeline.
+
+    Times are given in seconds and memory in bytes. The times of a phase don't include the times of the phases nested in
+    it. The CPU time only counts the main process, not the worker processes.
+    """
+
+    name: str
+    calls: int = 0
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    peak_memory: int = 0
+
+
+class Profiler:
+    """Measure the wall time, CPU time and peak memory of the phases of the pipeline.
+
+    While the profiler is used as a context manager, all phases entered with `profile_phase` are recorded. A phase that
+    is entered several times, e.g. once per run in the watch mode, is added up.
+
+    The peak memory is the peak resident set size of the process during a phase. It can only be reset between phases
+    on Linux, on other systems it's the peak of the process up to the end of the phase.
+    """
+
+    def __init__(self) -> None:
+        self.phases: dict[str, PhaseProfile] = {}
+        # Further reports that are written into the profile report, e.g. the cost of walking the modules and classes
+        self.reports: dict[str, dict[str, Any]] = {}
+        self._stack: list[_RunningPhase] = []
+        self._start_wall_time = 0.0
+        self._start_cpu_time = 0.0
+        self._wall_time = 0.0
+        self._cpu_time = 0.0
+
+    def __enter__(self) -> Profiler:
+        global _active_profiler  # noqa: PLW0603
+        if _active_profiler is not None:  # pragma: no cover
+            raise ValueError("Another profiler is already active.")
+
+        _active_profiler = self
+        self._start_wall_time = time.perf_counter()
+        self._start_cpu_time = time.process_time()
+        return self
+
+    def __exit__(self, *_args: object) -> None:
+        global _active_profiler  # noqa: PLW0603
+        _active_profiler = None
+        self._wall_time += time.perf_counter() - self._start_wall_time
+        self._cpu_time += time.process_time() - self._start_cpu_time
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Record a phase, which may be nested in another one."""
+        if self._stack:
+            self._stack[-1].pause()
+
+        running_phase = _RunningPhase(self.phases.setdefault(name, PhaseProfile(name=name)))
+        self._stack.append(running_phase)
+        running_phase.resume()
+        try:
+            yield
+        finally:
+            running_phase.pause()
+            running_phase.profile.calls += 1
+            self._stack.pop()
+
+            if self._stack:
+                self._stack[-1].resume()
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": PROFILE_REPORT_VERSION,
+            "python_version": ".".join(str(part) for part in sys.version_info[:3]),
+            "wall_time": self._wall_time,
+            "cpu_time": self._cpu_time,
+            # Resetting the peak memory of the phases also resets the peak memory of the process
+            "peak_memory": max([_get_peak_memory(), *(phase.peak_memory for phase in self.phases.values())]),
+            "phases": [asdict(phase) for phase in self.phases.values()],
+            **self.reports,
+        }
+
+    def to_json_file(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+
+class _RunningPhase:
+    def __init__(self, profile: PhaseProfile) -> None:
+        self.profile = profile
+        self._wall_time = 0.0
+        self._cpu_time = 0.0
+
+    def resume(self) -> None:
+        _reset_peak_memory()
+        self._wall_time = time.perf_counter()
+        self._cpu_time = time.process_time()
+
+    def pause(self) -> None:
+        self.profile.wall_time += time.perf_counter() - self._wall_time
+        self.profile.cpu_time += time.process_time() - self._cpu_time
+        self.profile.peak_memory = max(self.profile.peak_memory, _get_peak_memory())
+
+
+@contextmanager
+def profile_phase(name: str) -> Iterator[None]:
+    """Record a phase of the pipeline, if a profiler is active."""
+    if _active_profiler is None:
+        yield
+        return
+
+    with _active_profiler.phase(name):
+        yield
+
+
+def profile_iterator(name: str, iterable: Iterable[_T]) -> Iterator[_T]:
+    """Record the time spent creating the items of an iterator as a phase, if a profiler is active.
+
+    This separates the creation of lazily created items from the work done with them by the consumer of the iterator.
+    """
+    iterator = iter(iterable)
+    while True:
+        with profile_phase(name):
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+        yield item
+
+
+def _reset_peak_memory() -> None:
+    # Writing "5" to clear_refs resets the peak resident set size of the process on Linux
+    try:
+        with Path("/proc/self/clear_refs").open("w", encoding="utf-8") as f:
+            f.write("5")
+    except OSError:  # pragma: no cover
+        pass
+
+
+def _get_peak_memory() -> int:
+    try:
+        status = Path("/proc/self/status").read_text(encoding="utf-8")
+    except OSError:  # pragma: no cover
+        return _get_max_rss()
+
+    match = re.search(r"VmHWM:\s+(\d+) kB", status)
+    if match is None:  # pragma: no cover
+        return _get_max_rss()
+    return int(match.group(1)) * 1024
+
+
+def _get_max_rss() -> int:
+    try:
+        import resource  # noqa: PLC0415
+    except ImportError:  # pragma: no cover
+        # The resource module is not available on Windows
+        return 0
+
+    # The maximum resident set size is given in bytes on macOS and in kilobytes everywhere else
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
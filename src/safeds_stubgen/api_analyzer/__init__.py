@@ -21,6 +21,7 @@ from ._ast_visitor import result_name_generator
 from ._get_api import get_api
 from ._mypy_helpers import get_classdef_definitions, get_funcdef_definitions, get_mypyfile_definitions
 from ._package_metadata import distribution, distribution_version
+from ._reexport_index import ReexportIndex
 from ._type_source_enums import TypeSourcePreference, TypeSourceWarning
 from ._types import (
     AbstractType,
@@ -37,6 +38,7 @@ from ._types import (
     UnionType,
     UnknownType,
 )
+from ._walk_profiler import SymbolCost, WalkProfiler
 
 __all__ = [
     "API",
@@ -56,8 +58,10 @@ __all__ = [
     "Parameter",
     "ParameterAssignment",
     "QualifiedImport",
+    "ReexportIndex",
     "Result",
     "SetType",
+    "SymbolCost",
     "TupleType",
     "TypeSourcePreference",
     "TypeSourceWarning",
@@ -66,6 +70,7 @@ __all__ = [
     "UnknownType",
     "UnknownValue",
     "VarianceKind",
+    "WalkProfiler",
     "WildcardImport",
     "distribution",
     "distribution_version",
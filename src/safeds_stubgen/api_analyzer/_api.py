@@ -1,25 +1,33 @@
 from __future__ import annotations
 
 import json
-from collections import defaultdict
+import marshal
+import sys
+import zlib
 from dataclasses import dataclass, field
 from enum import Enum as PythonEnum
 from typing import TYPE_CHECKING, Any
 
+from safeds_stubgen.docstring_parsing import (
+    AttributeDocstring,
+    ClassDocstring,
+    FunctionDocstring,
+    ParameterDocstring,
+    ResultDocstring,
+)
+
+from ._reexport_index import ReexportIndex
+from ._types import AbstractType, TypeVarType
+
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from pathlib import Path
+    from typing import TextIO
 
-    from safeds_stubgen.docstring_parsing import (
-        AttributeDocstring,
-        ClassDocstring,
-        FunctionDocstring,
-        ParameterDocstring,
-        ResultDocstring,
-    )
-
-    from ._types import AbstractType, TypeVarType
+API_SCHEMA_VERSION = 2
 
-API_SCHEMA_VERSION = 1
+# The marshal format may change between Python versions, so binary files can only be read with the same version
+_BINARY_FILE_HEADER = b"SDSAPI" + bytes([API_SCHEMA_VERSION, sys.version_info.major, sys.version_info.minor])
 
 
 def ensure_file_exists(file: Path) -> None:
@@ -48,14 +56,30 @@ class API:
         self.enum_instances: dict[str, EnumInstance] = {}
         self.attributes_: dict[str, Attribute] = {}
         self.parameters_: dict[str, Parameter] = {}
-        self.reexport_map: dict[str, set[Module]] = defaultdict(set)
+        self.reexport_map: ReexportIndex = ReexportIndex()
+        # Class IDs grouped by every suffix of the class name, including the full name
+        self._class_ids_by_name_suffix: dict[str, list[str]] = {}
 
     def add_module(self, module: Module) -> None:
         self.modules[module.id] = module
 
     def add_class(self, class_: Class) -> None:
+        if class_.id not in self.classes:
+            class_name = class_.id.split("/")[-1]
+            for i in range(len(class_name)):
+                self._class_ids_by_name_suffix.setdefault(class_name[i:], []).append(class_.id)
+
         self.classes[class_.id] = class_
 
+    def get_class_ids_by_name_suffix(self, suffix: str) -> list[str]:
+        """Return the IDs of all classes whose name ends with the given suffix, in the order they were added.
+
+        The returned list is a copy, so changing it doesn't affect later lookups.
+        """
+        if not suffix:
+            return list(self.classes)
+        return list(self._class_ids_by_name_suffix.get(suffix, ()))
+
     def add_function(self, function: Function) -> None:
         self.functions[function.id] = function
 
@@ -75,10 +99,182 @@ class API:
     def add_parameter(self, parameter: Parameter) -> None:
         self.parameters_[parameter.id] = parameter
 
-    def to_json_file(self, path: Path) -> None:
+    def add_fragment(self, fragment: API) -> None:
+        """Add all modules, classes, functions etc. of another API object, e.g. the data of a single module."""
+        self.modules.update(fragment.modules)
+        for class_ in fragment.classes.values():
+            self.add_class(class_)
+        self.functions.update(fragment.functions)
+        self.results.update(fragment.results)
+        self.enums.update(fragment.enums)
+        self.enum_instances.update(fragment.enum_instances)
+        self.attributes_.update(fragment.attributes_)
+        self.parameters_.update(fragment.parameters_)
+
+    @staticmethod
+    def from_json_file(path: Path) -> API:
+        """
+        Read the API data from a JSON file that was created with `to_json_file`.
+
+        Parameters
+        ----------
+        path:
+            The path of the JSON file.
+
+        Returns
+        -------
+        api:
+            The API object.
+        """
+        with path.open(encoding="utf-8") as f:
+            return API.from_dict(json.load(f))
+
+    @staticmethod
+    def from_dict(d: dict[str, Any]) -> API:
+        """
+        Create an API object from the data of `to_dict`.
+
+        The entities reference each other by their IDs, so they are created first and linked afterward. The reexports
+        are not part of the data and are collected again from the __init__ modules.
+
+        Parameters
+        ----------
+        d:
+            The API data.
+
+        Returns
+        -------
+        api:
+            The API object.
+
+        Raises
+        ------
+        ValueError
+            If the data was created with another schema version.
+        """
+        if d.get("schemaVersion") != API_SCHEMA_VERSION:
+            msg = f"Unsupported API schema version {d.get('schemaVersion')}, expected {API_SCHEMA_VERSION}."
+            raise ValueError(msg)
+
+        api = API(distribution=d["distribution"], package=d["package"], version=d["version"])
+
+        for parameter_dict in d["parameters"]:
+            api.add_parameter(Parameter.from_dict(parameter_dict))
+        api.add_results([Result.from_dict(result_dict) for result_dict in d["results"]])
+        for attribute_dict in d["attributes"]:
+            api.add_attribute(Attribute.from_dict(attribute_dict))
+        for enum_instance_dict in d["enum_instances"]:
+            api.add_enum_instance(EnumInstance.from_dict(enum_instance_dict))
+        for module_dict in d["modules"]:
+            api.add_module(Module.from_dict(module_dict))
+        for function_dict in d["functions"]:
+            api.add_function(Function.from_dict(function_dict, api))
+        for enum_dict in d["enums"]:
+            api.add_enum(Enum.from_dict(enum_dict, api))
+        for class_dict in d["classes"]:
+            api.add_class(Class.from_dict(class_dict, api))
+
+        # Nested classes and the content of modules can only be linked after all classes were created
+        for class_dict in d["classes"]:
+            class_ = api.classes[class_dict["id"]]
+            for class_id in class_dict["classes"]:
+                class_.add_class(api.classes[class_id])
+
+        for module_dict in d["modules"]:
+            module = api.modules[module_dict["id"]]
+            for class_id in module_dict["classes"]:
+                module.add_class(api.classes[class_id])
+            for function_id in module_dict["functions"]:
+                module.add_function(api.functions[function_id])
+            for enum_id in module_dict["enums"]:
+                module.add_enum(api.enums[enum_id])
+
+            if module.name == "__init__":
+                for qualified_import in module.qualified_imports:
+                    api.reexport_map.add(qualified_import.qualified_name, module)
+                for wildcard_import in module.wildcard_imports:
+                    api.reexport_map.add(f"{wildcard_import.module_name}.*", module)
+
+        return api
+
+    @staticmethod
+    def from_binary_file(path: Path) -> API:
+        """
+        Read the API data from a binary file that was created with `to_binary_file`.
+
+        Parameters
+        ----------
+        path:
+            The path of the binary file.
+
+        Returns
+        -------
+        api:
+            The API object.
+
+        Raises
+        ------
+        ValueError
+            If the file was created with another schema version or Python version, or is no binary API file.
+        """
+        content = path.read_bytes()
+        if not content.startswith(_BINARY_FILE_HEADER):
+            msg = f"{path} is no binary API file of this schema version and Python version."
+            raise ValueError(msg)
+
+        return API.from_dict(marshal.loads(zlib.decompress(content[len(_BINARY_FILE_HEADER) :])))
+
+    def to_binary_file(self, path: Path) -> None:
+        """
+        Write the API data to a compact binary file, which can be read much faster than the JSON file.
+
+        The data of `to_dict` is serialized with `marshal` and compressed. All strings are interned beforehand, so
+        strings that occur repeatedly, like the IDs and qualified names, are stored once and referenced afterward. The
+        file can only be read with the same Python version.
+
+        Parameters
+        ----------
+        path:
+            The path of the binary file.
+        """
+        data = marshal.dumps(_intern_strings(self.to_dict()))
+        ensure_file_exists(path)
+        path.write_bytes(_BINARY_FILE_HEADER + zlib.compress(data, level=1))
+
+    def to_json_file(self, path: Path, compact: bool = False) -> None:
+        """
+        Write the API data to a JSON file.
+
+        The entities are converted and written one at a time, so the dict of the whole API is never created. The content
+        of the file is the same as the one of `json.dump(api.to_dict(), f, indent=2)`.
+
+        Parameters
+        ----------
+        path:
+            The path of the JSON file.
+        compact:
+            If True, the JSON data is written without indentation and whitespace.
+        """
         ensure_file_exists(path)
         with path.open("w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2)
+            _write_json_object(f, self._get_json_items(), compact=compact)
+
+    def _get_json_items(self) -> list[tuple[str, Any]]:
+        """Return the data of the API in the order of to_dict, with iterables for the lists of entities."""
+        return [
+            ("schemaVersion", API_SCHEMA_VERSION),
+            ("distribution", self.distribution),
+            ("package", self.package),
+            ("version", self.version),
+            ("modules", sorted(self.modules.values(), key=lambda it: it.id)),
+            ("classes", sorted(self.classes.values(), key=lambda it: it.id)),
+            ("functions", sorted(self.functions.values(), key=lambda it: it.id)),
+            ("results", sorted(self.results.values(), key=lambda it: it.id)),
+            ("enums", sorted(self.enums.values(), key=lambda it: it.id)),
+            ("enum_instances", sorted(self.enum_instances.values(), key=lambda it: it.id)),
+            ("attributes", sorted(self.attributes_.values(), key=lambda it: it.id)),
+            ("parameters", sorted(self.parameters_.values(), key=lambda it: it.id)),
+        ]
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -103,7 +299,65 @@ class API:
         }
 
 
+def _intern_strings(value: Any) -> Any:
+    """Return a copy of JSON-like data in which equal strings are the same object."""
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, list):
+        return [_intern_strings(item) for item in value]
+    if isinstance(value, dict):
+        return {sys.intern(key): _intern_strings(item) for key, item in value.items()}
+    return value
+
+
+def _write_json_object(f: TextIO, items: Iterable[tuple[str, Any]], compact: bool) -> None:
+    """Write a JSON object whose lists of entities are converted to dicts and written one entity at a time."""
+    item_separator, key_separator = (",", ":") if compact else (",", ": ")
+    indentation = None if compact else 2
+
+    f.write("{")
+    for i, (key, value) in enumerate(items):
+        if i > 0:
+            f.write(item_separator)
+        if not compact:
+            f.write("\n  ")
+        f.write(f"{json.dumps(key)}{key_separator}")
+
+        if not isinstance(value, list):
+            f.write(json.dumps(value))
+            continue
+
+        f.write("[")
+        for j, entity in enumerate(value):
+            if j > 0:
+                f.write(item_separator)
+            entity_json = json.dumps(entity.to_dict(), indent=indentation, separators=(item_separator, key_separator))
+            if compact:
+                f.write(entity_json)
+            else:
+                # The entities are nested in the object and the list, therefore we have to indent them twice
+                f.write("\n    " + entity_json.replace("\n", "\n    "))
+        if value and not compact:
+            f.write("\n  ")
+        f.write("]")
+
+    if not compact:
+        f.write("\n")
+    f.write("}")
+
+
 class Module:
+    __slots__ = (
+        "classes",
+        "docstring",
+        "enums",
+        "global_functions",
+        "id",
+        "name",
+        "qualified_imports",
+        "wildcard_imports",
+    )
+
     def __init__(
         self,
         id_: str,
@@ -121,6 +375,17 @@ class Module:
         self.global_functions: list[Function] = []
         self.enums: list[Enum] = []
 
+    @staticmethod
+    def from_dict(d: dict[str, Any]) -> Module:
+        """Create a module without its classes, functions and enums, which are added by `API.from_dict`."""
+        return Module(
+            id_=d["id"],
+            name=d["name"],
+            docstring=d["docstring"],
+            qualified_imports=[QualifiedImport.from_dict(import_) for import_ in d["qualified_imports"]],
+            wildcard_imports=[WildcardImport.from_dict(import_) for import_ in d["wildcard_imports"]],
+        )
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "id": self.id,
@@ -143,11 +408,15 @@ class Module:
         self.enums.append(enum)
 
 
-@dataclass
+@dataclass(slots=True)
 class QualifiedImport:
     qualified_name: str
     alias: str | None = None
 
+    @staticmethod
+    def from_dict(d: dict[str, Any]) -> QualifiedImport:
+        return QualifiedImport(qualified_name=d["qualified_name"], alias=d["alias"])
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "qualified_name": self.qualified_name,
@@ -155,15 +424,19 @@ class QualifiedImport:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class WildcardImport:
     module_name: str
 
+    @staticmethod
+    def from_dict(d: dict[str, Any]) -> WildcardImport:
+        return WildcardImport(module_name=d["module_name"])
+
     def to_dict(self) -> dict[str, Any]:
         return {"module_name": self.module_name}
 
 
-@dataclass
+@dataclass(slots=True)
 class Class:
     id: str
     name: str
@@ -179,6 +452,28 @@ class Class:
     classes: list[Class] = field(default_factory=list)
     type_parameters: list[TypeParameter] = field(default_factory=list)
 
+    @staticmethod
+    def from_dict(d: dict[str, Any], api: API) -> Class:
+        """Create a class without its nested classes, which are added by `API.from_dict`."""
+        constructor = None
+        if d["constructor"] is not None:
+            constructor = api.functions.get(d["constructor"]["id"], None) or Function.from_dict(d["constructor"], api)
+
+        return Class(
+            id=d["id"],
+            name=d["name"],
+            superclasses=d["superclasses"],
+            is_public=d["is_public"],
+            docstring=ClassDocstring.from_dict(d["docstring"]),
+            constructor=constructor,
+            constructor_fulldocstring=constructor.docstring.full_docstring if constructor is not None else "",
+            inherits_from_exception=d["inherits_from_exception"],
+            reexported_by=[api.modules[module_id] for module_id in d["reexported_by"]],
+            attributes=[api.attributes_[attribute_id] for attribute_id in d["attributes"]],
+            methods=[api.functions[method_id] for method_id in d["methods"]],
+            type_parameters=[TypeParameter.from_dict(type_parameter) for type_parameter in d["type_parameters"]],
+        )
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "id": self.id,
@@ -212,7 +507,7 @@ class Class:
         self.attributes.append(attribute)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Attribute:
     id: str
     name: str
@@ -221,6 +516,17 @@ class Attribute:
     type: AbstractType | None
     docstring: AttributeDocstring
 
+    @staticmethod
+    def from_dict(d: dict[str, Any]) -> Attribute:
+        return Attribute(
+            id=d["id"],
+            name=d["name"],
+            is_public=d["is_public"],
+            is_static=d["is_static"],
+            type=AbstractType.from_dict(d["type"]) if d["type"] is not None else None,
+            docstring=AttributeDocstring.from_dict(d["docstring"]),
+        )
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "id": self.id,
@@ -232,7 +538,7 @@ class Attribute:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Function:
     id: str
     name: str
@@ -247,6 +553,23 @@ class Function:
     reexported_by: list[Module] = field(default_factory=list)
     parameters: list[Parameter] = field(default_factory=list)
 
+    @staticmethod
+    def from_dict(d: dict[str, Any], api: API) -> Function:
+        return Function(
+            id=d["id"],
+            name=d["name"],
+            docstring=FunctionDocstring.from_dict(d["docstring"]),
+            is_public=d["is_public"],
+            is_static=d["is_static"],
+            is_class_method=d["is_class_method"],
+            is_property=d["is_property"],
+            result_docstrings=[ResultDocstring.from_dict(docstring) for docstring in d["result_docstrings"]],
+            type_var_types=[TypeVarType.from_dict(type_var_type) for type_var_type in d["type_var_types"]],
+            results=[api.results[result_id] for result_id in d["results"]],
+            reexported_by=[api.modules[module_id] for module_id in d["reexported_by"]],
+            parameters=[api.parameters_[parameter_id] for parameter_id in d["parameters"]],
+        )
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "id": self.id,
@@ -259,14 +582,16 @@ class Function:
             "results": [result.id for result in self.results],
             "reexported_by": [module.id for module in self.reexported_by],
             "parameters": [parameter.id for parameter in self.parameters],
+            "result_docstrings": [docstring.to_dict() for docstring in self.result_docstrings],
+            "type_var_types": [type_var_type.to_dict() for type_var_type in self.type_var_types],
         }
 
 
 class UnknownValue:
-    pass
+    __slots__ = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Parameter:
     id: str
     name: str
@@ -288,6 +613,18 @@ class Parameter:
             ParameterAssignment.NAMED_VARARG,
         )
 
+    @staticmethod
+    def from_dict(d: dict[str, Any]) -> Parameter:
+        return Parameter(
+            id=d["id"],
+            name=d["name"],
+            is_optional=d["is_optional"],
+            default_value=UnknownValue() if d["default_value"] == "UnknownValue" else d["default_value"],
+            assigned_by=ParameterAssignment[d["assigned_by"]],
+            docstring=ParameterDocstring.from_dict(d["docstring"]),
+            type=AbstractType.from_dict(d["type"]) if d["type"] is not None else None,
+        )
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "id": self.id,
@@ -318,12 +655,20 @@ class ParameterAssignment(PythonEnum):
     NAMED_VARARG = "NAMED_VARARG"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TypeParameter:
     name: str
     type: AbstractType | None
     variance: VarianceKind
 
+    @staticmethod
+    def from_dict(d: dict[str, Any]) -> TypeParameter:
+        return TypeParameter(
+            name=d["name"],
+            type=AbstractType.from_dict(d["type"]) if d["type"] is not None else None,
+            variance=VarianceKind[d["variance_type"]],
+        )
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "name": self.name,
@@ -338,12 +683,20 @@ class VarianceKind(PythonEnum):
     INVARIANT = "INVARIANT"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Result:
     id: str
     name: str
     type: AbstractType | None
 
+    @staticmethod
+    def from_dict(d: dict[str, Any]) -> Result:
+        return Result(
+            id=d["id"],
+            name=d["name"],
+            type=AbstractType.from_dict(d["type"]) if d["type"] is not None else None,
+        )
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "id": self.id,
@@ -352,13 +705,22 @@ class Result:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Enum:
     id: str
     name: str
     docstring: ClassDocstring
     instances: list[EnumInstance] = field(default_factory=list)
 
+    @staticmethod
+    def from_dict(d: dict[str, Any], api: API) -> Enum:
+        return Enum(
+            id=d["id"],
+            name=d["name"],
+            docstring=ClassDocstring.from_dict(d["docstring"]),
+            instances=[api.enum_instances[instance_id] for instance_id in d["instances"]],
+        )
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "id": self.id,
@@ -371,11 +733,15 @@ class Enum:
         self.instances.append(enum_instance)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EnumInstance:
     id: str
     name: str
 
+    @staticmethod
+    def from_dict(d: dict[str, Any]) -> EnumInstance:
+        return EnumInstance(id=d["id"], name=d["name"])
+
     def to_dict(self) -> dict[str, str]:
         return {
             "id": self.id,
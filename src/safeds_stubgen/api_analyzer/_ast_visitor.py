@@ -59,10 +59,12 @@ class MyPyAstVisitor:
         aliases: dict[str, set[str]],
         type_source_preference: TypeSourcePreference,
         type_source_warning: TypeSourceWarning,
+        lazy_imports: bool = False,
     ) -> None:
         self.docstring_parser: AbstractDocstringParser = docstring_parser
         self.type_source_preference = type_source_preference
         self.type_source_warning = type_source_warning
+        self.lazy_imports = lazy_imports
         self.api: API = api
         self.__declaration_stack: list[Module | Class | Function | Enum | list[Attribute | EnumInstance]] = []
         self.aliases = aliases
@@ -216,8 +218,15 @@ class MyPyAstVisitor:
 
                 superclass_name = superclass_qname.split(".")[-1]
 
-                # Check if the superclass name is an alias and find the real name
-                if superclass_name in self.aliases:
+                # Check if the superclass name is an alias and find the real name. With lazy imports, classes imported
+                #  from modules that Mypy didn't follow are variables of this module, so we search for them in the
+                #  imports.
+                if superclass_name in self.aliases or (
+                    self.lazy_imports
+                    and isinstance(superclass, mp_nodes.RefExpr)
+                    and isinstance(superclass.node, mp_nodes.Var)
+                    and superclass.node.is_suppressed_import
+                ):
                     _, superclass_alias_qname = self._find_alias(superclass_name)
                     superclass_qname = superclass_alias_qname if superclass_alias_qname else superclass_qname
 
@@ -266,6 +275,14 @@ class MyPyAstVisitor:
         name = node.name
         function_id = self._create_id_from_stack(name)
 
+        # Functions with the same name in the same scope, like the getter and setter of a property, need distinct IDs,
+        #  otherwise only the last one can be restored from the API data
+        if function_id in self.api.functions:
+            function_number = 2
+            while f"{function_id}@{function_number}" in self.api.functions:
+                function_number += 1
+            function_id = f"{function_id}@{function_number}"
+
         is_public = self._is_public(name, node.fullname)
         is_static = node.is_static
 
@@ -1118,11 +1135,11 @@ class MyPyAstVisitor:
         """Add all reexports of an __init__ module to the reexport_map."""
         for qualified_import in module.qualified_imports:
             name = qualified_import.qualified_name
-            self.api.reexport_map[name].add(module)
+            self.api.reexport_map.add(name, module)
 
         for wildcard_import in module.wildcard_imports:
             name = wildcard_import.module_name
-            self.api.reexport_map[f"{name}.*"].add(module)
+            self.api.reexport_map.add(f"{name}.*", module)
 
     # #### Misc. utilities
     def mypy_type_to_abstract_type(
@@ -1148,7 +1165,7 @@ class MyPyAstVisitor:
                         ]
 
                         if literals:
-                            all_literals = []
+                            all_literals: list[str | int | float | bool] = []
                             for literal_type in literals:
                                 if isinstance(literal_type, sds_types.LiteralType):
                                     all_literals += literal_type.literals
@@ -1431,13 +1448,15 @@ class MyPyAstVisitor:
         module_name = getattr(self.mypy_file, "name", "")
         package_id = "/".join(module_qname.split(".")[:-1])
 
-        for reexported_key in self.api.reexport_map:
-            module_is_reexported = reexported_key in {
-                module_name,
-                module_qname,
-                f"{module_name}.*",
-                f"{module_qname}.*",
-            }
+        # Only the reexports of the name itself and of its module are relevant
+        module_keys = {module_name, module_qname, f"{module_name}.*", f"{module_qname}.*"}
+        reexported_keys = self.api.reexport_map.names_ending_with(name)
+        reexported_keys += tuple(
+            key for key in module_keys if key in self.api.reexport_map and key not in reexported_keys
+        )
+
+        for reexported_key in reexported_keys:
+            module_is_reexported = reexported_key in module_keys
 
             # Check if the function/class/module is reexported
             if reexported_key.endswith(name) or module_is_reexported:
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from mypy.nodes import AssignmentStmt, ClassDef, Decorator, FuncDef, MypyFile, OverloadedFuncDef
 
 from ._mypy_helpers import get_classdef_definitions, get_funcdef_definitions, get_mypyfile_definitions
 
+if TYPE_CHECKING:
+    from ._walk_profiler import WalkProfiler
+
 _EnterAndLeaveFunctions = tuple[
     Callable[[MypyFile | ClassDef | FuncDef | AssignmentStmt], None] | None,
     Callable[[MypyFile | ClassDef | FuncDef | AssignmentStmt], None] | None,
@@ -20,10 +23,13 @@ class ASTWalker:
 
     * enter_<class_name> on entering a node, where class name is the class of the node in lower case.
     * leave_<class_name> on leaving a node, where class name is the class of the node in lower case.
+
+    If a profiler is given, the time spent in these methods is recorded for each module and class.
     """
 
-    def __init__(self, handler: Any) -> None:
+    def __init__(self, handler: Any, profiler: WalkProfiler | None = None) -> None:
         self._handler = handler
+        self._profiler = profiler
         self._cache: dict[str, _EnterAndLeaveFunctions] = {}
 
     def walk(self, tree: MypyFile) -> None:
@@ -41,7 +47,10 @@ class ASTWalker:
             raise AssertionError("Node visited twice")
         visited_nodes.add(node)
 
-        self.__enter(node)
+        if self._profiler is None:
+            self.__enter(node)
+        else:
+            leave_profiled = self._profiler.walk_node(node, *self.__get_callbacks(node))
 
         # Search nodes for more child nodes. Skip other not specified types, since we either get them through the
         # ast_visitor, some other way or don't need to parse them at all
@@ -77,7 +86,11 @@ class ASTWalker:
                         self.__walk(child_node_impl, visited_nodes)
             else:
                 self.__walk(child_node, visited_nodes)
-        self.__leave(node)
+
+        if self._profiler is None:
+            self.__leave(node)
+        else:
+            leave_profiled()
 
     def __enter(self, node: MypyFile | ClassDef | FuncDef | AssignmentStmt) -> None:
         method = self.__get_callbacks(node)[0]
@@ -1,24 +1,36 @@
 from __future__ import annotations
 
 import logging
+import os
+import tempfile
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import mypy.build as mypy_build
 import mypy.main as mypy_main
 from mypy import nodes as mypy_nodes
 from mypy import types as mypy_types
+from mypy.modulefinder import get_search_dirs
+from mypy.server.subexpr import get_subexpressions
 
+from safeds_stubgen._profiling import profile_phase
 from safeds_stubgen.api_analyzer._type_source_enums import TypeSourcePreference, TypeSourceWarning
-from safeds_stubgen.docstring_parsing import DocstringStyle, create_docstring_parser
+from safeds_stubgen.docstring_parsing import DocstringParser, DocstringStyle, create_docstring_parser
 
 from ._api import API
 from ._ast_visitor import MyPyAstVisitor
 from ._ast_walker import ASTWalker
+from ._incremental import IncrementalState, hash_file
 from ._package_metadata import distribution, distribution_version
+from ._walk_profiler import COUNTED_DOCSTRING_PARSER_METHODS, COUNTED_VISITOR_METHODS
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from mypy import modulefinder as mypy_modulefinder
+    from mypy import options as mypy_options
+
+    from ._walk_profiler import WalkProfiler
 
 
 def get_api(
@@ -27,32 +39,43 @@ def get_api(
     is_test_run: bool = False,
     type_source_preference: TypeSourcePreference = TypeSourcePreference.CODE,
     type_source_warning: TypeSourceWarning = TypeSourceWarning.WARN,
+    cache_dir: Path | None = None,
+    incremental_state_file: Path | None = None,
+    incremental_state: IncrementalState | None = None,
+    workers: int = 1,
+    low_memory: bool = False,
+    lazy_imports: bool = False,
+    walk_profiler: WalkProfiler | None = None,
 ) -> API:
-    """Parse a given code package with Mypy, walk the Mypy AST and create an API object."""
+    """Parse a given code package with Mypy, walk the Mypy AST and create an API object.
+
+    If a cache directory is given, Mypy stores its serialized state there and reuses it in later runs, so that the
+    dependencies of the package (e.g. the standard library or third party packages) don't have to be analyzed again.
+
+    If an incremental state file is given, the hashes of all files and the API data of each module are stored there.
+    In later runs, only the modules that changed since the last run and the modules that depend on them are walked
+    again. Long-running processes (e.g. the watch mode of the CLI) can instead pass an incremental state, which is kept
+    in memory and updated in place.
+
+    With more than one worker, all docstrings of the package are parsed in worker processes before the AST is walked.
+
+    In low memory mode, Mypy only keeps the ASTs and expression types of the modules of the package. The dependencies
+    are analyzed once without them and then loaded from the Mypy cache, which takes longer but needs much less memory
+    for packages with large dependencies. If no cache directory is given, a temporary one is used.
+
+    With lazy imports, Mypy doesn't analyze the Python source files of third party packages, only their stub files.
+    Types of the skipped packages are still added with their qualified names.
+
+    If a walk profiler is given, it records the cost of walking each module and class of the package.
+    """
     init_roots = _get_nearest_init_dirs(root)
     if len(init_roots) == 1:
         root = init_roots[0]
 
     logging.info("Started gathering the raw package data with Mypy.")
 
-    walkable_files = []
-    package_paths = []
-    for file_path in root.glob(pattern="./**/*.py"):
-        # Check if the current path is a test directory
-        if not is_test_run and ("test" in file_path.parts or "tests" in file_path.parts or "docs" in file_path.parts):
-            log_msg = f"Skipping test file in {file_path}"
-            logging.info(log_msg)
-            continue
-
-        # Check if the current file is an init file
-        if file_path.parts[-1] == "__init__.py":
-            # if a directory contains an __init__.py file it's a package
-            package_paths.append(
-                str(file_path.parent),
-            )
-            continue
-
-        walkable_files.append(str(file_path))
+    with profile_phase("file_discovery"):
+        walkable_files, package_paths, package_files = _find_package_files(root=root, is_test_run=is_test_run)
 
     if not walkable_files:
         raise ValueError("No files found to analyse.")
@@ -65,26 +88,126 @@ def get_api(
     dist_version = distribution_version(dist=dist) or ""
 
     # Get mypy ast and aliases
-    build_result = _get_mypy_build(files=walkable_files)
-    mypy_asts = _get_mypy_asts(build_result=build_result, files=walkable_files, package_paths=package_paths)
-    aliases = _get_aliases(result_types=build_result.types, package_name=package_name)
+    with profile_phase("mypy_build"):
+        build_result = _get_mypy_build(
+            files=walkable_files,
+            package_root=root,
+            cache_dir=cache_dir,
+            low_memory=low_memory,
+            lazy_imports=lazy_imports,
+        )
+        mypy_asts = _get_mypy_asts(build_result=build_result, files=walkable_files, package_paths=package_paths)
+    with profile_phase("aliases"):
+        aliases = _get_aliases(mypy_asts=mypy_asts, result_types=build_result.types, package_name=package_name)
+
+    # Load the data of the last run for incremental runs
+    keep_state_in_memory = incremental_state is not None
+    file_hashes: dict[str, str] = {}
+    reusable_fragments: dict[str, API] = {}
+    if incremental_state is not None or incremental_state_file is not None:
+        state_options = {
+            "package": package_name,
+            "version": dist_version,
+            "docstring_style": docstring_style.name,
+            "is_test_run": is_test_run,
+            "type_source_preference": type_source_preference.name,
+            "type_source_warning": type_source_warning.name,
+            "lazy_imports": lazy_imports,
+        }
+        if incremental_state is None and incremental_state_file is not None:
+            incremental_state = IncrementalState.load(incremental_state_file, options=state_options)
+        elif incremental_state is not None and incremental_state.options != state_options:
+            incremental_state.clear(options=state_options)
+
+    if incremental_state is not None:
+        file_hashes = {file: hash_file(file) for file in walkable_files + package_files}
+        reusable_fragments = incremental_state.get_reusable_fragments(
+            file_hashes=file_hashes,
+            package_files=package_files,
+            build_result=build_result,
+            aliases=aliases,
+        )
 
     # Setup api walker
     api = API(distribution=dist, package=package_name, version=dist_version)
-    docstring_parser = create_docstring_parser(style=docstring_style, package_path=root)
+    docstring_parser = create_docstring_parser(style=docstring_style, package_path=root, workers=workers)
     callable_visitor = MyPyAstVisitor(
         docstring_parser=docstring_parser,
         api=api,
         aliases=aliases,
         type_source_preference=type_source_preference,
         type_source_warning=type_source_warning,
+        lazy_imports=lazy_imports,
     )
-    walker = ASTWalker(handler=callable_visitor)
+    if walk_profiler is not None:
+        walk_profiler.instrument(callable_visitor, COUNTED_VISITOR_METHODS)
+        walk_profiler.instrument(docstring_parser, COUNTED_DOCSTRING_PARSER_METHODS)
+    walker = ASTWalker(handler=callable_visitor, profiler=walk_profiler)
+
+    # Each module is walked into its own API fragment, so that the data of unchanged modules can be reused later
+    fragments: dict[str, API] = {}
+    with profile_phase("ast_walk"):
+        for tree in mypy_asts:
+            fragment = reusable_fragments.get(tree.path, None)
+
+            if fragment is None:
+                fragment = API(distribution=dist, package=package_name, version=dist_version)
+                fragment.reexport_map = api.reexport_map
+                callable_visitor.api = fragment
+                walker.walk(tree=tree)
+            else:
+                log_msg = f"Reusing the API data of the unchanged module {tree.fullname}"
+                logging.info(log_msg)
 
-    for tree in mypy_asts:
-        walker.walk(tree=tree)
+            api.add_fragment(fragment)
+            fragments[tree.path] = fragment
+
+    callable_visitor.api = api
+
+    if isinstance(docstring_parser, DocstringParser):
+        log_msg = f"Docstring parser cache: {docstring_parser.cache_stats}"
+        logging.info(log_msg)
+
+    if incremental_state is not None:
+        incremental_state.update(
+            file_hashes=file_hashes,
+            fragments=fragments,
+            aliases=aliases,
+            copy_fragments=keep_state_in_memory,
+        )
+        if incremental_state_file is not None:
+            incremental_state.save(incremental_state_file)
+
+    return api
+
+
+def _find_package_files(root: Path, is_test_run: bool) -> tuple[list[str], list[str], list[str]]:
+    """Find the files of a package.
+
+    Returns the Python files that are walked, the directories of the packages and the __init__.py files of the packages.
+    """
+    walkable_files = []
+    package_paths = []
+    package_files = []
+    for file_path in root.glob(pattern="./**/*.py"):
+        # Check if the current path is a test directory
+        if not is_test_run and ("test" in file_path.parts or "tests" in file_path.parts or "docs" in file_path.parts):
+            log_msg = f"Skipping test file in {file_path}"
+            logging.info(log_msg)
+            continue
+
+        # Check if the current file is an init file
+        if file_path.parts[-1] == "__init__.py":
+            # if a directory contains an __init__.py file it's a package
+            package_paths.append(
+                str(file_path.parent),
+            )
+            package_files.append(str(file_path))
+            continue
+
+        walkable_files.append(str(file_path))
 
-    return callable_visitor.api
+    return walkable_files, package_paths, package_files
 
 
 def _get_nearest_init_dirs(root: Path) -> list[Path]:
@@ -111,20 +234,155 @@ def _get_nearest_init_dirs(root: Path) -> list[Path]:
     return shortest_init_paths
 
 
-def _get_mypy_build(files: list[str]) -> mypy_build.BuildResult:
-    """Build a mypy checker and return the build result."""
+def _get_mypy_build(
+    files: list[str],
+    package_root: Path | None = None,
+    cache_dir: Path | None = None,
+    low_memory: bool = False,
+    lazy_imports: bool = False,
+) -> mypy_build.BuildResult:
+    """Build a mypy checker and return the build result.
+
+    If no cache directory is given, everything is analyzed from scratch. Otherwise, Mypy writes its serialized state to
+    the cache directory and loads all unchanged dependencies from there in later runs.
+
+    In low memory mode, the ASTs and expression types are only kept for the modules of the package. Mypy can't restrict
+    these options to some modules, therefore all modules are first analyzed without them in a separate process and
+    written to the cache. The second build then only analyzes the package modules and loads their dependencies from the
+    cache.
+
+    With lazy imports, Mypy doesn't follow imports into the Python source files of third party packages, see
+    `_skip_third_party_imports`.
+    """
+    if low_memory and package_root is not None:
+        if cache_dir is None:
+            with tempfile.TemporaryDirectory() as tmp_cache_dir:
+                return _get_mypy_build(
+                    files=files,
+                    package_root=package_root,
+                    cache_dir=Path(tmp_cache_dir),
+                    low_memory=True,
+                    lazy_imports=lazy_imports,
+                )
+
+        # The memory of the first build is released when its process ends
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            executor.submit(_fill_mypy_cache, files, cache_dir, package_root, lazy_imports).result()
+
     mypyfiles, opt = mypy_main.process_options(files)
 
+    if lazy_imports and package_root is not None:
+        _skip_third_party_imports(mypyfiles=mypyfiles, options=opt, package_root=package_root)
+
     # Disable the memory optimization of freeing ASTs when possible
     opt.preserve_asts = True
-    # Only check parts of the code that have changed since the last check
-    opt.fine_grained_incremental = True
     # Export inferred types for all expressions
     opt.export_types = True
 
+    if cache_dir is None:
+        # Only check parts of the code that have changed since the last check
+        opt.fine_grained_incremental = True
+    else:
+        # Read and write the serialized state of all modules from and to the cache directory
+        opt.incremental = True
+        opt.fine_grained_incremental = False
+        opt.cache_dir = str(cache_dir)
+
+        if package_root is not None:
+            _invalidate_package_cache(mypyfiles=mypyfiles, options=opt, package_root=package_root)
+
     return mypy_build.build(mypyfiles, options=opt)
 
 
+def _fill_mypy_cache(files: list[str], cache_dir: Path, package_root: Path, lazy_imports: bool) -> None:
+    """Analyze all modules without keeping their ASTs and expression types and write them to the Mypy cache."""
+    mypyfiles, opt = mypy_main.process_options(files)
+
+    # The options that affect the cache have to be the same as for the second build
+    if lazy_imports:
+        _skip_third_party_imports(mypyfiles=mypyfiles, options=opt, package_root=package_root)
+
+    opt.incremental = True
+    opt.fine_grained_incremental = False
+    opt.cache_dir = str(cache_dir)
+
+    mypy_build.build(mypyfiles, options=opt)
+
+
+def _invalidate_package_cache(
+    mypyfiles: list[mypy_modulefinder.BuildSource],
+    options: mypy_options.Options,
+    package_root: Path,
+) -> None:
+    """Remove the cache metadata of the modules of the analyzed package.
+
+    Modules that are loaded from the Mypy cache have neither a full AST nor inferred expression types, but we need both
+    for the modules of the package we analyze. Without their metadata entries Mypy considers these modules as stale and
+    analyzes them again, while the dependencies of the package are still taken from the cache.
+    """
+    package_module_name = _get_package_module_name(mypyfiles=mypyfiles, package_root=package_root)
+    if not package_module_name:  # pragma: no cover
+        return
+
+    package_cache_prefix = str(Path(*package_module_name.split("."))) + os.sep
+    metastore = mypy_build.create_metastore(options)
+    for cache_entry in list(metastore.list_all()):
+        if cache_entry.startswith(package_cache_prefix) and cache_entry.endswith(".meta.json"):
+            metastore.remove(cache_entry)
+    metastore.commit()
+
+
+def _skip_third_party_imports(
+    mypyfiles: list[mypy_modulefinder.BuildSource],
+    options: mypy_options.Options,
+    package_root: Path,
+) -> None:
+    """Let Mypy skip the imports of the Python source files of third party packages.
+
+    Third party packages are the packages installed in the site-packages directories, except the analyzed package
+    itself. Stub files, e.g. of packages with bundled stubs or separate stub packages, are still followed. The names
+    imported from the skipped modules are resolved through the imports of the package, so they keep their qualified
+    names. Types that Mypy would infer from the skipped modules, e.g. of default values, are unknown though.
+    """
+    package_module_name = _get_package_module_name(mypyfiles=mypyfiles, package_root=package_root)
+    third_party_module_names = _get_third_party_module_names(python_executable=options.python_executable)
+    third_party_module_names.discard(package_module_name.split(".")[0])
+
+    options.follow_imports_for_stubs = False
+    for module_name in sorted(third_party_module_names):
+        options.per_module_options[module_name] = {"follow_imports": "skip"}
+        options.per_module_options[f"{module_name}.*"] = {"follow_imports": "skip"}
+
+
+def _get_third_party_module_names(python_executable: str | None) -> set[str]:
+    """Get the names of the top-level modules and packages in the site-packages directories."""
+    _, site_packages_dirs = get_search_dirs(python_executable)
+
+    module_names = set()
+    for site_packages_dir in site_packages_dirs:
+        site_packages_path = Path(site_packages_dir)
+        if not site_packages_path.is_dir():  # pragma: no cover
+            continue
+
+        # Metadata and stub package directories like "package-1.0.dist-info" or "package-stubs" are no identifiers
+        for entry in site_packages_path.iterdir():
+            if entry.is_dir() and entry.name.isidentifier() and entry.name != "__pycache__":
+                module_names.add(entry.name)
+            elif entry.suffix == ".py" and entry.stem.isidentifier():
+                module_names.add(entry.stem)
+
+    return module_names
+
+
+def _get_package_module_name(mypyfiles: list[mypy_modulefinder.BuildSource], package_root: Path) -> str:
+    """Get the module name of the package root, e.g. "path.to.package" for the module "path.to.package.module"."""
+    for mypyfile in mypyfiles:
+        if mypyfile.path is not None and Path(mypyfile.path).resolve().is_relative_to(package_root):
+            relative_parts = Path(mypyfile.path).resolve().relative_to(package_root).with_suffix("").parts
+            return ".".join(mypyfile.module.split(".")[: -len(relative_parts)])
+    return ""
+
+
 def _get_mypy_asts(
     build_result: mypy_build.BuildResult,
     files: list[str],
@@ -153,69 +411,86 @@ def _get_mypy_asts(
     return package_ast + module_ast
 
 
-def _get_aliases(result_types: dict, package_name: str) -> dict[str, set[str]]:
+def _get_aliases(mypy_asts: list[mypy_nodes.MypyFile], result_types: dict, package_name: str) -> dict[str, set[str]]:
     """Get the needed aliases from Mypy.
 
-    Mypy has a long list of all aliases it has found. We have to parse the list and get only the aliases we need for our
-    package we analyze.
+    Mypy stores the types of all expressions of all modules, including the standard library and third party packages.
+    Instead of searching this whole map, we only collect the expressions of the modules of the package we analyze and
+    look up their types.
     """
     aliases: dict[str, set[str]] = defaultdict(set)
-    for key, type_value in result_types.items():
-        if isinstance(key, mypy_nodes.NameExpr | mypy_nodes.MemberExpr | mypy_nodes.TypeVarExpr):
-            in_package = False
-            name = ""
-
-            if isinstance(key, mypy_nodes.NameExpr):
-                if hasattr(type_value, "type") and getattr(type_value, "type", None) is not None:
-                    name = type_value.type.name
-                    in_package = package_name in type_value.type.fullname
-                elif hasattr(key, "name"):
-                    name = key.name
-                    fullname = ""
-
-                    if (
-                        hasattr(key, "node")
-                        and isinstance(key.node, mypy_nodes.TypeAlias)
-                        and isinstance(key.node.target, mypy_types.Instance)
-                    ):
-                        fullname = key.node.target.type.fullname
-                    elif isinstance(type_value, mypy_types.CallableType):
-                        bound_args = type_value.bound_args
-                        if bound_args and hasattr(bound_args[0], "type"):
-                            fullname = bound_args[0].type.fullname  # type: ignore[union-attr]
-                    elif hasattr(key, "node") and isinstance(key.node, mypy_nodes.Var):
-                        fullname = key.node.fullname
-
-                    if not fullname:
-                        continue
-
-                    in_package = package_name in fullname
-            else:
-                in_package = package_name in key.fullname
-                if in_package:
-                    name = key.name
-                else:
-                    continue
-
-            # Try to find the original qname (fullname) of the alias
-            if in_package:
-                if (
-                    isinstance(type_value, mypy_types.CallableType)
-                    and type_value.bound_args
-                    and hasattr(type_value.bound_args[0], "type")
-                ):
-                    fullname = type_value.bound_args[0].type.fullname  # type: ignore[union-attr]
-                elif isinstance(type_value, mypy_types.Instance):
-                    fullname = type_value.type.fullname
-                elif isinstance(key, mypy_nodes.TypeVarExpr):
-                    fullname = key.fullname
-                elif isinstance(key, mypy_nodes.NameExpr) and isinstance(key.node, mypy_nodes.Var):
-                    fullname = key.node.fullname
-                else:  # pragma: no cover
-                    msg = f"Received unexpected type while searching for aliases. Skipping for '{name}'."
-                    logging.info(msg)
-                    continue
-
-                aliases[name].add(fullname)
+    for tree in mypy_asts:
+        for key in get_subexpressions(tree):
+            if not isinstance(key, mypy_nodes.NameExpr | mypy_nodes.MemberExpr | mypy_nodes.TypeVarExpr):
+                continue
+
+            type_value = result_types.get(key, None)
+            if type_value is not None:
+                _add_alias(aliases=aliases, key=key, type_value=type_value, package_name=package_name)
 
     return aliases
+
+
+def _add_alias(
+    aliases: dict[str, set[str]],
+    key: mypy_nodes.NameExpr | mypy_nodes.MemberExpr | mypy_nodes.TypeVarExpr,
+    type_value: mypy_types.Type,
+    package_name: str,
+) -> None:
+    """Add the alias of an expression to the aliases, if it's an alias of the package we analyze."""
+    in_package = False
+    name = ""
+
+    if isinstance(key, mypy_nodes.NameExpr):
+        if hasattr(type_value, "type") and getattr(type_value, "type", None) is not None:
+            name = type_value.type.name
+            in_package = package_name in type_value.type.fullname
+        elif hasattr(key, "name"):
+            name = key.name
+            fullname = ""
+
+            if (
+                hasattr(key, "node")
+                and isinstance(key.node, mypy_nodes.TypeAlias)
+                and isinstance(key.node.target, mypy_types.Instance)
+            ):
+                fullname = key.node.target.type.fullname
+            elif isinstance(type_value, mypy_types.CallableType):
+                bound_args = type_value.bound_args
+                if bound_args and hasattr(bound_args[0], "type"):
+                    fullname = bound_args[0].type.fullname  # type: ignore[union-attr]
+            elif hasattr(key, "node") and isinstance(key.node, mypy_nodes.Var):
+                fullname = key.node.fullname
+
+            if not fullname:
+                return
+
+            in_package = package_name in fullname
+    else:
+        in_package = package_name in key.fullname
+        if in_package:
+            name = key.name
+        else:
+            return
+
+    # Try to find the original qname (fullname) of the alias
+    if in_package:
+        if (
+            isinstance(type_value, mypy_types.CallableType)
+            and type_value.bound_args
+            and hasattr(type_value.bound_args[0], "type")
+        ):
+            fullname = type_value.bound_args[0].type.fullname  # type: ignore[union-attr]
+        elif isinstance(type_value, mypy_types.Instance):
+            fullname = type_value.type.fullname
+        elif isinstance(key, mypy_nodes.TypeVarExpr):
+            fullname = key.fullname
+        elif isinstance(key, mypy_nodes.NameExpr) and isinstance(key.node, mypy_nodes.Var):
+            fullname = key.node.fullname
+        else:  # pragma: no cover
+            msg = f"Received unexpected type while searching for aliases. Skipping for '{name}'."
+            logging.info(msg)
+            return
+
+        aliases[name].add(fullname)
+
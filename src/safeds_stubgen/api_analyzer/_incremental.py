@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import logging
+import pickle
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import mypy.build as mypy_build
+
+    from ._api import API
+
+INCREMENTAL_STATE_VERSION = 2
+
+
+def hash_file(path: str) -> str:
+    """Return the SHA-256 hash of the content of a file."""
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+@dataclass
+class ModuleState:
+    source_hash: str
+    # Files that are not part of the Mypy build are never walked and therefore have no module ID and fragment
+    module_id: str = ""
+    fragment: API | None = None
+
+
+class IncrementalState:
+    """The data of a previous run, which is needed to only re-analyze the changed modules of a package.
+
+    For each Python file the state holds the hash of its content and the API fragment, i.e. the modules, classes,
+    functions etc. that were created while walking the file.
+    """
+
+    def __init__(self, options: dict[str, Any]) -> None:
+        self.version: int = INCREMENTAL_STATE_VERSION
+        self.options: dict[str, Any] = options
+        self.aliases: dict[str, set[str]] = {}
+        self.modules: dict[str, ModuleState] = {}
+
+    def clear(self, options: dict[str, Any]) -> None:
+        """Remove the data of all previous runs and set new options."""
+        self.options = options
+        self.aliases = {}
+        self.modules = {}
+
+    @staticmethod
+    def load(path: Path, options: dict[str, Any]) -> IncrementalState:
+        """Load the state of a previous run.
+
+        If there is no state or if it was created with other options, an empty state is returned.
+        """
+        if not path.is_file():
+            return IncrementalState(options)
+
+        try:
+            with path.open("rb") as f:
+                state = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, TypeError):
+            logging.info("Could not load the incremental state, analyzing all modules.")
+            return IncrementalState(options)
+
+        if (
+            not isinstance(state, IncrementalState)
+            or getattr(state, "version", None) != INCREMENTAL_STATE_VERSION
+            or state.options != options
+        ):
+            logging.info("The incremental state was created with other options, analyzing all modules.")
+            return IncrementalState(options)
+
+        return state
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("wb") as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def get_reusable_fragments(
+        self,
+        file_hashes: dict[str, str],
+        package_files: list[str],
+        build_result: mypy_build.BuildResult,
+        aliases: dict[str, set[str]],
+    ) -> dict[str, API]:
+        """Return the API fragments of all files that don't have to be walked again.
+
+        A file has to be walked again if it changed or if it (transitively) imports a changed file. Since the reexports
+        of __init__.py files and the aliases affect all modules of a package, every file has to be walked again if one
+        of those changed. The __init__.py files themselves are always walked again, since we need their reexports.
+        """
+        if dict(aliases) != self.aliases:
+            return {}
+
+        changed_files = {
+            file
+            for file, source_hash in file_hashes.items()
+            if file not in self.modules or self.modules[file].source_hash != source_hash
+        }
+        removed_files = set(self.modules) - set(file_hashes)
+        if any(file in package_files for file in changed_files | removed_files):
+            return {}
+
+        # Collect the module IDs of the changed files and search for all modules that depend on them
+        path_to_module_id = {
+            state.xpath: module_id for module_id, state in build_result.graph.items() if state.xpath in file_hashes
+        }
+        dirty_modules = {path_to_module_id[file] for file in changed_files if file in path_to_module_id}
+        dirty_modules |= {self.modules[file].module_id for file in removed_files if self.modules[file].module_id}
+
+        dependents: dict[str, set[str]] = defaultdict(set)
+        for module_id in path_to_module_id.values():
+            state = build_result.graph[module_id]
+            for dependency in state.dependencies + state.suppressed:
+                dependents[dependency].add(module_id)
+
+        modules_to_check = list(dirty_modules)
+        while modules_to_check:
+            module_id = modules_to_check.pop()
+            for dependent in dependents[module_id]:
+                if dependent not in dirty_modules:
+                    dirty_modules.add(dependent)
+                    modules_to_check.append(dependent)
+
+        reusable_fragments = {}
+        for file, module_id in path_to_module_id.items():
+            if file in package_files or module_id in dirty_modules:
+                continue
+
+            fragment = self.modules[file].fragment if file in self.modules else None
+            if fragment is not None:
+                reusable_fragments[file] = fragment
+
+        return reusable_fragments
+
+    def update(
+        self,
+        file_hashes: dict[str, str],
+        fragments: dict[str, API],
+        aliases: dict[str, set[str]],
+        copy_fragments: bool = False,
+    ) -> None:
+        """Replace the data of the state with the data of the current run.
+
+        The stubs generator changes the names of reexported classes and functions, therefore a state that is kept in
+        memory has to store a copy of the fragments. All fragments are copied at once to keep the references between
+        them.
+        """
+        if copy_fragments:
+            fragments = copy.deepcopy(fragments)
+
+        self.aliases = dict(aliases)
+        self.modules = {}
+        for file, source_hash in file_hashes.items():
+            fragment = fragments.get(file, None)
+            if fragment is None:
+                self.modules[file] = ModuleState(source_hash=source_hash)
+            else:
+                self.modules[file] = ModuleState(
+                    source_hash=source_hash,
+                    module_id=next(iter(fragment.modules), "").replace("/", "."),
+                    fragment=fragment,
+                )
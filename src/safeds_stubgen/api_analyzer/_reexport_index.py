@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from ._api import Module
+
+
+class ReexportIndex:
+    """All reexports of the __init__ modules of a package.
+
+    Maps the reexported names to the __init__ modules reexporting them. Qualified imports are stored with their
+    qualified name (e.g. "package.module.Class") and wildcard imports with the name of the module and a trailing ".*"
+    (e.g. "package.module.*").
+
+    Besides the direct lookup of a reexported name, the index holds a suffix table with all reexported names grouped by
+    every suffix of their last name part. This way all reexports ending with a given name can be found without scanning
+    every reexport.
+    """
+
+    def __init__(self) -> None:
+        self._reexports: dict[str, set[Module]] = {}
+        self._names_by_suffix: dict[str, list[str]] = {}
+
+    def add(self, name: str, module: Module) -> None:
+        """Add a reexport of a name by an __init__ module."""
+        if name not in self._reexports:
+            self._reexports[name] = set()
+
+            last_name_part = name.rsplit(".", maxsplit=1)[-1]
+            for i in range(len(last_name_part)):
+                self._names_by_suffix.setdefault(last_name_part[i:], []).append(name)
+
+        self._reexports[name].add(module)
+
+    def names_ending_with(self, suffix: str) -> tuple[str, ...]:
+        """Return all reexported names that end with the given suffix, in the order they were added."""
+        if not suffix or "." in suffix:
+            return tuple(name for name in self._reexports if name.endswith(suffix))
+        return tuple(self._names_by_suffix.get(suffix, ()))
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._reexports
+
+    def __getitem__(self, name: str) -> set[Module]:
+        return self._reexports[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._reexports)
+
+    def __len__(self) -> int:
+        return len(self._reexports)
@@ -3,13 +3,70 @@ from __future__ import annotations
 from abc import ABCMeta, abstractmethod
 from collections import Counter
 from dataclasses import dataclass
+from functools import wraps
 from typing import TYPE_CHECKING, Any
+from weakref import WeakValueDictionary
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Sequence
 
 
-class AbstractType(metaclass=ABCMeta):
+class _InterningTypeMeta(ABCMeta):
+    """Metaclass of the types, which makes sure that structurally equal types are the same object.
+
+    Every created type is looked up in a table of all types that are still in use. If there already is a type with the
+    same class and the same fields, that type is returned and the new one is discarded. Types of the same structure
+    share their fields, so the key of a type can use the identity of its nested types instead of their content.
+
+    Structural equality is stricter than the equality of the types, which ignores the order of e.g. the types of a
+    union, since the order matters for the generated stubs.
+    """
+
+    def __init__(cls, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        cls._interned_types: WeakValueDictionary[tuple, AbstractType] = WeakValueDictionary()
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        type_ = super().__call__(*args, **kwargs)
+        key = tuple(_get_intern_key(getattr(type_, name)) for name in type_.__dataclass_fields__)
+        return cls._interned_types.setdefault(key, type_)
+
+
+def _get_intern_key(value: Any) -> Any:
+    if isinstance(value, AbstractType):
+        return id(value)
+    if isinstance(value, list | tuple):
+        return tuple(_get_intern_key(item) for item in value)
+    # Literals of different types can be equal, e.g. 1, 1.0 and True
+    return type(value), value
+
+
+def _cached_hash(compute_hash: Callable[[Any], int]) -> Callable[[Any], int]:
+    """Compute the hash of a type only once and store it in the type."""
+
+    @wraps(compute_hash)
+    def __hash__(self: AbstractType) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            # Not computed yet, or the type was unpickled, which doesn't restore the cached hash
+            hash_ = compute_hash(self)
+            object.__setattr__(self, "_hash", hash_)
+            return hash_
+
+    return __hash__
+
+
+class AbstractType(metaclass=_InterningTypeMeta):
+    """The base class of all types.
+
+    Types are immutable after they are created, since they are shared between all places that use them and cache their
+    hash. Sequences of nested types and literals are therefore stored as tuples.
+    """
+
+    __slots__ = ("_hash",)
+    _hash: int
+
     @classmethod
     def from_dict(cls, d: dict[str, Any]) -> AbstractType:
         match d["kind"]:
@@ -44,7 +101,7 @@ class AbstractType(metaclass=ABCMeta):
     def to_dict(self) -> dict[str, Any]: ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class UnknownType(AbstractType):
     @classmethod
     def from_dict(cls, _: dict[str, Any]) -> UnknownType:
@@ -59,7 +116,7 @@ class UnknownType(AbstractType):
         return True
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class NamedType(AbstractType):
     name: str
     qname: str
@@ -72,20 +129,26 @@ class NamedType(AbstractType):
         return {"kind": self.__class__.__name__, "name": self.name, "qname": self.qname}
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, NamedType):  # pragma: no cover
             return NotImplemented
         return self.name == other.name and self.qname == other.qname
 
+    @_cached_hash
     def __hash__(self) -> int:
         return hash((self.name, self.qname))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class NamedSequenceType(AbstractType):
     name: str
     qname: str
     types: Sequence[AbstractType]
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "types", tuple(self.types))
+
     @classmethod
     def from_dict(cls, d: dict[str, Any]) -> NamedSequenceType:
         types = []
@@ -104,18 +167,26 @@ class NamedSequenceType(AbstractType):
         }
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, NamedSequenceType):  # pragma: no cover
             return NotImplemented
+        if hash(self) != hash(other):
+            return False
         return Counter(self.types) == Counter(other.types) and self.name == other.name and self.qname == other.qname
 
+    @_cached_hash
     def __hash__(self) -> int:
         return hash(frozenset([self.name, self.qname, *self.types]))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class UnionType(AbstractType):
     types: Sequence[AbstractType]
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "types", tuple(self.types))
+
     @classmethod
     def from_dict(cls, d: dict[str, Any]) -> UnionType:
         types = []
@@ -132,19 +203,27 @@ class UnionType(AbstractType):
 
         return {"kind": self.__class__.__name__, "types": type_list}
 
+    @_cached_hash
     def __hash__(self) -> int:
         return hash(frozenset(self.types))
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, UnionType):  # pragma: no cover
             return NotImplemented
+        if hash(self) != hash(other):
+            return False
         return Counter(self.types) == Counter(other.types)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class ListType(AbstractType):
     types: Sequence[AbstractType]
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "types", tuple(self.types))
+
     @classmethod
     def from_dict(cls, d: dict[str, Any]) -> ListType:
         types = []
@@ -160,15 +239,20 @@ class ListType(AbstractType):
         return {"kind": self.__class__.__name__, "types": type_list}
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, ListType):  # pragma: no cover
             return NotImplemented
+        if hash(self) != hash(other):
+            return False
         return Counter(self.types) == Counter(other.types)
 
+    @_cached_hash
     def __hash__(self) -> int:
         return hash(frozenset(self.types))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class DictType(AbstractType):
     key_type: AbstractType
     value_type: AbstractType
@@ -184,15 +268,19 @@ class DictType(AbstractType):
             "value_type": self.value_type.to_dict(),
         }
 
+    @_cached_hash
     def __hash__(self) -> int:
         return hash(frozenset([self.key_type, self.value_type]))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class CallableType(AbstractType):
     parameter_types: Sequence[AbstractType]
     return_type: AbstractType
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "parameter_types", tuple(self.parameter_types))
+
     @classmethod
     def from_dict(cls, d: dict[str, Any]) -> CallableType:
         params = []
@@ -211,18 +299,26 @@ class CallableType(AbstractType):
         }
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, CallableType):  # pragma: no cover
             return NotImplemented
+        if hash(self) != hash(other):
+            return False
         return Counter(self.parameter_types) == Counter(other.parameter_types) and self.return_type == other.return_type
 
+    @_cached_hash
     def __hash__(self) -> int:
         return hash(frozenset([*self.parameter_types, self.return_type]))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class SetType(AbstractType):
     types: Sequence[AbstractType]
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "types", tuple(self.types))
+
     @classmethod
     def from_dict(cls, d: dict[str, Any]) -> SetType:
         types = []
@@ -239,35 +335,48 @@ class SetType(AbstractType):
         }
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, SetType):  # pragma: no cover
             return NotImplemented
+        if hash(self) != hash(other):
+            return False
         return Counter(self.types) == Counter(other.types)
 
+    @_cached_hash
     def __hash__(self) -> int:
         return hash(frozenset(self.types))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class LiteralType(AbstractType):
-    literals: list[str | int | float | bool]
+    literals: Sequence[str | int | float | bool]
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "literals", tuple(self.literals))
 
     @classmethod
     def from_dict(cls, d: dict[str, Any]) -> LiteralType:
         return LiteralType(d["literals"])
 
     def to_dict(self) -> dict[str, Any]:
-        return {"kind": self.__class__.__name__, "literals": self.literals}
+        return {"kind": self.__class__.__name__, "literals": list(self.literals)}
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, LiteralType):  # pragma: no cover
             return NotImplemented
+        if hash(self) != hash(other):
+            return False
         return Counter(self.literals) == Counter(other.literals)
 
+    @_cached_hash
     def __hash__(self) -> int:
         return hash(frozenset(self.literals))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class FinalType(AbstractType):
     type_: AbstractType
 
@@ -278,14 +387,18 @@ class FinalType(AbstractType):
     def to_dict(self) -> dict[str, Any]:
         return {"kind": self.__class__.__name__, "type": self.type_.to_dict()}
 
+    @_cached_hash
     def __hash__(self) -> int:
         return hash(frozenset([self.type_]))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class TupleType(AbstractType):
     types: Sequence[AbstractType]
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "types", tuple(self.types))
+
     @classmethod
     def from_dict(cls, d: dict[str, Any]) -> TupleType:
         types = []
@@ -301,22 +414,28 @@ class TupleType(AbstractType):
         return {"kind": self.__class__.__name__, "types": type_list}
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, TupleType):  # pragma: no cover
             return NotImplemented
+        if hash(self) != hash(other):
+            return False
         return Counter(self.types) == Counter(other.types)
 
+    @_cached_hash
     def __hash__(self) -> int:
         return hash(frozenset(self.types))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class TypeVarType(AbstractType):
     name: str
     upper_bound: AbstractType | None = None
 
     @classmethod
     def from_dict(cls, d: dict[str, Any]) -> TypeVarType:
-        return TypeVarType(d["name"], d["upper_bound"])
+        upper_bound = AbstractType.from_dict(d["upper_bound"]) if d["upper_bound"] is not None else None
+        return TypeVarType(d["name"], upper_bound)
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -325,5 +444,6 @@ class TypeVarType(AbstractType):
             "upper_bound": self.upper_bound.to_dict() if self.upper_bound is not None else None,
         }
 
+    @_cached_hash
     def __hash__(self) -> int:
         return hash(frozenset([self.name, self.upper_bound]))
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import functools
+import time
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any, Literal
+
+from mypy.nodes import ClassDef, MypyFile
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# The methods of the visitor and the docstring parser whose calls are counted
+COUNTED_VISITOR_METHODS = ("_check_publicity_in_reexports", "mypy_type_to_abstract_type")
+COUNTED_DOCSTRING_PARSER_METHODS = (
+    "get_class_documentation",
+    "get_function_documentation",
+    "get_parameter_documentation",
+    "get_attribute_documentation",
+    "get_result_documentation",
+)
+
+
+_SymbolKind = Literal["module", "class"]
+
+
+@dataclass
+class SymbolCost:
+    """The cost of walking a module or class.
+
+    The time is the time spent in the `enter_*` and `leave_*` methods of the visitor for the symbol and all nodes in it,
+    in seconds. The call counts contain the number of calls of the counted methods while walking the symbol.
+    """
+
+    kind: _SymbolKind
+    name: str
+    nodes: int = 0
+    time: float = 0.0
+    call_counts: dict[str, int] = field(default_factory=dict)
+
+    def get_sort_value(self, sort_by: str) -> float:
+        if sort_by in ("time", "nodes"):
+            return getattr(self, sort_by)
+        return self.call_counts.get(sort_by, 0)
+
+
+class WalkProfiler:
+    """Record the cost of walking each module and class of a package.
+
+    The `ASTWalker` reports every visited node, and the counted methods of the visitor and the docstring parser are
+    wrapped on their instances with `instrument`. Nested classes are included in the costs of their outer classes.
+    """
+
+    def __init__(self) -> None:
+        self.symbols: dict[tuple[_SymbolKind, str], SymbolCost] = {}
+        self.method_times: dict[str, float] = {}
+        self._symbol_stack: list[SymbolCost] = []
+        self._method_depths: dict[str, int] = {}
+
+    def instrument(self, obj: Any, method_names: tuple[str, ...]) -> None:
+        """Replace the methods of an object with wrappers that count their calls."""
+        for method_name in method_names:
+            method = getattr(obj, method_name, None)
+            if method is not None:
+                setattr(obj, method_name, self._count_calls(method_name, method))
+
+    def walk_node(self, node: Any, enter_method: Callable | None, leave_method: Callable | None) -> Callable:
+        """Call the enter method of a node and return a function calling the leave method.
+
+        The time spent in both methods is added to the module and all classes the node is in.
+        """
+        symbol = self._get_symbol(node)
+        if symbol is not None:
+            self._symbol_stack.append(symbol)
+
+        self._call_timed(enter_method, node)
+
+        def leave() -> None:
+            self._call_timed(leave_method, node)
+            if symbol is not None:
+                self._symbol_stack.pop()
+
+        return leave
+
+    def top(self, n: int, sort_by: str = "time") -> list[SymbolCost]:
+        """Return the n most expensive modules and classes.
+
+        Symbols can be sorted by "time", "nodes" or the name of a counted method.
+        """
+        return sorted(self.symbols.values(), key=lambda symbol: symbol.get_sort_value(sort_by), reverse=True)[:n]
+
+    def to_dict(self, n: int, sort_by: str = "time") -> dict[str, Any]:
+        """Return the n most expensive modules and classes and the total times of the counted methods.
+
+        Times are given in seconds.
+        """
+        return {
+            "sort_by": sort_by,
+            "symbols": [asdict(symbol) for symbol in self.top(n, sort_by)],
+            "method_times": dict(sorted(self.method_times.items(), key=lambda item: item[1], reverse=True)),
+        }
+
+    def _get_symbol(self, node: Any) -> SymbolCost | None:
+        for outer_symbol in self._symbol_stack:
+            outer_symbol.nodes += 1
+
+        key: tuple[_SymbolKind, str]
+        if isinstance(node, MypyFile):
+            key = ("module", node.fullname)
+        elif isinstance(node, ClassDef):
+            key = ("class", node.fullname)
+        else:
+            return None
+
+        symbol = self.symbols.get(key, None)
+        if symbol is None:
+            symbol = SymbolCost(kind=key[0], name=key[1])
+            self.symbols[key] = symbol
+        symbol.nodes += 1
+        return symbol
+
+    def _call_timed(self, method: Callable | None, node: Any) -> None:
+        if method is None:
+            return
+
+        start_time = time.perf_counter()
+        try:
+            method(node)
+        finally:
+            elapsed_time = time.perf_counter() - start_time
+            for symbol in self._symbol_stack:
+                symbol.time += elapsed_time
+
+    def _count_calls(self, method_name: str, method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            for symbol in self._symbol_stack:
+                symbol.call_counts[method_name] = symbol.call_counts.get(method_name, 0) + 1
+
+            # Only the outermost call of recursive methods is timed, so that the time is not counted several times
+            depth = self._method_depths.get(method_name, 0)
+            self._method_depths[method_name] = depth + 1
+            start_time = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self._method_depths[method_name] = depth
+                if depth == 0:
+                    self.method_times[method_name] = (
+                        self.method_times.get(method_name, 0.0) + time.perf_counter() - start_time
+                    )
+
+        return wrapper
@@ -2,21 +2,90 @@ from __future__ import annotations
 
 import argparse
 import logging
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from safeds_stubgen.api_analyzer import TypeSourcePreference, TypeSourceWarning, get_api
-from safeds_stubgen.stubs_generator import StubsStringGenerator, create_stub_files, generate_stub_data
+from mypy.errors import CompileError
+
+from safeds_stubgen._profiling import Profiler, profile_iterator, profile_phase
+from safeds_stubgen.api_analyzer import API, TypeSourcePreference, TypeSourceWarning, get_api
+from safeds_stubgen.api_analyzer._incremental import IncrementalState
+from safeds_stubgen.api_analyzer._walk_profiler import (
+    COUNTED_DOCSTRING_PARSER_METHODS,
+    COUNTED_VISITOR_METHODS,
+    WalkProfiler,
+)
+from safeds_stubgen.stubs_generator import StubsStringGenerator, create_stub_files, iter_stub_data
 
 if TYPE_CHECKING:
     from safeds_stubgen.docstring_parsing import DocstringStyle
 
+_WATCH_POLL_INTERVAL = 0.2
+
+# The arguments that only apply to the analysis of the source directory, which is skipped with an API data file
+_SOURCE_ANALYSIS_ARGUMENTS = {
+    "src": "-s/--src",
+    "testrun": "-tr/--testrun",
+    "cache_dir": "-cd/--cache_dir",
+    "incremental": "-i/--incremental",
+    "watch": "-w/--watch",
+    "compact_json": "-cj/--compact_json",
+    "api_binary": "-ab/--api_binary",
+    "low_memory": "-lm/--low_memory",
+    "lazy_imports": "-li/--lazy_imports",
+}
+
 
 def cli() -> None:
     args = _get_args()
     if args.verbose:
         logging.basicConfig(level=logging.INFO)
 
+    if args.profile_report is None:
+        _run(args)
+        return
+
+    profiler = Profiler()
+    walk_profiler = WalkProfiler() if args.walk_profile is not None else None
+    try:
+        with profiler:
+            _run(args, walk_profiler=walk_profiler)
+    finally:
+        if walk_profiler is not None:
+            walk_profile = walk_profiler.to_dict(n=args.walk_profile, sort_by=args.walk_profile_sort)
+            profiler.reports["walk_profile"] = walk_profile
+        profiler.to_json_file(args.profile_report.resolve())
+
+
+def _run(args: argparse.Namespace, walk_profiler: WalkProfiler | None = None) -> None:
+    if args.api_json is not None:
+        _run_stub_generator_from_api_file(
+            api_file_path=args.api_json.resolve(),
+            out_dir_path=args.out.resolve(),
+            convert_identifiers=args.naming_convert,
+            workers=args.workers,
+        )
+        return
+
+    if args.watch:
+        _watch_stub_generator(
+            src_dir_path=args.src.resolve(),
+            out_dir_path=args.out.resolve(),
+            docstring_style=args.docstyle,
+            is_test_run=args.testrun,
+            convert_identifiers=args.naming_convert,
+            type_source_preference=args.type_source_preference,
+            type_source_warning=args.show_type_source_warning,
+            cache_dir=args.cache_dir.resolve() if args.cache_dir is not None else None,
+            workers=args.workers,
+            compact_json=args.compact_json,
+            api_binary=args.api_binary,
+            low_memory=args.low_memory,
+            lazy_imports=args.lazy_imports,
+        )
+        return
+
     _run_stub_generator(
         src_dir_path=args.src.resolve(),
         out_dir_path=args.out.resolve(),
@@ -25,6 +94,14 @@ def cli() -> None:
         convert_identifiers=args.naming_convert,
         type_source_preference=args.type_source_preference,
         type_source_warning=args.show_type_source_warning,
+        cache_dir=args.cache_dir.resolve() if args.cache_dir is not None else None,
+        incremental=args.incremental,
+        workers=args.workers,
+        compact_json=args.compact_json,
+        api_binary=args.api_binary,
+        low_memory=args.low_memory,
+        lazy_imports=args.lazy_imports,
+        walk_profiler=walk_profiler,
     )
 
 
@@ -37,9 +114,9 @@ def _get_args() -> argparse.Namespace:
     parser.add_argument(
         "-s",
         "--src",
-        help="Source directory containing the Python code of the package.",
+        help="Source directory containing the Python code of the package. Required unless --api_json is set.",
         type=Path,
-        required=True,
+        required=False,
         default=None,
     )
     parser.add_argument("-o", "--out", help="Output directory.", type=Path, required=True)
@@ -90,8 +167,141 @@ def _get_args() -> argparse.Namespace:
         required=False,
         default=TypeSourceWarning.WARN.name,
     )
+    parser.add_argument(
+        "-cd",
+        "--cache_dir",
+        help=(
+            "Directory in which the Mypy cache is stored. If set, unchanged dependencies of the package are loaded "
+            "from the cache in later runs instead of being analyzed again."
+        ),
+        type=Path,
+        required=False,
+        default=None,
+    )
+    parser.add_argument(
+        "-i",
+        "--incremental",
+        help=(
+            "Set this flag if only the modules that changed since the last run should be analyzed again and only the "
+            "stub files with a changed content should be written."
+        ),
+        required=False,
+        action="store_true",
+    )
+    parser.add_argument(
+        "-w",
+        "--watch",
+        help=(
+            "Set this flag if the process should keep running, watch the source directory for changes and regenerate "
+            "the stubs of changed modules. Implies --incremental."
+        ),
+        required=False,
+        action="store_true",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        help="The number of processes that parse the docstrings and generate the stubs of the modules in parallel.",
+        type=int,
+        required=False,
+        default=1,
+    )
+    parser.add_argument(
+        "-cj",
+        "--compact_json",
+        help="Set this flag if the API data file should be written without indentation and whitespace.",
+        required=False,
+        action="store_true",
+    )
+    parser.add_argument(
+        "-ab",
+        "--api_binary",
+        help=(
+            "Set this flag if the API data should also be written to a compact binary file, which can be loaded much "
+            "faster with --api_json. The file can only be loaded with the same Python version."
+        ),
+        required=False,
+        action="store_true",
+    )
+    parser.add_argument(
+        "-lm",
+        "--low_memory",
+        help=(
+            "Set this flag if Mypy should only keep the full data of the modules of the package. Dependencies are "
+            "analyzed once more and loaded from the Mypy cache instead, which is slower but needs much less memory."
+        ),
+        required=False,
+        action="store_true",
+    )
+    parser.add_argument(
+        "-li",
+        "--lazy_imports",
+        help=(
+            "Set this flag if Mypy should not analyze the source code of third party packages. Their stub files are "
+            "still used and their types are still added with their qualified names."
+        ),
+        required=False,
+        action="store_true",
+    )
+    parser.add_argument(
+        "-aj",
+        "--api_json",
+        help=(
+            "API data file (JSON or binary '.bin' file) of an earlier run. If set, the stubs are generated from this "
+            "file instead of analyzing the source directory again."
+        ),
+        type=Path,
+        required=False,
+        default=None,
+    )
 
-    return parser.parse_args()
+    parser.add_argument(
+        "-pr",
+        "--profile_report",
+        help=(
+            "Path of a JSON file to which the wall time, CPU time and peak memory of each phase of the run are "
+            "written."
+        ),
+        type=Path,
+        required=False,
+        default=None,
+    )
+
+    parser.add_argument(
+        "-wp",
+        "--walk_profile",
+        help=(
+            "Add the given number of modules and classes of the package that took the longest to analyze to the "
+            "profile report, with the number of analyzed nodes and the calls of the reexport checks, type conversions "
+            "and docstring lookups of each. Requires --profile_report."
+        ),
+        type=int,
+        required=False,
+        default=None,
+    )
+    parser.add_argument(
+        "-wps",
+        "--walk_profile_sort",
+        help="The column by which the modules and classes of --walk_profile are sorted.",
+        choices=["time", "nodes", *COUNTED_VISITOR_METHODS, *COUNTED_DOCSTRING_PARSER_METHODS],
+        required=False,
+        default="time",
+    )
+
+    args = parser.parse_args()
+    if args.src is None and args.api_json is None:
+        parser.error("one of the arguments -s/--src -aj/--api_json is required")
+    if args.api_json is not None:
+        for name, flags in _SOURCE_ANALYSIS_ARGUMENTS.items():
+            if getattr(args, name) not in (None, False):
+                parser.error(f"argument -aj/--api_json: not allowed with argument {flags}")
+    if args.walk_profile is not None and args.profile_report is None:
+        parser.error("argument -wp/--walk_profile: requires argument -pr/--profile_report")
+    if args.walk_profile is not None and (args.watch or args.api_json is not None):
+        parser.error("argument -wp/--walk_profile: not allowed with argument -w/--watch or -aj/--api_json")
+    if args.workers < 1:
+        parser.error("argument -j/--workers: must be at least 1")
+    return args
 
 
 def _run_stub_generator(
@@ -102,6 +312,15 @@ def _run_stub_generator(
     convert_identifiers: bool,
     type_source_preference: TypeSourcePreference,
     type_source_warning: TypeSourceWarning,
+    cache_dir: Path | None = None,
+    incremental: bool = False,
+    incremental_state: IncrementalState | None = None,
+    workers: int = 1,
+    compact_json: bool = False,
+    api_binary: bool = False,
+    low_memory: bool = False,
+    lazy_imports: bool = False,
+    walk_profiler: WalkProfiler | None = None,
 ) -> None:
     """
     Create API data of a package and Safe-DS stub files.
@@ -114,6 +333,27 @@ def _run_stub_generator(
         The style of docstrings that used in the library.
     is_test_run:
         Set True if files in test directories should be parsed too.
+    convert_identifiers:
+        Set True if the names should be converted to the Safe-DS naming convention.
+    cache_dir:
+        The directory of the Mypy cache. If None, no cache is used.
+    incremental:
+        Set True if the state of the last run should be used to only analyze changed modules and write changed files.
+    incremental_state:
+        The in-memory state of the last run. If None and incremental is True, the state is stored in the output
+        directory.
+    workers:
+        The number of processes that parse the docstrings and generate the stubs of the modules.
+    compact_json:
+        Set True if the API data file should be written without indentation.
+    api_binary:
+        Set True if the API data should also be written to a binary file.
+    low_memory:
+        Set True if Mypy should only keep the ASTs and expression types of the modules of the package.
+    lazy_imports:
+        Set True if Mypy should not analyze the source code of third party packages.
+    walk_profiler:
+        Records the cost of walking each module and class of the package, if given.
     """
     # Generate the API data
     api = get_api(
@@ -122,13 +362,180 @@ def _run_stub_generator(
         is_test_run=is_test_run,
         type_source_preference=type_source_preference,
         type_source_warning=type_source_warning,
+        cache_dir=cache_dir,
+        incremental_state_file=(
+            out_dir_path.joinpath(f"{src_dir_path.stem}__incremental_state.pickle")
+            if incremental and incremental_state is None
+            else None
+        ),
+        incremental_state=incremental_state,
+        workers=workers,
+        low_memory=low_memory,
+        lazy_imports=lazy_imports,
+        walk_profiler=walk_profiler,
     )
     # Create an API file
     out_file_api = out_dir_path.joinpath(f"{src_dir_path.stem}__api.json")
-    api.to_json_file(out_file_api)
+    with profile_phase("api_json"):
+        api.to_json_file(out_file_api, compact=compact_json)
+        if api_binary:
+            api.to_binary_file(out_dir_path.joinpath(f"{src_dir_path.stem}__api.bin"))
+
+    _generate_stubs(
+        api=api,
+        out_dir_path=out_dir_path,
+        convert_identifiers=convert_identifiers,
+        workers=workers,
+        skip_unchanged=incremental,
+    )
+
+
+def _run_stub_generator_from_api_file(
+    api_file_path: Path,
+    out_dir_path: Path,
+    convert_identifiers: bool,
+    workers: int = 1,
+) -> None:
+    """
+    Create Safe-DS stub files from the API data file of an earlier run, without analyzing the package again.
+
+    Parameters
+    ----------
+    api_file_path:
+        The path to the API data file. Files with the suffix ".bin" are read as binary API files.
+    out_dir_path:
+        The path to the output directory.
+    convert_identifiers:
+        Set True if the names should be converted to the Safe-DS naming convention.
+    workers:
+        The number of processes that generate the stubs of the modules.
+    """
+    with profile_phase("api_json"):
+        if api_file_path.suffix == ".bin":
+            api = API.from_binary_file(api_file_path)
+        else:
+            api = API.from_json_file(api_file_path)
+    _generate_stubs(api=api, out_dir_path=out_dir_path, convert_identifiers=convert_identifiers, workers=workers)
+
 
-    # Generate the stub data
+def _generate_stubs(
+    api: API,
+    out_dir_path: Path,
+    convert_identifiers: bool,
+    workers: int = 1,
+    skip_unchanged: bool = False,
+) -> None:
+    # Generate the stub data and write each stub file as soon as it's created
     stubs_generator = StubsStringGenerator(api=api, convert_identifiers=convert_identifiers)
-    stub_data = generate_stub_data(stubs_generator=stubs_generator, out_path=out_dir_path)
-    # Create the stub files
-    create_stub_files(stubs_generator=stubs_generator, stubs_data=stub_data, out_path=out_dir_path)
+    with profile_phase("stub_files"):
+        write_stats = create_stub_files(
+            stubs_generator=stubs_generator,
+            stubs_data=profile_iterator(
+                "stub_data",
+                iter_stub_data(stubs_generator=stubs_generator, out_path=out_dir_path, workers=workers),
+            ),
+            out_path=out_dir_path,
+            skip_unchanged=skip_unchanged,
+        )
+    log_msg = f"Type string cache: {stubs_generator.type_string_cache_stats}"
+    logging.info(log_msg)
+    log_msg = (
+        f"Stub files: {write_stats.unchanged} unchanged, {write_stats.updated} updated, {write_stats.created} created, "
+        f"{write_stats.deleted} deleted"
+    )
+    logging.info(log_msg)
+
+
+def _watch_stub_generator(
+    src_dir_path: Path,
+    out_dir_path: Path,
+    docstring_style: DocstringStyle,
+    is_test_run: bool,
+    convert_identifiers: bool,
+    type_source_preference: TypeSourcePreference,
+    type_source_warning: TypeSourceWarning,
+    cache_dir: Path | None = None,
+    workers: int = 1,
+    compact_json: bool = False,
+    api_binary: bool = False,
+    low_memory: bool = False,
+    lazy_imports: bool = False,
+    max_runs: int | None = None,
+) -> None:
+    """
+    Create the API data and stub files of a package and recreate them every time a Python file of the package changes.
+
+    The process keeps the imported modules and the API data of the last run in memory, and the Mypy cache on disk. After
+    a change, only the changed modules and the modules that depend on them are analyzed again, and only stub files with
+    a changed content are written.
+
+    Parameters
+    ----------
+    cache_dir:
+        The directory of the Mypy cache. If None, the cache is stored in the output directory.
+    workers:
+        The number of processes that parse the docstrings and generate the stubs of the modules.
+    max_runs:
+        The number of runs after which the process stops. If None, it runs until it is interrupted.
+    """
+    if cache_dir is None:
+        cache_dir = out_dir_path / ".mypy_cache"
+
+    incremental_state = IncrementalState(options={})
+    last_snapshot: dict[Path, tuple[int, int]] | None = None
+    runs = 0
+
+    log_msg = f"Watching {src_dir_path} for changes."
+    logging.info(log_msg)
+    try:
+        while max_runs is None or runs < max_runs:
+            snapshot = _get_source_snapshot(src_dir_path)
+            if snapshot == last_snapshot:
+                time.sleep(_WATCH_POLL_INTERVAL)
+                continue
+
+            last_snapshot = snapshot
+            runs += 1
+            start_time = time.perf_counter()
+            try:
+                _run_stub_generator(
+                    src_dir_path=src_dir_path,
+                    out_dir_path=out_dir_path,
+                    docstring_style=docstring_style,
+                    is_test_run=is_test_run,
+                    convert_identifiers=convert_identifiers,
+                    type_source_preference=type_source_preference,
+                    type_source_warning=type_source_warning,
+                    cache_dir=cache_dir,
+                    incremental=True,
+                    incremental_state=incremental_state,
+                    workers=workers,
+                    compact_json=compact_json,
+                    api_binary=api_binary,
+                    low_memory=low_memory,
+                    lazy_imports=lazy_imports,
+                )
+            except (CompileError, ValueError) as error:
+                # Keep watching, the user will most likely fix the error with the next change
+                log_msg = f"Could not generate the stubs: {error}"
+                logging.warning(log_msg)
+                continue
+
+            log_msg = f"Generated the stubs in {time.perf_counter() - start_time:.3f}s."
+            logging.info(log_msg)
+    except KeyboardInterrupt:  # pragma: no cover
+        log_msg = f"Stopped watching {src_dir_path}."
+        logging.info(log_msg)
+
+
+def _get_source_snapshot(src_dir_path: Path) -> dict[Path, tuple[int, int]]:
+    """Return the modification time and the size of every Python file in the source directory."""
+    snapshot = {}
+    for file_path in src_dir_path.glob("./**/*.py"):
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:  # pragma: no cover
+            # The file was deleted while we were collecting the snapshot
+            continue
+        snapshot[file_path] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
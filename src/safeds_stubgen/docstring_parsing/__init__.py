@@ -9,7 +9,7 @@ from ._docstring import (
     ParameterDocstring,
     ResultDocstring,
 )
-from ._docstring_parser import DocstringParser
+from ._docstring_parser import DocstringParser, DocstringParserCacheStats
 from ._docstring_style import DocstringStyle
 from ._plaintext_docstring_parser import PlaintextDocstringParser
 
@@ -18,6 +18,7 @@ __all__ = [
     "AttributeDocstring",
     "ClassDocstring",
     "DocstringParser",
+    "DocstringParserCacheStats",
     "DocstringStyle",
     "FunctionDocstring",
     "ParameterDocstring",
@@ -14,12 +14,12 @@ if TYPE_CHECKING:
     from ._abstract_docstring_parser import AbstractDocstringParser
 
 
-def create_docstring_parser(style: DocstringStyle, package_path: Path) -> AbstractDocstringParser:
+def create_docstring_parser(style: DocstringStyle, package_path: Path, workers: int = 1) -> AbstractDocstringParser:
     if style == DocstringStyle.GOOGLE:
-        return DocstringParser(parser=Parser.google, package_path=package_path)
+        return DocstringParser(parser=Parser.google, package_path=package_path, workers=workers)
     elif style == DocstringStyle.NUMPYDOC:
-        return DocstringParser(parser=Parser.numpy, package_path=package_path)
+        return DocstringParser(parser=Parser.numpy, package_path=package_path, workers=workers)
     elif style == DocstringStyle.REST:
-        return DocstringParser(parser=Parser.sphinx, package_path=package_path)
+        return DocstringParser(parser=Parser.sphinx, package_path=package_path, workers=workers)
     else:
         return PlaintextDocstringParser()
@@ -4,53 +4,100 @@ import dataclasses
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+# noinspection PyProtectedMember
+import safeds_stubgen.api_analyzer._types as sds_types
+
 if TYPE_CHECKING:
     from typing import Any
 
-    from safeds_stubgen.api_analyzer import AbstractType
-
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClassDocstring:
     description: str = ""
     full_docstring: str = ""
     examples: list[str] = dataclasses.field(default_factory=list)
 
+    @classmethod
+    def from_dict(cls, d: dict[str, Any]) -> ClassDocstring:
+        return ClassDocstring(description=d["description"], full_docstring=d["full_docstring"], examples=d["examples"])
+
     def to_dict(self) -> dict[str, Any]:
         return dataclasses.asdict(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FunctionDocstring:
     description: str = ""
     full_docstring: str = ""
     examples: list[str] = dataclasses.field(default_factory=list)
 
+    @classmethod
+    def from_dict(cls, d: dict[str, Any]) -> FunctionDocstring:
+        return FunctionDocstring(
+            description=d["description"],
+            full_docstring=d["full_docstring"],
+            examples=d["examples"],
+        )
+
     def to_dict(self) -> dict[str, Any]:
         return dataclasses.asdict(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParameterDocstring:
-    type: AbstractType | None = None
+    type: sds_types.AbstractType | None = None
     default_value: str = ""
     description: str = ""
 
+    @classmethod
+    def from_dict(cls, d: dict[str, Any]) -> ParameterDocstring:
+        return ParameterDocstring(
+            type=_type_from_dict(d["type"]),
+            default_value=d["default_value"],
+            description=d["description"],
+        )
+
     def to_dict(self) -> dict[str, Any]:
-        return dataclasses.asdict(self)
+        return {
+            "type": self.type.to_dict() if self.type is not None else None,
+            "default_value": self.default_value,
+            "description": self.description,
+        }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AttributeDocstring:
-    type: AbstractType | None = None
+    type: sds_types.AbstractType | None = None
     description: str = ""
 
+    @classmethod
+    def from_dict(cls, d: dict[str, Any]) -> AttributeDocstring:
+        return AttributeDocstring(type=_type_from_dict(d["type"]), description=d["description"])
+
     def to_dict(self) -> dict[str, Any]:
-        return dataclasses.asdict(self)
+        return {
+            "type": self.type.to_dict() if self.type is not None else None,
+            "description": self.description,
+        }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResultDocstring:
-    type: AbstractType | None = None
+    type: sds_types.AbstractType | None = None
     description: str = ""
     name: str = ""
+
+    @classmethod
+    def from_dict(cls, d: dict[str, Any]) -> ResultDocstring:
+        return ResultDocstring(type=_type_from_dict(d["type"]), description=d["description"], name=d["name"])
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "type": self.type.to_dict() if self.type is not None else None,
+            "description": self.description,
+            "name": self.name,
+        }
+
+
+def _type_from_dict(d: dict[str, Any] | None) -> sds_types.AbstractType | None:
+    return sds_types.AbstractType.from_dict(d) if d is not None else None
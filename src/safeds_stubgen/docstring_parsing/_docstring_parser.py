@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Literal
 
 from griffe import load
@@ -12,6 +13,7 @@ from griffe.expressions import Expr, ExprAttribute, ExprBinOp, ExprBoolOp, ExprL
 
 # noinspection PyProtectedMember
 import safeds_stubgen.api_analyzer._types as sds_types
+from safeds_stubgen._profiling import profile_phase
 
 from ._abstract_docstring_parser import AbstractDocstringParser
 from ._docstring import (
@@ -21,27 +23,47 @@ from ._docstring import (
     ParameterDocstring,
     ResultDocstring,
 )
+from ._parallel_docstring_parsing import preparse_docstrings
 
 if TYPE_CHECKING:
     from pathlib import Path
 
     from griffe.dataclasses import Object
+    from griffe.docstrings.dataclasses import DocstringSection
     from mypy import nodes
 
 
+@dataclass
+class DocstringParserCacheStats:
+    """The number of cache hits and misses of a docstring parser, e.g. for profiling."""
+
+    node_hits: int = 0
+    node_misses: int = 0
+    section_hits: int = 0
+    section_misses: int = 0
+
+
 class DocstringParser(AbstractDocstringParser):
-    def __init__(self, parser: Parser, package_path: Path):
-        while True:
-            # If a package has no __init__.py file Griffe can't parse it, therefore we check the parent
-            try:
-                self.griffe_build = load(package_path, docstring_parser=parser)
-                break
-            except KeyError:
-                package_path = package_path.parent
+    def __init__(self, parser: Parser, package_path: Path, workers: int = 1):
+        with profile_phase("griffe_load"):
+            while True:
+                # If a package has no __init__.py file Griffe can't parse it, therefore we check the parent
+                try:
+                    self.griffe_build = load(package_path, docstring_parser=parser)
+                    break
+                except KeyError:
+                    package_path = package_path.parent
+
+        # Parse all docstrings in advance, otherwise they are parsed lazily once they are needed
+        if workers > 1:
+            with profile_phase("docstring_preparsing"):
+                preparsed_count = preparse_docstrings(self.griffe_build, package_path, parser, workers)
+            msg = f"Parsed {preparsed_count} docstrings with {workers} worker processes."
+            logging.info(msg)
 
         self.parser = parser
-        self.__cached_node: str | None = None
-        self.__cached_docstring: Docstring | None = None
+        self.cache_stats = DocstringParserCacheStats()
+        self.__griffe_nodes: dict[str, Object | None] = {}
 
     def get_class_documentation(self, class_node: nodes.ClassDef) -> ClassDocstring:
         griffe_node = self._get_griffe_node(class_node.fullname)
@@ -56,7 +78,7 @@ class DocstringParser(AbstractDocstringParser):
             docstring = griffe_node.docstring.value.strip("\n")
 
             try:
-                for docstring_section in griffe_node.docstring.parsed:
+                for docstring_section in self._get_parsed_sections(griffe_node.docstring):
                     if docstring_section.kind == DocstringSectionKind.text:
                         description = docstring_section.value.strip("\n")
                     elif docstring_section.kind == DocstringSectionKind.examples:
@@ -81,7 +103,7 @@ class DocstringParser(AbstractDocstringParser):
             docstring = griffe_docstring.value.strip("\n")
 
             try:
-                for docstring_section in griffe_docstring.parsed:
+                for docstring_section in self._get_parsed_sections(griffe_docstring):
                     if docstring_section.kind == DocstringSectionKind.text:
                         if description:
                             description += "\n\n"
@@ -205,7 +227,7 @@ class DocstringParser(AbstractDocstringParser):
 
         all_returns = None
         try:
-            for docstring_section in griffe_docstring.parsed:
+            for docstring_section in self._get_parsed_sections(griffe_docstring):
                 if docstring_section.kind == DocstringSectionKind.returns:
                     all_returns = docstring_section
                     break
@@ -249,15 +271,15 @@ class DocstringParser(AbstractDocstringParser):
 
         return results
 
-    @staticmethod
     def _get_matching_docstrings(
+        self,
         function_doc: Docstring,
         name: str,
         type_: Literal["attr", "param"],
     ) -> list[DocstringAttribute | DocstringParameter]:
         all_docstrings = None
         try:
-            for docstring_section in function_doc.parsed:
+            for docstring_section in self._get_parsed_sections(function_doc):
                 section_kind = docstring_section.kind
                 if (type_ == "attr" and section_kind == DocstringSectionKind.attributes) or (
                     type_ == "param" and section_kind == DocstringSectionKind.parameters
@@ -404,6 +426,21 @@ class DocstringParser(AbstractDocstringParser):
         return annotation
 
     def _get_griffe_node(self, qname: str) -> Object | None:
+        """Return the Griffe node of a qname.
+
+        The nodes are cached, since we search the same nodes for a class or function and all of its parameters, results
+        and attributes.
+        """
+        if qname in self.__griffe_nodes:
+            self.cache_stats.node_hits += 1
+            return self.__griffe_nodes[qname]
+
+        self.cache_stats.node_misses += 1
+        griffe_node = self._find_griffe_node(qname)
+        self.__griffe_nodes[qname] = griffe_node
+        return griffe_node
+
+    def _find_griffe_node(self, qname: str) -> Object | None:
         node_qname_parts = qname.split(".")
         griffe_node = self.griffe_build
         for part in node_qname_parts:
@@ -432,20 +469,21 @@ class DocstringParser(AbstractDocstringParser):
         """
         Return the Docstring for the given function node.
 
-        It is only recomputed when the function node differs from the previous one that was passed to this function.
+        The Griffe nodes are cached by _get_griffe_node and the parsed sections by the Griffe docstrings themselves.
         This avoids reparsing the docstring for the function itself and all of its parameters.
 
-        On Lars's system this caused a significant performance improvement: Previously, 8.382s were spent inside the
-        function get_parameter_documentation when parsing sklearn. Afterward, it was only 2.113s.
+        On Lars's system caching the docstring caused a significant performance improvement: Previously, 8.382s were
+        spent inside the function get_parameter_documentation when parsing sklearn. Afterward, it was only 2.113s.
         """
-        if self.__cached_node != qname or qname.endswith("__init__"):
-            self.__cached_node = qname
-
-            griffe_node = self._get_griffe_node(qname)
-            if griffe_node is not None:
-                griffe_docstring = griffe_node.docstring
-                self.__cached_docstring = griffe_docstring
-            else:
-                self.__cached_docstring = None
-
-        return self.__cached_docstring
+        griffe_node = self._get_griffe_node(qname)
+        if griffe_node is None:
+            return None
+        return griffe_node.docstring
+
+    def _get_parsed_sections(self, docstring: Docstring) -> list[DocstringSection]:
+        # "parsed" is a cached property of Griffe docstrings, which is filled once the docstring is parsed
+        if "parsed" in docstring.__dict__:
+            self.cache_stats.section_hits += 1
+        else:
+            self.cache_stats.section_misses += 1
+        return docstring.parsed
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import functools
+import inspect
+import io
+import logging
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from griffe import Alias, load
+from griffe.dataclasses import Docstring, Object
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from griffe.docstrings.dataclasses import DocstringSection
+    from griffe.enumerations import Parser
+
+# The parsed sections are stored in the cache of the "parsed" property of Griffe docstrings, which is an implementation
+# detail of Griffe. This works with the Griffe versions supported by this package (>=0.47.0,<0.49), for other versions
+# the docstrings are parsed serially if the property is not cached.
+# The Griffe tree of a worker process. Forked processes inherit the tree of the main process, other processes load it.
+_worker_griffe_build: Object | None = None
+
+
+def preparse_docstrings(griffe_build: Object, package_path: Path, parser: Parser, workers: int) -> int:
+    """Parse the docstrings of all objects of a Griffe tree in worker processes.
+
+    The parsed sections are stored in the docstrings of the tree, so that the docstring parser doesn't have to parse them
+    again while the AST is walked. Docstrings that could not be parsed by the workers are parsed lazily as usual.
+
+    Parameters
+    ----------
+    griffe_build:
+        The root of the Griffe tree.
+    package_path:
+        The path the Griffe tree was loaded from.
+    parser:
+        The Griffe parser of the docstring style.
+    workers:
+        The number of worker processes.
+
+    Returns
+    -------
+    preparsed_count:
+        The number of docstrings that were parsed by the workers.
+    """
+    global _worker_griffe_build  # noqa: PLW0603
+
+    if not _has_cached_parsed_sections(Docstring):
+        msg = "The parsed sections of Griffe docstrings are not cached, the docstrings will be parsed serially."
+        logging.info(msg)
+        return 0
+
+    object_paths = [
+        griffe_object.path for griffe_object in _iter_objects(griffe_build) if griffe_object.docstring is not None
+    ]
+    if not object_paths:
+        return 0
+
+    # Smaller chunks distribute the work more evenly, larger ones reduce the communication overhead
+    chunk_size = max(len(object_paths) // (workers * 4), 1)
+    path_chunks = [object_paths[i : i + chunk_size] for i in range(0, len(object_paths), chunk_size)]
+
+    _worker_griffe_build = griffe_build
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(package_path, parser),
+        ) as executor:
+            chunk_results = list(executor.map(_parse_docstrings_in_worker, path_chunks))
+    finally:
+        _worker_griffe_build = None
+
+    preparsed_count = 0
+    for chunk_result in chunk_results:
+        for object_path, pickled_sections in chunk_result:
+            try:
+                sections = _SectionsUnpickler(io.BytesIO(pickled_sections), griffe_build).load()
+            except (KeyError, pickle.UnpicklingError):  # pragma: no cover
+                msg = f"Could not use the preparsed docstring of {object_path}, it will be parsed again."
+                logging.info(msg)
+                continue
+
+            docstring = _get_object(griffe_build, object_path).docstring
+            if docstring is not None and _set_parsed_sections(docstring, sections):
+                preparsed_count += 1
+
+    return preparsed_count
+
+
+def _has_cached_parsed_sections(docstring_type: type) -> bool:
+    return isinstance(inspect.getattr_static(docstring_type, "parsed", None), functools.cached_property)
+
+
+def _set_parsed_sections(docstring: Docstring, sections: list[DocstringSection]) -> bool:
+    """Fill the cache of the "parsed" property of a Griffe docstring with the sections.
+
+    Returns False if the property is not cached, in which case the docstring is parsed lazily as usual.
+    """
+    if not _has_cached_parsed_sections(type(docstring)):  # pragma: no cover
+        return False
+
+    docstring.__dict__["parsed"] = sections
+    return True
+
+
+def _iter_objects(griffe_object: Object) -> Iterator[Object]:
+    for member in griffe_object.members.values():
+        if isinstance(member, Alias):
+            continue
+
+        yield member
+        yield from _iter_objects(member)
+
+
+def _get_object(griffe_build: Object, object_path: str) -> Object | Alias:
+    """Get an object of the Griffe tree by its path, e.g. "package.module.Class"."""
+    root_name, *parts = object_path.split(".")
+    if root_name != griffe_build.name:  # pragma: no cover
+        raise KeyError(object_path)
+
+    griffe_object: Object | Alias = griffe_build
+    for part in parts:
+        griffe_object = griffe_object.members[part]
+    return griffe_object
+
+
+def _init_worker(package_path: Path, parser: Parser) -> None:
+    global _worker_griffe_build  # noqa: PLW0603
+    if _worker_griffe_build is None:  # pragma: no cover
+        _worker_griffe_build = load(package_path, docstring_parser=parser)
+
+
+def _parse_docstrings_in_worker(object_paths: list[str]) -> list[tuple[str, bytes]]:
+    griffe_build = _worker_griffe_build
+    if griffe_build is None:  # pragma: no cover
+        raise ValueError("The worker process was not initialized.")
+
+    results = []
+    for object_path in object_paths:
+        try:
+            docstring = _get_object(griffe_build, object_path).docstring
+            if docstring is None:  # pragma: no cover
+                continue
+
+            pickled_sections = io.BytesIO()
+            _SectionsPickler(pickled_sections).dump(docstring.parsed)
+        except (KeyError, IndexError, pickle.PicklingError):  # pragma: no cover
+            # The docstring is parsed again by the main process, which also reports errors
+            continue
+
+        results.append((object_path, pickled_sections.getvalue()))
+
+    return results
+
+
+class _SectionsPickler(pickle.Pickler):
+    """Pickle parsed docstring sections without the Griffe objects they reference.
+
+    Annotations of the sections reference the Griffe objects they were found in. These objects are replaced by their
+    path and resolved again in the Griffe tree of the main process.
+    """
+
+    def persistent_id(self, obj: Any) -> str | None:  # noqa: PLR6301
+        if isinstance(obj, Object | Alias):
+            return obj.path
+        return None
+
+
+class _SectionsUnpickler(pickle.Unpickler):
+    def __init__(self, file: io.BytesIO, griffe_build: Object) -> None:
+        super().__init__(file)
+        self.griffe_build = griffe_build
+
+    def persistent_load(self, pid: Any) -> Object | Alias:
+        return _get_object(self.griffe_build, pid)
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-from ._generate_stubs import create_stub_files, generate_stub_data
+from ._generate_stubs import StubFileWriteStats, create_stub_files, generate_stub_data, iter_stub_data
 from ._helper import NamingConvention
-from ._stub_string_generator import StubsStringGenerator
+from ._stub_string_generator import StubsStringGenerator, TypeStringCacheStats
 
 __all__ = [
     "NamingConvention",
+    "StubFileWriteStats",
     "StubsStringGenerator",
+    "TypeStringCacheStats",
     "create_stub_files",
     "generate_stub_data",
+    "iter_stub_data",
 ]
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 import logging
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from safeds_stubgen.api_analyzer import Class
+
 from ._helper import (
     NamingConvention,
     _convert_name_to_convention,
@@ -11,18 +17,41 @@ from ._helper import (
     _get_shortest_public_reexport_and_alias,
     _replace_if_safeds_keyword,
 )
+from ._stub_string_generator import StubsStringGenerator, TypeStringCacheStats
 
 if TYPE_CHECKING:
-    from ._stub_string_generator import StubsStringGenerator
+    from collections.abc import Iterable, Iterator
+
+    from safeds_stubgen.api_analyzer import API, Function, Module
+
+# The stubs generator of a worker process, which is created once per process
+_worker_stubs_generator: StubsStringGenerator | None = None
+
+# The stub data of a module created in a worker process: 1. the module ID, 2. the module text, 3. the package info,
+#  4. if the module has content and 5. the classes and functions that have to be created in reexport modules, as tuples
+#  of the reexport module ID, if it's a class, the ID and the (possibly aliased) name of the class or function.
+_WorkerModuleData = tuple[str, str, str, bool, list[tuple[str, bool, str, str]]]
+
+
+@dataclass
+class StubFileWriteStats:
+    """The number of stub files that were left unchanged, updated, created and deleted by `create_stub_files`."""
+
+    unchanged: int = 0
+    updated: int = 0
+    created: int = 0
+    deleted: int = 0
 
 
 def generate_stub_data(
     stubs_generator: StubsStringGenerator,
     out_path: Path,
+    workers: int = 1,
 ) -> list[tuple[Path, str, str, bool]]:
     """Generate Safe-DS stubs.
 
-    Generates stub data from an API object.
+    Generates stub data from an API object. This collects all stub data in memory, use `iter_stub_data` to process the
+    stub data of each module as soon as it's created.
 
     Parameters
     ----------
@@ -31,6 +60,10 @@ def generate_stub_data(
     out_path:
         The path in which the stub files should be created. If no such path exists this function creates the directory
         files.
+    workers:
+        The number of processes that create the stub strings of the modules. With more than one worker, each process
+        gets its own stubs generator and the results are merged in the order of the modules, so the stub data is the
+        same as with a single worker.
 
     Returns
     -------
@@ -38,27 +71,46 @@ def generate_stub_data(
         A list of tuples, which are 1. the path of the stub file, 2. the name of the stub file, 3. its content and 4. if
         it's a package file (created through init reexports).
     """
+    return list(iter_stub_data(stubs_generator=stubs_generator, out_path=out_path, workers=workers))
+
+
+def iter_stub_data(
+    stubs_generator: StubsStringGenerator,
+    out_path: Path,
+    workers: int = 1,
+) -> Iterator[tuple[Path, str, str, bool]]:
+    """Generate Safe-DS stubs module by module.
+
+    The stub data of a module is yielded as soon as it's created, so only the stub text of one module has to be kept in
+    memory if the stub files are written while iterating. The reexport modules are yielded last, since they depend on
+    all other modules.
+
+    Parameters
+    ----------
+    stubs_generator:
+        The class for generating the stubs.
+    out_path:
+        The path in which the stub files should be created.
+    workers:
+        The number of processes that create the stub strings of the modules.
+
+    Yields
+    ------
+    virtual_file:
+        A tuple of 1. the path of the stub file, 2. the name of the stub file, 3. its content and 4. if it's a package
+        file (created through init reexports).
+    """
     api = stubs_generator.api
-    stubs_data: list[tuple[Path, str, str, bool]] = []
-    for module in api.modules.values():
-        if module.name == "__init__":
-            continue
+    modules = [module for module in api.modules.values() if module.name != "__init__"]
 
-        log_msg = f"Creating stub data for {module.id}"
-        logging.info(log_msg)
+    if workers > 1 and len(modules) > 1:
+        module_strings = _create_module_strings_in_parallel(stubs_generator, modules, workers)
+    else:
+        module_strings = _create_module_strings(stubs_generator, modules)
 
-        module_text, package_info = stubs_generator(module)
-
-        # Each text block we create ends with "\n", therefore, if there is only the package information
-        # the file would look like this: "package path.to.myPackage\n" or this:
-        # '@PythonModule("path.to.my_package")\npackage path.to.myPackage\n'. With the split we check if the module
-        # has enough information, if not, we won't create it.
-        _module_text = module_text
-        if _module_text.startswith("/**"):
-            # Remove docstring
-            _module_text = "*/\n".join(_module_text.split("*/\n\n")[1:])
-        splitted_text = _module_text.split("\n")
-        if len(splitted_text) <= 2 or (len(splitted_text) == 3 and splitted_text[1].startswith("package ")):
+    for module, (module_text, package_info, has_content) in zip(modules, module_strings, strict=True):
+        # Modules without classes, functions and enums would only contain the package information
+        if not has_content:
             continue
 
         shortest_path, alias = _get_shortest_public_reexport_and_alias(
@@ -74,19 +126,133 @@ def generate_stub_data(
         module_name = alias if alias else module.name
 
         module_dir = Path(out_path / module_id)
-        stubs_data.append((module_dir, module_name, module_text, False))
+        yield module_dir, module_name, module_text, False
+
+    yield from stubs_generator.create_reexport_module_strings(out_path=out_path)
 
-    reexport_module_data = stubs_generator.create_reexport_module_strings(out_path=out_path)
 
-    return stubs_data + reexport_module_data
+def _create_module_strings(
+    stubs_generator: StubsStringGenerator,
+    modules: list[Module],
+) -> Iterator[tuple[str, str, bool]]:
+    for module in modules:
+        log_msg = f"Creating stub data for {module.id}"
+        logging.info(log_msg)
+
+        yield stubs_generator(module)
+
+
+def _create_module_strings_in_parallel(
+    stubs_generator: StubsStringGenerator,
+    modules: list[Module],
+    workers: int,
+) -> Iterator[tuple[str, str, bool]]:
+    """Create the stub strings of the modules in worker processes and merge the results into the stubs generator.
+
+    The classes and functions that have to be created in reexport modules are added to the stubs generator in the same
+    order as they would be added by a single stubs generator, so the reexport modules don't depend on the number of
+    workers.
+    """
+    api = stubs_generator.api
+    convert_identifiers = stubs_generator.naming_convention == NamingConvention.SAFE_DS
+
+    # Smaller chunks distribute the work more evenly, larger ones reduce the communication overhead
+    chunk_size = max(len(modules) // (workers * 4), 1)
+    module_id_chunks = [
+        [module.id for module in modules[i : i + chunk_size]] for i in range(0, len(modules), chunk_size)
+    ]
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(api, convert_identifiers),
+    ) as executor:
+        # The results of the chunks are returned in order as soon as they are available
+        for worker_module_data, classes_outside_package, type_string_cache_stats in executor.map(
+            _create_module_strings_in_worker,
+            module_id_chunks,
+        ):
+            stubs_generator.classes_outside_package.update(classes_outside_package)
+            stubs_generator.type_string_cache_stats.hits += type_string_cache_stats.hits
+            stubs_generator.type_string_cache_stats.misses += type_string_cache_stats.misses
+
+            for module_id, module_text, package_info, has_content, reexported_nodes in worker_module_data:
+                log_msg = f"Created stub data for {module_id}"
+                logging.info(log_msg)
+
+                for reexport_module_id, is_class, node_id, node_name in reexported_nodes:
+                    node: Class | Function = api.classes[node_id] if is_class else api.functions[node_id]
+                    # The stubs generator of the worker changed the name to the alias of the reexport
+                    node.name = node_name
+                    stubs_generator.reexport_modules[reexport_module_id].append(node)
+
+                yield module_text, package_info, has_content
+
+
+def _init_worker(api: API, convert_identifiers: bool) -> None:
+    global _worker_stubs_generator  # noqa: PLW0603
+    _worker_stubs_generator = StubsStringGenerator(api=api, convert_identifiers=convert_identifiers)
+
+
+def _create_module_strings_in_worker(
+    module_ids: list[str],
+) -> tuple[list[_WorkerModuleData], set[str], TypeStringCacheStats]:
+    stubs_generator = _worker_stubs_generator
+    if stubs_generator is None:  # pragma: no cover
+        raise ValueError("The worker process was not initialized.")
+
+    stubs_generator.classes_outside_package = set()
+    stubs_generator.type_string_cache_stats = TypeStringCacheStats()
+
+    worker_module_data: list[_WorkerModuleData] = []
+    for module_id in module_ids:
+        stubs_generator.reexport_modules = defaultdict(list)
+        module_text, package_info, has_content = stubs_generator(stubs_generator.api.modules[module_id])
+
+        reexported_nodes = [
+            (reexport_module_id, isinstance(node, Class), node.id, node.name)
+            for reexport_module_id, nodes in stubs_generator.reexport_modules.items()
+            for node in nodes
+        ]
+        worker_module_data.append((module_id, module_text, package_info, has_content, reexported_nodes))
+
+    return worker_module_data, stubs_generator.classes_outside_package, stubs_generator.type_string_cache_stats
 
 
 def create_stub_files(
     stubs_generator: StubsStringGenerator,
-    stubs_data: list[tuple[Path, str, str, bool]],
+    stubs_data: Iterable[tuple[Path, str, str, bool]],
     out_path: Path,
-) -> None:
+    skip_unchanged: bool = False,
+) -> StubFileWriteStats:
+    """Create the stub files.
+
+    Each stub file is written as soon as its data is taken from `stubs_data`. The stub files of classes from outside the
+    package are created last, since they are only known after all modules were created.
+
+    Parameters
+    ----------
+    stubs_generator:
+        The class for generating the stubs.
+    stubs_data:
+        The stub data created by `generate_stub_data` or `iter_stub_data`.
+    out_path:
+        The path in which the stub files should be created.
+    skip_unchanged:
+        If True, stub files that already exist with the same content are not written again. The stub files of the
+        package are listed in the file "<package>__stub_files.txt" in the output directory, and the ones of the last run
+        that were not created again by this run are deleted. Stub files of other packages in the same output directory
+        are kept.
+
+    Returns
+    -------
+    write_stats:
+        The number of stub files that were left unchanged, updated, created and deleted.
+    """
     naming_convention = stubs_generator.naming_convention
+    write_stats = StubFileWriteStats()
+    written_file_paths: set[Path] = set()
+    package_file_paths: list[Path] = []
     # A "package module" is a module which is created though the reexported classes and functions in the __init__.py
     for module_dir, module_name, module_text, is_package_module in stubs_data:
         if is_package_module:
@@ -105,72 +271,167 @@ def create_stub_files(
         # Create and open module file
         public_module_name = module_name.lstrip("_")
         file_path = Path(corrected_module_dir / f"{public_module_name}.sdsstub")
+        written_file_paths.add(file_path.resolve())
+        package_file_paths.append(file_path.resolve())
+
+        _write_stub_file(file_path, module_text, skip_unchanged, write_stats)
+
+    # Group the classes outside the package by their module, so each module file is written once
+    outside_package_modules: dict[str, list[str]] = defaultdict(list)
+    for class_path in sorted(stubs_generator.classes_outside_package):
+        # There are cases where we could not correctly parse or find the origin of a variable, which is then put into
+        #  the imports. But since these variables have no qname and only consist of a name we cannot create seperate
+        #  files for them.
+        #  E.g.: `x: numpy.some_class; ...; return x` would have the result type parsed as just "numpy"
+        if "." not in class_path:  # pragma: no cover
+            continue
 
-        with file_path.open("w+", encoding="utf-8") as f:
-            f.write(module_text)
+        python_module_path, class_name = class_path.rsplit(".", maxsplit=1)
+        outside_package_modules[python_module_path].append(class_name)
+
+    for python_module_path, class_names in sorted(outside_package_modules.items()):
+        file_path = _create_outside_package_module(
+            python_module_path,
+            class_names,
+            out_path,
+            naming_convention,
+            skip_unchanged,
+            written_file_paths,
+            write_stats,
+        )
+        written_file_paths.add(file_path.resolve())
+
+    if skip_unchanged:
+        stub_files_list_path = Path(out_path / f"{stubs_generator.api.package}__stub_files.txt")
+        resolved_out_path = out_path.resolve()
+
+        # Remove the stub files of modules of the package that no longer exist
+        for file_path in _read_stub_files_list(stub_files_list_path, out_path):
+            if file_path.resolve() not in written_file_paths and file_path.is_file():
+                log_msg = f"Deleting outdated stub file {file_path}"
+                logging.info(log_msg)
+
+                file_path.unlink()
+                write_stats.deleted += 1
+
+        _write_stub_file(
+            stub_files_list_path,
+            "".join(f"{file_path.relative_to(resolved_out_path).as_posix()}\n" for file_path in package_file_paths),
+            skip_unchanged,
+            None,
+        )
 
-    created_module_paths: set[str] = set()
-    classes_outside_package = list(stubs_generator.classes_outside_package)
-    classes_outside_package.sort()
-    for class_ in classes_outside_package:
-        created_module_paths = _create_outside_package_class(class_, out_path, naming_convention, created_module_paths)
+    return write_stats
 
 
-def _create_outside_package_class(
-    class_path: str,
+def _read_stub_files_list(stub_files_list_path: Path, out_path: Path) -> list[Path]:
+    """Read the paths of the stub files of the package that were created by the last run."""
+    if not stub_files_list_path.is_file():
+        return []
+
+    return [
+        Path(out_path / line)
+        for line in stub_files_list_path.read_text(encoding="utf-8").splitlines()
+        if line and line.endswith(".sdsstub")
+    ]
+
+
+def _write_stub_file(
+    file_path: Path,
+    text: str,
+    skip_unchanged: bool,
+    write_stats: StubFileWriteStats | None,
+    existing_text: str | None = None,
+) -> None:
+    """Write a stub file and count it in the write stats, if they are given.
+
+    The text is written into a temporary file first, which then replaces the stub file. This way an interrupted run
+    never leaves a half-written stub file behind. If the caller already read the existing stub file, its text can be
+    passed, so that the file is not read again.
+    """
+    if existing_text is not None or file_path.is_file():
+        if skip_unchanged and existing_text is None:
+            existing_text = file_path.read_text(encoding="utf-8")
+
+        if skip_unchanged and existing_text == text:
+            log_msg = f"Skipping unchanged stub file {file_path}"
+            logging.info(log_msg)
+
+            if write_stats is not None:
+                write_stats.unchanged += 1
+            return
+
+        if write_stats is not None:
+            write_stats.updated += 1
+    elif write_stats is not None:
+        write_stats.created += 1
+
+    tmp_file_path = file_path.with_name(f".{file_path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp_file_path.open("w", encoding="utf-8") as f:
+            f.write(text)
+        tmp_file_path.replace(file_path)
+    except BaseException:
+        tmp_file_path.unlink(missing_ok=True)
+        raise
+
+
+def _create_outside_package_module(
+    python_module_path: str,
+    class_names: list[str],
     out_path: Path,
     naming_convention: NamingConvention,
-    created_module_paths: set[str],
-) -> set[str]:
-    """Create imported classes from outside the package.
+    skip_unchanged: bool,
+    written_file_paths: set[Path],
+    write_stats: StubFileWriteStats,
+) -> Path:
+    """Create the stub file of a module outside the package with the imported classes of this module.
 
     If classes of functions from outside the analyzed package are used, like e.g. `import math`, these classes and
     functions will be created as stubs outside the actual package we analyze.
     """
-    path_parts = class_path.split(".")
-
-    # There are cases where we could not correctly parse or find the origin of a variable, which is then put into
-    #  the imports. But since these variables have no qname and only consist of a name we cannot create seperate files
-    #  for them.
-    #  E.g.: `x: numpy.some_class; ...; return x` would have the result type parsed as just "numpy"
-    if len(path_parts) == 1:  # pragma: no cover
-        return created_module_paths
-
-    class_name = path_parts.pop(-1)
-    module_name = path_parts[-1]
-    module_path = "/".join(path_parts)
-
-    module_dir = Path(out_path / module_path)
+    module_dir = Path(out_path / python_module_path.replace(".", "/"))
     module_dir.mkdir(parents=True, exist_ok=True)
 
+    module_name = python_module_path.rsplit(".", maxsplit=1)[-1]
     file_path = Path(module_dir / f"{module_name}.sdsstub")
 
-    if Path.exists(file_path):
-        text = _create_outside_package_class_text(class_name, naming_convention)
-
-        with file_path.open("r", encoding="utf-8") as f:
-            content = f.read()
-
-        if text not in content:
-            with file_path.open("a", encoding="utf-8") as f:
-                f.write(text)
+    # If a stub file already exists at this path, e.g. of the package or of an earlier run, the classes are added to it
+    file_exists = file_path.is_file()
+    if file_exists:
+        module_text = file_path.read_text(encoding="utf-8")
     else:
-        with file_path.open("w+", encoding="utf-8") as f:
-            module_text = ""
-
-            # package name & annotation
-            python_module_path = ".".join(path_parts)
-            module_path_camel_case = _convert_name_to_convention(python_module_path, naming_convention)
-            module_name_info = ""
-            if python_module_path != module_path_camel_case:
-                module_text += f'@PythonModule("{python_module_path}")\n'
-            module_text += f"{module_name_info}package {module_path_camel_case}\n"
-
-            module_text += _create_outside_package_class_text(class_name, naming_convention)
-
-            f.write(module_text)
-
-    return created_module_paths
+        # package name & annotation
+        module_path_camel_case = _convert_name_to_convention(python_module_path, naming_convention)
+        module_text = ""
+        if python_module_path != module_path_camel_case:
+            module_text = f'@PythonModule("{python_module_path}")\n'
+        module_text += f"package {module_path_camel_case}\n"
+
+    class_texts = []
+    for class_name in class_names:
+        class_text = _create_outside_package_class_text(class_name, naming_convention)
+        if class_text not in module_text:
+            class_texts.append(class_text)
+
+    # The stub files of the package were already counted in the write stats
+    is_package_stub_file = file_path.resolve() in written_file_paths
+    if file_exists and not class_texts:
+        if not is_package_stub_file:
+            write_stats.unchanged += 1
+        return file_path
+
+    log_msg = f"Creating stub file for {python_module_path}"
+    logging.info(log_msg)
+
+    _write_stub_file(
+        file_path,
+        module_text + "".join(class_texts),
+        skip_unchanged,
+        None if is_package_stub_file else write_stats,
+        existing_text=module_text if file_exists else None,
+    )
+    return file_path
 
 
 def _create_outside_package_class_text(class_name: str, naming_convention: NamingConvention) -> str:
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING
 from safeds_stubgen._helpers import get_reexported_by
 
 if TYPE_CHECKING:
-    from safeds_stubgen.api_analyzer import Module
+    from safeds_stubgen.api_analyzer import ReexportIndex
 
 INDENTATION = "    "
 
@@ -16,6 +16,29 @@ class NamingConvention(IntEnum):
     SAFE_DS = 2
 
 
+class _TextBuilder:
+    """Collect the parts of a text and join them once at the end, instead of concatenating the text part by part.
+
+    The builder also remembers if any non-empty part was added, so the caller can check if the text has content without
+    building or parsing it.
+    """
+
+    __slots__ = ("_parts", "has_content")
+
+    def __init__(self) -> None:
+        self._parts: list[str] = []
+        self.has_content: bool = False
+
+    def append(self, *parts: str) -> None:
+        for part in parts:
+            if part:
+                self._parts.append(part)
+                self.has_content = True
+
+    def build(self) -> str:
+        return "".join(self._parts)
+
+
 def _convert_name_to_convention(
     name: str,
     naming_convention: NamingConvention,
@@ -45,7 +68,7 @@ def _convert_name_to_convention(
 
 
 def _get_shortest_public_reexport_and_alias(
-    reexport_map: dict[str, set[Module]],
+    reexport_map: ReexportIndex,
     name: str,
     qname: str,
     is_module: bool,
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 from collections import defaultdict
+from dataclasses import dataclass
 from pathlib import Path
 from types import NoneType
 from typing import TYPE_CHECKING
@@ -9,15 +10,27 @@ from typing import TYPE_CHECKING
 from safeds_stubgen import is_internal
 from safeds_stubgen.api_analyzer import (
     API,
+    AbstractType,
     Attribute,
+    CallableType,
     Class,
+    DictType,
     Enum,
+    FinalType,
     Function,
+    ListType,
+    LiteralType,
     Module,
+    NamedSequenceType,
+    NamedType,
     Parameter,
     ParameterAssignment,
     Result,
+    SetType,
+    TupleType,
+    TypeVarType,
     UnionType,
+    UnknownType,
     UnknownValue,
     VarianceKind,
     result_name_generator,
@@ -27,6 +40,7 @@ from safeds_stubgen.docstring_parsing import AttributeDocstring
 from ._helper import (
     INDENTATION,
     NamingConvention,
+    _TextBuilder,
     _convert_name_to_convention,
     _create_name_annotation,
     _get_shortest_public_reexport_and_alias,
@@ -35,9 +49,29 @@ from ._helper import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from safeds_stubgen.docstring_parsing import ClassDocstring, FunctionDocstring
 
 
+@dataclass
+class TypeStringCacheStats:
+    """The number of cache hits and misses of the type strings of a stubs generator, e.g. for profiling."""
+
+    hits: int = 0
+    misses: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class _CachedTypeString:
+    # The type is kept to make sure that its ID isn't reused by another type
+    type_: AbstractType
+    type_string: str
+    # The resolved imports of the type, as tuples of the qualified name and if it's a class of the package
+    imports: tuple[tuple[str, bool], ...]
+    todo_msgs: frozenset[str]
+
+
 class StubsStringGenerator:
     """Generate Safe-DS stub strings.
 
@@ -50,19 +84,25 @@ class StubsStringGenerator:
         self.class_generics: list = []
         self.module_imports: set[str] = set()
         self.currently_creating_reexport_data: bool = False
+        self.reexport_module_id: str = ""
+        self._current_todo_msgs: set[str] = set()
+        # The rendered type strings of the current module and the imports that are recorded while rendering a type
+        self._type_strings: dict[int, _CachedTypeString] = {}
+        self._type_imports: list[tuple[str, bool]] | None = None
+        self.type_string_cache_stats = TypeStringCacheStats()
 
         self.api = api
         self.naming_convention = NamingConvention.SAFE_DS if convert_identifiers else NamingConvention.PYTHON
         self.classes_outside_package: set[str] = set()
         self.reexport_modules: dict[str, list[Class | Function]] = defaultdict(list)
 
-    def __call__(self, module: Module) -> tuple[str, str]:
+    def __call__(self, module: Module) -> tuple[str, str, bool]:
         self._set_module_id(module.id)
         self.reexport_module_id = ""
         self.class_generics = []
         self.module_imports = set()
 
-        self._current_todo_msgs: set[str] = set()
+        self._current_todo_msgs = set()
         return self._create_module_string(module)
 
     def create_reexport_module_strings(self, out_path: Path) -> list[tuple[Path, str, str, bool]]:
@@ -111,8 +151,13 @@ class StubsStringGenerator:
 
         return module_data
 
-    def _create_module_string(self, module: Module) -> tuple[str, str]:
-        module_text = ""
+    def _create_module_string(self, module: Module) -> tuple[str, str, bool]:
+        """Create the text of a stub module.
+
+        Returns the module text, the package info and if the module has any classes, functions or enums. Modules
+        without them only consist of the package info and don't have to be created.
+        """
+        module_text = _TextBuilder()
 
         # Create package info
         package_info, _ = _get_shortest_public_reexport_and_alias(
@@ -147,23 +192,23 @@ class StubsStringGenerator:
                     in_reexport_module=in_reexport_module,
                 )
                 if function_string:
-                    module_text += f"\n{function_string}\n"
+                    module_text.append("\n", function_string, "\n")
 
         # Create classes, class attr. & class methods
         for class_ in module.classes:
             if class_.is_public and not class_.inherits_from_exception:
                 class_string = self._create_class_string(class_=class_, in_reexport_module=in_reexport_module)
                 if class_string:
-                    module_text += f"\n{class_string}\n"
+                    module_text.append("\n", class_string, "\n")
 
         # Create enums & enum instances
         for enum in module.enums:
-            module_text += f"\n{self._create_enum_string(enum)}\n"
+            module_text.append("\n", self._create_enum_string(enum), "\n")
 
         # Create imports - We have to create them last, since we have to check all used types in this module first
         module_header += self._create_imports_string()
 
-        return f"{docstring}{module_header}{module_text}", package_info
+        return f"{docstring}{module_header}{module_text.build()}", package_info, module_text.has_content
 
     def _create_imports_string(self) -> str:
         if not self.module_imports:
@@ -231,7 +276,7 @@ class StubsStringGenerator:
 
                 variance_item = f"{variance_direction}{variance_name_camel_case}"
                 if variance.type is not None:
-                    variance_item = f"{variance_item} sub {self._create_type_string(variance.type.to_dict())}"
+                    variance_item = f"{variance_item} sub {self._create_type_string(variance.type)}"
                 self.class_generics.append(variance_item)
 
             if constructor_type_vars:
@@ -254,7 +299,12 @@ class StubsStringGenerator:
         class_signature_todo = self._create_todo_msg(class_indentation)
 
         # Attributes
-        class_text, added_class_attributes = self._create_class_attribute_string(class_.attributes, inner_indentations)
+        class_text = _TextBuilder()
+        attribute_text, added_class_attributes = self._create_class_attribute_string(
+            class_.attributes,
+            inner_indentations,
+        )
+        class_text.append(attribute_text)
 
         # Inner classes
         for inner_class in class_.classes:
@@ -266,7 +316,7 @@ class StubsStringGenerator:
                     class_indentation=inner_indentations,
                     in_reexport_module=True,
                 )
-                class_text += f"\n{class_string}\n"
+                class_text.append("\n", class_string, "\n")
 
         # Methods
         class_method_text, added_class_methods = self._create_class_method_string(class_.methods, inner_indentations)
@@ -275,7 +325,7 @@ class StubsStringGenerator:
         already_defined_names: set[str] = added_class_attributes.union(added_class_methods)
         superclasses = class_.superclasses
         superclass_info = ""
-        superclass_methods_text = ""
+        superclass_methods_text = _TextBuilder()
         superclass_names = []
         if superclasses and not class_.is_abstract:
             for superclass in superclasses:
@@ -287,10 +337,11 @@ class StubsStringGenerator:
                     superclass_names.append(superclass_name)
                 else:
                     # For internal superclasses, we have to add their public members to subclasses.
-                    superclass_methods_text += self._create_internal_class_string(
+                    self._create_internal_class_string(
                         superclass=superclass,
                         inner_indentations=inner_indentations,
                         already_defined_names=already_defined_names,
+                        text=superclass_methods_text,
                     )
 
             superclass_info = f" sub {', '.join(superclass_names)}" if superclass_names else ""
@@ -308,22 +359,22 @@ class StubsStringGenerator:
         )
 
         # Superclass methods, if the superclass is an internal class
-        class_text += superclass_methods_text
+        class_text.append(superclass_methods_text.build())
 
         # Add the methods text (so it's after the superclass methods text)
-        class_text += class_method_text
+        class_text.append(class_method_text)
 
         # Docstring
         docstring = self._create_sds_docstring(class_.docstring, class_indentation, node=class_)
 
         # If the does not have a body, we just return the docstring and signature line
-        if not class_text:
+        if not class_text.has_content:
             return docstring + class_signature
 
         # Close class
-        class_text += f"{class_indentation}}}"
+        class_text.append(class_indentation, "}")
 
-        return f"{docstring}{class_signature} {{{class_text}"
+        return f"{docstring}{class_signature} {{{class_text.build()}"
 
     def _create_class_method_string(
         self,
@@ -378,13 +429,10 @@ class StubsStringGenerator:
             if not attribute.is_public:
                 continue
 
-            attribute_type = None
-            if attribute.type:
-                attribute_type = attribute.type.to_dict()
-
-                # Don't create TypeVar attributes
-                if attribute_type["kind"] == "TypeVarType":
-                    continue
+            attribute_type = attribute.type
+            # Don't create TypeVar attributes
+            if isinstance(attribute_type, TypeVarType):
+                continue
 
             static_string = "static " if attribute.is_static else ""
 
@@ -402,7 +450,7 @@ class StubsStringGenerator:
             # Create type information
             attr_docstring: AttributeDocstring = attribute.docstring
             if attribute_type is None and attr_docstring and attr_docstring.type:
-                attribute_type = attr_docstring.type.to_dict()
+                attribute_type = attr_docstring.type
 
             attr_type = self._create_type_string(attribute_type)
             type_string = f": {attr_type}" if attr_type else ""
@@ -465,7 +513,7 @@ class StubsStringGenerator:
                 # We don't have to display generic types in methods if they were already displayed in the class
                 if not is_method or (is_method and type_var_name not in self.class_generics):
                     if type_var.upper_bound is not None:
-                        type_var_name += f" sub {self._create_type_string(type_var.upper_bound.to_dict())}"
+                        type_var_name += f" sub {self._create_type_string(type_var.upper_bound)}"
                     type_var_names.append(type_var_name)
 
             if type_var_names:
@@ -516,9 +564,7 @@ class StubsStringGenerator:
 
         # Create type information
         result_types = [result.type for result in function.results if result.type is not None]
-        result_union = UnionType(types=result_types)
-        types_data = result_union.to_dict()
-        property_type = self._create_type_string(types_data)
+        property_type = self._create_type_string(UnionType(types=result_types))
         type_string = f": {property_type}" if property_type else ""
 
         return (
@@ -534,12 +580,10 @@ class StubsStringGenerator:
             if result.type is None:  # pragma: no cover
                 continue
 
-            result_type = result.type.to_dict()
-
-            if result_type["kind"] == "NamedType" and result_type["qname"] == "builtins.None":
+            if isinstance(result.type, NamedType) and result.type.qname == "builtins.None":
                 return ""
 
-            ret_type = self._create_type_string(result_type)
+            ret_type = self._create_type_string(result.type)
             type_string = f": {ret_type}" if ret_type else ""
             result_name = _name_convention_and_keyword_check(result.name, self.naming_convention)
             if type_string:
@@ -575,7 +619,7 @@ class StubsStringGenerator:
             # Parameter type
             if parameter.type is not None:
                 param_default_value = parameter.default_value
-                parameter_type_data = parameter.type.to_dict()
+                parameter_type = parameter.type
 
                 # Default value
                 if parameter.is_optional:
@@ -602,11 +646,11 @@ class StubsStringGenerator:
 
                 # Mypy assignes *args parameters the tuple type, which is not supported in Safe-DS. Therefor we
                 # overwrite it and set the type to a list.
-                if assigned_by == ParameterAssignment.POSITIONAL_VARARG and parameter_type_data["kind"] == "TupleType":
-                    parameter_type_data["kind"] = "ListType"
+                if assigned_by == ParameterAssignment.POSITIONAL_VARARG and isinstance(parameter_type, TupleType):
+                    parameter_type = ListType(types=parameter_type.types)
 
                 # Parameter type
-                param_type = self._create_type_string(parameter_type_data)
+                param_type = self._create_type_string(parameter_type)
                 type_string = f": {param_type}" if param_type else ""
             else:
                 self._current_todo_msgs.add("param without type")
@@ -678,15 +722,50 @@ class StubsStringGenerator:
 
         return enum_signature
 
-    def _create_type_string(self, type_data: dict | None) -> str:
-        """Create a SafeDS stubs type string."""
-        if type_data is None:
+    def _create_type_string(self, type_: AbstractType | None) -> str:
+        """Create a SafeDS stubs type string.
+
+        The type strings are cached per module, together with the imports and TODO messages they need, which are added
+        again for each cache hit. Types are cached by their identity, since equal types can have different type strings,
+        e.g. tuples with the same types in another order.
+        """
+        if type_ is None:
             return ""
 
+        cached_type_string = self._type_strings.get(id(type_), None)
+        if cached_type_string is not None and cached_type_string.type_ is type_:
+            self.type_string_cache_stats.hits += 1
+            for qname, in_package in cached_type_string.imports:
+                self._add_resolved_import(qname, in_package)
+            self._current_todo_msgs.update(cached_type_string.todo_msgs)
+            return cached_type_string.type_string
+
+        self.type_string_cache_stats.misses += 1
+        outer_type_imports, outer_todo_msgs = self._type_imports, self._current_todo_msgs
+        self._type_imports, self._current_todo_msgs = [], set()
+        try:
+            type_string = self._render_type_string(type_)
+        finally:
+            type_imports, todo_msgs = self._type_imports, self._current_todo_msgs
+            self._type_imports, self._current_todo_msgs = outer_type_imports, outer_todo_msgs
+            if self._type_imports is not None:
+                self._type_imports.extend(type_imports)
+            self._current_todo_msgs.update(todo_msgs)
+
+        # Whether an internal class gets a TODO message depends on the imports that were added to the module before
+        if "internal class as type" not in todo_msgs:
+            self._type_strings[id(type_)] = _CachedTypeString(
+                type_=type_,
+                type_string=type_string,
+                imports=tuple(type_imports),
+                todo_msgs=frozenset(todo_msgs),
+            )
+        return type_string
+
+    def _render_type_string(self, type_: AbstractType) -> str:
         none_type_name = "Nothing?"
-        kind = type_data["kind"]
-        if kind == "NamedType":
-            name = type_data["name"]
+        if isinstance(type_, NamedType):
+            name = type_.name
             match name:
                 case "int":
                     return "Int"
@@ -699,104 +778,95 @@ class StubsStringGenerator:
                 case "None":
                     return none_type_name
                 case _:
-                    self._add_to_imports(type_data["qname"])
+                    self._add_to_imports(type_.qname)
 
                     # inner classes that are private should not be used as types, therefore we add a TOD0
-                    if name[0] == "_" and type_data["qname"] not in self.module_imports:
+                    if name[0] == "_" and type_.qname not in self.module_imports:
                         self._current_todo_msgs.add("internal class as type")
 
                     return _name_convention_and_keyword_check(name, self.naming_convention)
-        elif kind == "FinalType":
-            return self._create_type_string(type_data["type"])
-        elif kind == "CallableType":
+        elif isinstance(type_, FinalType):
+            return self._create_type_string(type_.type_)
+        elif isinstance(type_, CallableType):
             params = [
                 (
                     f"{_convert_name_to_convention('param_' + str(i + 1), self.naming_convention)}: "
                     f"{self._create_type_string(parameter_type)}"
                 )
-                for i, parameter_type in enumerate(type_data["parameter_types"])
+                for i, parameter_type in enumerate(type_.parameter_types)
             ]
 
-            return_type = type_data["return_type"]
-            if return_type["kind"] == "TupleType":
+            return_type = type_.return_type
+            if isinstance(return_type, TupleType):
                 return_types = [
                     (
                         f"{_convert_name_to_convention('result_' + str(i+1), self.naming_convention)}: "
-                        f"{self._create_type_string(type_)}"
+                        f"{self._create_type_string(result_type)}"
                     )
-                    for i, type_ in enumerate(return_type["types"])
+                    for i, result_type in enumerate(return_type.types)
                 ]
                 return_type_string = f"({', '.join(return_types)})"
-            elif return_type["kind"] == "NamedType" and return_type["name"] == "None":
+            elif isinstance(return_type, NamedType) and return_type.name == "None":
                 return f"({', '.join(params)}) -> ()"
             else:
                 result_name = _convert_name_to_convention("result_1", self.naming_convention)
                 return_type_string = f"{result_name}: {self._create_type_string(return_type)}"
 
             return f"({', '.join(params)}) -> {return_type_string}"
-        elif kind in {"SetType", "ListType", "NamedSequenceType"}:
-            types = [self._create_type_string(type_) for type_ in type_data["types"]]
+        elif isinstance(type_, SetType | ListType | NamedSequenceType):
+            types = [self._create_type_string(element_type) for element_type in type_.types]
 
-            # Cut out the "Type" in the kind name
-            name = kind[0:-4]
-
-            if name == "Set":
+            if isinstance(type_, SetType):
+                name = "Set"
                 self._current_todo_msgs.add("no set support")
-            elif name == "NamedSequence":
-                name = type_data["name"]
+            elif isinstance(type_, ListType):
+                name = "List"
+            else:
+                name = type_.name
 
             if types:
                 if len(types) >= 2 and name in {"Set", "List"}:
                     self._current_todo_msgs.add(name)
                 return f"{name}<{', '.join(types)}>"
             return f"{name}<Any>"
-        elif kind == "UnknownType":  # pragma: no cover
+        elif isinstance(type_, UnknownType):  # pragma: no cover
             self._current_todo_msgs.add("unknown")
             return "unknown"
-        elif kind == "UnionType":
+        elif isinstance(type_, UnionType):
             # In Mypy LiteralTypes are getting seperated into unions of LiteralTypes,
             # and we have to join them for the stubs.
-            literal_data = []
-            other_type_data = []
+            literal_types: list[LiteralType] = []
+            other_types: list[AbstractType] = []
             has_named_type = False
-            for type_information in type_data["types"]:
-                if type_information["kind"] == "LiteralType":
-                    literal_data.append(type_information)
+            for union_type in type_.types:
+                if isinstance(union_type, LiteralType):
+                    literal_types.append(union_type)
                 else:
-                    other_type_data.append(type_information)
+                    other_types.append(union_type)
 
-                if type_information["kind"] in {"NamedType", "TupleType", "ListType", "SetType", "DictType"} and not (
-                    type_information["kind"] == "NamedType" and type_information["qname"] == "builtins.None"
+                if isinstance(union_type, TupleType | ListType | SetType | DictType) or (
+                    isinstance(union_type, NamedType) and union_type.qname != "builtins.None"
                 ):
                     has_named_type = True
 
-            if len(literal_data) >= 2:
-                all_literals = [literal_type for literal in literal_data for literal_type in literal["literals"]]
+            union_types = list(type_.types)
+            if len(literal_types) >= 2:
+                all_literals = [literal for literal_type in literal_types for literal in literal_type.literals]
 
-                # We overwrite the old types of the union with the joined literal types
-                type_data["types"] = other_type_data
-                type_data["types"].append(
-                    {
-                        "kind": "LiteralType",
-                        "literals": all_literals,
-                    },
-                )
+                # We replace the old types of the union with the joined literal types
+                union_types = [*other_types, LiteralType(literals=all_literals)]
 
-            if len(type_data["types"]) == 2 and literal_data:
+            if len(union_types) == 2 and literal_types:
                 # If we have a LiteralType and a None we combine them to a "Literal[..., null]"
-                has_none = (type_data["types"][0]["kind"] == "NamedType" and type_data["types"][0]["kind"]) or (
-                    type_data["types"][1]["kind"] == "NamedType" and type_data["types"][1]["kind"]
-                )
+                has_none = isinstance(union_types[0], NamedType) or isinstance(union_types[1], NamedType)
                 if has_none:
-                    _types = type_data["types"]
-                    literal_type_data = _types[0] if _types[0]["kind"] == "LiteralType" else _types[1]
-
-                    literal_type_data["literals"].append(None)
-                    return self._create_type_string(literal_type_data)
+                    literal_type = union_types[0] if isinstance(union_types[0], LiteralType) else union_types[1]
+                    if isinstance(literal_type, LiteralType):
+                        return self._create_literal_type_string([*literal_type.literals, None])
 
             # Union items have to be unique, therefore we use sets. But the types set has to be a sorted list, since
             # otherwise the snapshot tests would fail b/c element order in sets is non-deterministic.
-            types = list({self._create_type_string(type_) for type_ in type_data["types"]})
+            types = list({self._create_type_string(union_type) for union_type in union_types})
             types.sort()
 
             if types:
@@ -819,45 +889,51 @@ class StubsStringGenerator:
 
                 return f"union<{', '.join(types)}>"
             return ""
-        elif kind == "TupleType":
+        elif isinstance(type_, TupleType):
             self._current_todo_msgs.add("no tuple support")
-            types = [self._create_type_string(type_) for type_ in type_data["types"]]
+            types = [self._create_type_string(element_type) for element_type in type_.types]
 
             return f"Tuple<{', '.join(types)}>"
-        elif kind == "DictType":
-            key_data = self._create_type_string(type_data["key_type"])
-            value_data = self._create_type_string(type_data["value_type"])
+        elif isinstance(type_, DictType):
+            key_data = self._create_type_string(type_.key_type)
+            value_data = self._create_type_string(type_.value_type)
             return f"Map<{key_data}, {value_data}>"
-        elif kind == "LiteralType":
-            types = []
-            for literal_type in type_data["literals"]:
-                if isinstance(literal_type, str):
-                    types.append(f'"{literal_type}"')
-                elif isinstance(literal_type, bool):
-                    if literal_type:
-                        types.append("true")
-                    else:
-                        types.append("false")
-                elif isinstance(literal_type, NoneType):
-                    types.append("null")
-                else:
-                    types.append(f"{literal_type}")
-            return f"literal<{', '.join(types)}>"
-        elif kind == "TypeVarType":
-            return _name_convention_and_keyword_check(type_data["name"], self.naming_convention)
+        elif isinstance(type_, LiteralType):
+            return self._create_literal_type_string(type_.literals)
+        elif isinstance(type_, TypeVarType):
+            return _name_convention_and_keyword_check(type_.name, self.naming_convention)
 
-        raise ValueError(f"Unexpected type: {kind}")  # pragma: no cover
+        raise ValueError(f"Unexpected type: {type_.__class__.__name__}")  # pragma: no cover
+
+    @staticmethod
+    def _create_literal_type_string(literals: Sequence[str | int | float | bool | None]) -> str:
+        types = []
+        for literal_type in literals:
+            if isinstance(literal_type, str):
+                types.append(f'"{literal_type}"')
+            elif isinstance(literal_type, bool):
+                if literal_type:
+                    types.append("true")
+                else:
+                    types.append("false")
+            elif isinstance(literal_type, NoneType):
+                types.append("null")
+            else:
+                types.append(f"{literal_type}")
+        return f"literal<{', '.join(types)}>"
 
     def _create_internal_class_string(
         self,
         superclass: str,
         inner_indentations: str,
         already_defined_names: set[str],
-    ) -> str:
+        text: _TextBuilder,
+    ) -> None:
+        """Add the public members of an internal superclass and its internal superclasses to the text of a class."""
         superclass_class = self._get_class_in_package(superclass)
 
         if superclass_class is None:  # pragma: no cover
-            return ""
+            return
 
         # Methods
         superclass_methods_text, existing_names = self._create_class_method_string(
@@ -866,6 +942,7 @@ class StubsStringGenerator:
             is_internal_class=True,
             already_defined_names=already_defined_names,
         )
+        text.append(superclass_methods_text)
 
         # Inner classes
         for inner_class in superclass_class.classes:
@@ -875,7 +952,7 @@ class StubsStringGenerator:
                     class_indentation=inner_indentations,
                     in_reexport_module=True,
                 )
-                superclass_methods_text += f"\n{class_string}\n"
+                text.append("\n", class_string, "\n")
 
         already_defined_names = already_defined_names.union(existing_names)
 
@@ -886,14 +963,13 @@ class StubsStringGenerator:
 
             name = superclass_superclass.split(".")[-1]
             if is_internal(name):
-                superclass_methods_text += self._create_internal_class_string(
+                self._create_internal_class_string(
                     superclass_superclass,
                     inner_indentations,
                     already_defined_names,
+                    text,
                 )
 
-        return superclass_methods_text
-
     def _create_sds_docstring_description(self, description: str, indentations: str) -> str:
         if not description:
             return ""
@@ -907,15 +983,16 @@ class StubsStringGenerator:
         indentations: str,
         node: Class | Function | None = None,
     ) -> str:
-        full_docstring = ""
+        full_docstring = _TextBuilder()
 
         # Description
         if docstring.description:
-            full_docstring = f"{indentations} * "
-            full_docstring += self._create_docstring_description_part(docstring.description, indentations)
+            full_docstring.append(
+                f"{indentations} * ",
+                self._create_docstring_description_part(docstring.description, indentations),
+            )
 
         # Parameters
-        full_parameter_docstring = ""
         if node is not None:
             parameters = []
             if isinstance(node, Class):
@@ -924,29 +1001,26 @@ class StubsStringGenerator:
             else:
                 parameters = node.parameters
 
-            if parameters:
-                parameter_docstrings = []
-                for parameter in parameters:
-                    param_desc = parameter.docstring.description
-                    if not param_desc:
-                        continue
-
-                    param_desc = self._create_docstring_description_part(param_desc, indentations)
+            parameter_docstrings = []
+            for parameter in parameters:
+                param_desc = parameter.docstring.description
+                if not param_desc:
+                    continue
 
-                    parameter_name = _convert_name_to_convention(parameter.name, self.naming_convention)
-                    parameter_docstrings.append(f"{indentations} * @param {parameter_name} {param_desc}")
+                param_desc = self._create_docstring_description_part(param_desc, indentations)
 
-                full_parameter_docstring = "".join(parameter_docstrings)
+                parameter_name = _convert_name_to_convention(parameter.name, self.naming_convention)
+                parameter_docstrings.append(f"{indentations} * @param {parameter_name} {param_desc}")
 
-                if full_parameter_docstring and full_docstring:
-                    full_parameter_docstring = f"{indentations} *\n{full_parameter_docstring}"
-        full_docstring += full_parameter_docstring
+            if parameter_docstrings and full_docstring.has_content:
+                full_docstring.append(f"{indentations} *\n")
+            full_docstring.append(*parameter_docstrings)
 
         # Results
-        full_result_docstring = ""
         if isinstance(node, Function):
             name_generator = result_name_generator()
 
+            result_docstrings = []
             for result_docstring in node.result_docstrings:
                 result_desc = result_docstring.description
                 if result_desc:
@@ -955,36 +1029,33 @@ class StubsStringGenerator:
                     result_name = result_docstring.name if result_docstring.name else next(name_generator)
                     result_name = _convert_name_to_convention(result_name, self.naming_convention)
 
-                    full_result_docstring += f"{indentations} * @result {result_name} {result_desc}\n"
+                    result_docstrings.append(f"{indentations} * @result {result_name} {result_desc}\n")
 
-            if full_result_docstring and full_docstring:
-                full_result_docstring = f"{indentations} *\n{full_result_docstring}"
-        full_docstring += full_result_docstring
+            if result_docstrings and full_docstring.has_content:
+                full_docstring.append(f"{indentations} *\n")
+            full_docstring.append(*result_docstrings)
 
         # Example
         example_docstrings = []
         if not isinstance(docstring, AttributeDocstring) and docstring.examples:
             for example in docstring.examples:
-                example_text = f"{indentations} * @example\n{indentations} * pipeline example {{\n"
+                example_lines = [f"{indentations} * @example\n{indentations} * pipeline example {{\n"]
                 for example_part in example.split("\n"):
                     if example_part.startswith(">>>"):
-                        example_text += f"{indentations} *     {example_part.replace('>>>', '//')}\n"
+                        example_lines.append(f"{indentations} *     {example_part.replace('>>>', '//')}\n")
                     elif example_part.startswith("..."):
-                        example_text += f"{indentations} *     {example_part.replace('...', '//')}\n"
-                example_text += f"{indentations} * }}\n"
-                example_docstrings.append(example_text)
+                        example_lines.append(f"{indentations} *     {example_part.replace('...', '//')}\n")
+                example_lines.append(f"{indentations} * }}\n")
+                example_docstrings.append("".join(example_lines))
 
-        if full_docstring and example_docstrings:
-            full_docstring += f"{indentations} *\n"
-
-        example_docstring = f"{indentations} *\n".join(example_docstrings)
-        full_docstring += example_docstring
+        if example_docstrings and full_docstring.has_content:
+            full_docstring.append(f"{indentations} *\n")
+        full_docstring.append(f"{indentations} *\n".join(example_docstrings))
 
         # Open and close the docstring
-        if full_docstring:
-            full_docstring = f"{indentations}/**\n{full_docstring}{indentations} */\n"
-
-        return full_docstring
+        if not full_docstring.has_content:
+            return ""
+        return f"{indentations}/**\n{full_docstring.build()}{indentations} */\n"
 
     # ############################### Utilities ############################### #
 
@@ -1017,16 +1088,15 @@ class StubsStringGenerator:
 
         name = path.split("/")[-1]
         class_name = class_path.split("/")[-1]
-        for reexport in self.api.reexport_map:
-            if reexport.endswith(name):
-                for module in self.api.reexport_map[reexport]:
-                    # Added "no cover" since I can't recreate this in the tests
-                    if (
-                        path.startswith(module.id)
-                        and class_path.startswith(module.id)
-                        and path.lstrip(module.id).lstrip("/") == name == class_name
-                    ):  # pragma: no cover
-                        return True
+        for reexport in self.api.reexport_map.names_ending_with(name):
+            for module in self.api.reexport_map[reexport]:
+                # Added "no cover" since I can't recreate this in the tests
+                if (
+                    path.startswith(module.id)
+                    and class_path.startswith(module.id)
+                    and path.lstrip(module.id).lstrip("/") == name == class_name
+                ):  # pragma: no cover
+                    return True
 
         return False
 
@@ -1052,7 +1122,8 @@ class StubsStringGenerator:
             import_qname_path = import_qname.replace(".", "/")
             in_package = False
             qname = ""
-            for class_id in self.api.classes:
+            # Only classes with the same name or a name ending with the searched name can be connected to the path
+            for class_id in self.api.get_class_ids_by_name_suffix(import_qname_path.split("/")[-1]):
                 if self._is_path_connected_to_class(import_qname_path, class_id):
                     qname = class_id.replace("/", ".")
 
@@ -1070,13 +1141,17 @@ class StubsStringGenerator:
                     in_package = True
                     break
 
-            qname = qname or import_qname
+            self._add_resolved_import(qname or import_qname, in_package)
 
-            if not in_package:
-                self.classes_outside_package.add(qname)
+    def _add_resolved_import(self, qname: str, in_package: bool) -> None:
+        if self._type_imports is not None:
+            self._type_imports.append((qname, in_package))
 
-            if qname.replace(".", "/") != self._get_module_id():
-                self.module_imports.add(qname)
+        if not in_package:
+            self.classes_outside_package.add(qname)
+
+        if qname.replace(".", "/") != self._get_module_id():
+            self.module_imports.add(qname)
 
     def _create_todo_msg(self, indentations: str) -> str:
         if not self._current_todo_msgs:
@@ -1118,8 +1193,8 @@ class StubsStringGenerator:
         if class_qname in self.api.classes:
             return self.api.classes[class_qname]
 
-        # If we found nothing, we try to search it through all classes
-        for class_ in self.api.classes:
+        # If we found nothing, we try to search it through all classes with a matching name
+        for class_ in self.api.get_class_ids_by_name_suffix(class_name):
             if class_.endswith(class_qname) or (
                 class_.startswith(f"{class_path}/") and class_.endswith(f"/{class_name}")
             ):
@@ -1152,6 +1227,9 @@ class StubsStringGenerator:
         return self.reexport_module_id
 
     def _set_module_id(self, module_id: str) -> None:
+        # The imports of the cached type strings depend on the module
+        self._type_strings = {}
+
         if self.currently_creating_reexport_data:
             self.reexport_module_id = module_id
         else:
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import json
+import logging
+import shutil
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pytest
+from griffe.dataclasses import Docstring
 
-from safeds_stubgen.api_analyzer import get_api
+from safeds_stubgen.api_analyzer import API, WalkProfiler, get_api
+from safeds_stubgen.api_analyzer._get_api import _get_mypy_build
 from safeds_stubgen.docstring_parsing import DocstringStyle
 
 if TYPE_CHECKING:
@@ -567,3 +572,280 @@ def test_function_results(
     function_result_data = [result for result in api_data["results"] if result["id"] in function_result_ids]
 
     assert function_result_data == snapshot
+
+
+def test_mypy_cache(tmp_path: Path) -> None:
+    cache_dir = Path(tmp_path / "mypy_cache")
+
+    # The first run fills the cache, the second one reads from it
+    for _ in range(2):
+        api_data = get_api(root=package_root, is_test_run=True, cache_dir=cache_dir).to_dict()
+        assert api_data == api_data_paintext
+
+    assert cache_dir.is_dir()
+
+
+def test_low_memory(tmp_path: Path) -> None:
+    api_data = get_api(root=package_root, is_test_run=True, low_memory=True).to_dict()
+    assert api_data == api_data_paintext
+
+    # With a cache directory, the second run loads all modules from the filled cache
+    cache_dir = Path(tmp_path / "mypy_cache")
+    for _ in range(2):
+        api_data = get_api(root=package_root, is_test_run=True, cache_dir=cache_dir, low_memory=True).to_dict()
+        assert api_data == api_data_paintext
+
+
+def test_lazy_imports(tmp_path: Path) -> None:
+    # Packages without third party dependencies are analyzed the same way
+    api_data = get_api(root=package_root, is_test_run=True, lazy_imports=True).to_dict()
+    assert api_data == api_data_paintext
+
+    lazy_package_root = Path(tmp_path / "lazy_package")
+    lazy_package_root.mkdir()
+    Path(lazy_package_root / "__init__.py").write_text("", encoding="utf-8")
+    Path(lazy_package_root / "lazy_module.py").write_text(
+        "import griffe\n"
+        "from griffe import Object\n"
+        "from missing_module import MissingClass\n"
+        "\n"
+        "class LazyClass(Object): ...\n"
+        "\n"
+        "class MissingSubclass(MissingClass): ...\n"
+        "\n"
+        "def lazy_function(a: Object, b: griffe.Docstring) -> None: ...\n",
+        encoding="utf-8",
+    )
+
+    build_result = _get_mypy_build(
+        files=[str(lazy_package_root / "lazy_module.py")],
+        package_root=lazy_package_root,
+        lazy_imports=True,
+    )
+    assert not any(module_id.startswith(("griffe", "_griffe")) for module_id in build_result.graph)
+
+    # The types of the skipped modules are still added with their qualified names
+    api_data = get_api(root=lazy_package_root, lazy_imports=True).to_dict()
+    assert [class_["superclasses"] for class_ in api_data["classes"]] == [
+        ["griffe.Object"],
+        ["missing_module.MissingClass"],
+    ]
+    assert [parameter["type"]["qname"] for parameter in api_data["parameters"]] == ["griffe.Object", "griffe.Docstring"]
+
+    # Without lazy imports, superclasses from missing modules keep the name of the importing module
+    api_data = get_api(root=lazy_package_root).to_dict()
+    assert [class_["superclasses"] for class_ in api_data["classes"]] == [
+        ["_griffe.models.Object"],
+        ["lazy_package.lazy_module.MissingClass"],
+    ]
+
+
+def test_functions_with_the_same_name() -> None:
+    class_data = _get_specific_class_data(_class_module_name, "ClassWithOverloadedFunction2")
+    getter_id, setter_id = class_data["methods"]
+
+    assert setter_id == f"{getter_id}@2"
+    assert _get_specific_function_data(_class_module_name, "stale", "ClassWithOverloadedFunction2")["is_property"]
+    setter_data = next(function for function in api_data_paintext["functions"] if function["id"] == setter_id)
+    assert setter_data["name"] == "stale"
+    assert setter_data["parameters"] == [f"{setter_id}/self", f"{setter_id}/val"]
+
+
+def test_walk_profiler() -> None:
+    walk_profiler = WalkProfiler()
+    api_data = get_api(
+        root=package_root,
+        docstring_style=DocstringStyle.NUMPYDOC,
+        is_test_run=True,
+        walk_profiler=walk_profiler,
+    ).to_dict()
+
+    # The profiled run creates the same data
+    assert api_data == api_data_numpy
+    assert len([symbol for symbol in walk_profiler.symbols.values() if symbol.kind == "module"]) == len(
+        api_data["modules"],
+    )
+
+    function_module = walk_profiler.symbols["module", f"tests.data.{_test_package_name}.function_module"]
+    assert function_module.time > 0
+    assert function_module.call_counts["mypy_type_to_abstract_type"] > 0
+    assert function_module.call_counts["get_function_documentation"] > 0
+
+    # Outer classes include the costs of their nested classes
+    outer_class = walk_profiler.symbols["class", f"tests.data.{_test_package_name}.class_module.ClassModuleClassD"]
+    inner_class = walk_profiler.symbols[
+        "class",
+        f"tests.data.{_test_package_name}.class_module.ClassModuleClassD.ClassModuleNestedClassE",
+    ]
+    assert outer_class.nodes > inner_class.nodes
+    assert outer_class.time >= inner_class.time
+
+    top_symbols = walk_profiler.top(3, sort_by="mypy_type_to_abstract_type")
+    assert len(top_symbols) == 3
+    assert [symbol.call_counts.get("mypy_type_to_abstract_type", 0) for symbol in top_symbols] == sorted(
+        (symbol.call_counts.get("mypy_type_to_abstract_type", 0) for symbol in top_symbols),
+        reverse=True,
+    )
+    walk_profile = walk_profiler.to_dict(n=3)
+    assert [symbol["name"] for symbol in walk_profile["symbols"]] == [symbol.name for symbol in walk_profiler.top(3)]
+    assert set(walk_profiler.method_times) >= {"mypy_type_to_abstract_type", "get_function_documentation"}
+
+
+def test_incremental_state(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    copied_package_root = Path(tmp_path / _test_package_name)
+    shutil.copytree(package_root, copied_package_root)
+    state_file = Path(tmp_path / "incremental_state.pickle")
+
+    # The __init__.py files are walked again in every run, since their reexports are needed
+    package_modules = {
+        ".".join((_test_package_name, *init_file.parent.relative_to(copied_package_root).parts))
+        for init_file in copied_package_root.rglob("__init__.py")
+    }
+    reuse_message = "Reusing the API data of the unchanged module "
+
+    def run_incrementally() -> tuple[dict, set[str], set[str]]:
+        walk_profiler = WalkProfiler()
+        caplog.clear()
+        with caplog.at_level(logging.INFO):
+            api_data = get_api(
+                root=copied_package_root,
+                is_test_run=True,
+                incremental_state_file=state_file,
+                walk_profiler=walk_profiler,
+            ).to_dict()
+        walked_modules = {name for kind, name in walk_profiler.symbols if kind == "module"}
+        reused_modules = {
+            record.getMessage().removeprefix(reuse_message)
+            for record in caplog.records
+            if record.getMessage().startswith(reuse_message)
+        }
+        return api_data, walked_modules, reused_modules
+
+    # The first run creates the state and walks all modules
+    api_data, walked_modules, reused_modules = run_incrementally()
+    assert api_data == get_api(root=copied_package_root, is_test_run=True).to_dict()
+    assert state_file.is_file()
+    assert reused_modules == set()
+    all_modules = walked_modules
+
+    # The second run reuses the data of all modules except for the __init__.py files
+    api_data, walked_modules, reused_modules = run_incrementally()
+    assert api_data == get_api(root=copied_package_root, is_test_run=True).to_dict()
+    assert walked_modules - package_modules == set()
+    assert reused_modules == all_modules - package_modules
+
+    # Change a module that no other module except for the __init__.py file depends on
+    changed_module = Path(copied_package_root / "class_module.py")
+    changed_module.write_text(
+        changed_module.read_text(encoding="utf-8") + "\n\nclass NewClass:\n    def new_method(self, a: int) -> str: ...\n",
+        encoding="utf-8",
+    )
+
+    api_data, walked_modules, reused_modules = run_incrementally()
+    assert api_data == get_api(root=copied_package_root, is_test_run=True).to_dict()
+    assert any(class_["name"] == "NewClass" for class_ in api_data["classes"])
+    assert walked_modules - package_modules == {f"{_test_package_name}.class_module"}
+    assert reused_modules == all_modules - package_modules - walked_modules
+
+
+@pytest.mark.parametrize(
+    "docstring_style",
+    [DocstringStyle.GOOGLE, DocstringStyle.NUMPYDOC, DocstringStyle.REST],
+)
+def test_parallel_docstring_parsing(docstring_style: DocstringStyle) -> None:
+    docstring_package_root = Path(_test_dir / "data" / "docstring_parser_package")
+
+    api_data = get_api(root=docstring_package_root, docstring_style=docstring_style, is_test_run=True).to_dict()
+    parallel_api_data = get_api(
+        root=docstring_package_root,
+        docstring_style=docstring_style,
+        is_test_run=True,
+        workers=2,
+    ).to_dict()
+
+    assert parallel_api_data == api_data
+
+
+def test_parallel_docstring_parsing_without_cached_sections(
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    docstring_package_root = Path(_test_dir / "data" / "docstring_parser_package")
+    api_data = get_api(root=docstring_package_root, docstring_style=DocstringStyle.NUMPYDOC, is_test_run=True).to_dict()
+
+    # Without a cached "parsed" property, the docstrings have to be parsed serially
+    monkeypatch.setattr(Docstring, "parsed", property(Docstring.parse))
+    with caplog.at_level(logging.INFO):
+        parallel_api_data = get_api(
+            root=docstring_package_root,
+            docstring_style=DocstringStyle.NUMPYDOC,
+            is_test_run=True,
+            workers=2,
+        ).to_dict()
+
+    assert parallel_api_data == api_data
+    assert "Parsed 0 docstrings with 2 worker processes." in caplog.text
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_to_json_file(tmp_path: Path, compact: bool) -> None:
+    api = get_api(root=package_root, is_test_run=True)
+    json_file = Path(tmp_path / "api.json")
+
+    api.to_json_file(json_file, compact=compact)
+
+    # The streamed file has to be the same as the dump of the whole dict
+    if compact:
+        expected_json = json.dumps(api.to_dict(), separators=(",", ":"))
+    else:
+        expected_json = json.dumps(api.to_dict(), indent=2)
+    assert json_file.read_text(encoding="utf-8") == expected_json
+
+
+@pytest.mark.parametrize(
+    "docstring_style",
+    [DocstringStyle.PLAINTEXT, DocstringStyle.NUMPYDOC, DocstringStyle.GOOGLE, DocstringStyle.REST],
+)
+def test_from_json_file(tmp_path: Path, docstring_style: DocstringStyle) -> None:
+    api = get_api(root=package_root, docstring_style=docstring_style, is_test_run=True)
+    json_file = Path(tmp_path / "api.json")
+    api.to_json_file(json_file)
+
+    loaded_api = API.from_json_file(json_file)
+
+    assert loaded_api.to_dict() == api.to_dict()
+    assert set(loaded_api.reexport_map) == set(api.reexport_map)
+
+    # Methods with the same name, like the getter and setter of a property, are restored as well
+    for class_id, class_ in api.classes.items():
+        loaded_methods = [method.to_dict() for method in loaded_api.classes[class_id].methods]
+        assert loaded_methods == [method.to_dict() for method in class_.methods]
+
+
+def test_from_dict_schema_version() -> None:
+    api_data = get_api(root=package_root, is_test_run=True).to_dict()
+    api_data["schemaVersion"] = 0
+
+    with pytest.raises(ValueError, match="Unsupported API schema version 0"):
+        API.from_dict(api_data)
+
+
+def test_from_binary_file(tmp_path: Path) -> None:
+    api = get_api(root=package_root, docstring_style=DocstringStyle.NUMPYDOC, is_test_run=True)
+    binary_file = Path(tmp_path / "api.bin")
+    api.to_binary_file(binary_file)
+
+    loaded_api = API.from_binary_file(binary_file)
+
+    assert loaded_api.to_dict() == api.to_dict()
+    for class_id, class_ in api.classes.items():
+        loaded_methods = [method.to_dict() for method in loaded_api.classes[class_id].methods]
+        assert loaded_methods == [method.to_dict() for method in class_.methods]
+
+
+def test_from_binary_file_invalid(tmp_path: Path) -> None:
+    json_file = Path(tmp_path / "api.json")
+    get_api(root=package_root, is_test_run=True).to_json_file(json_file)
+
+    with pytest.raises(ValueError, match="is no binary API file"):
+        API.from_binary_file(json_file)
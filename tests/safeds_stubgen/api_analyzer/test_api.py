@@ -1,11 +1,13 @@
 import pytest
 
 from safeds_stubgen.api_analyzer import (
+    API,
+    Class,
     NamedType,
     Parameter,
     ParameterAssignment,
 )
-from safeds_stubgen.docstring_parsing import ParameterDocstring
+from safeds_stubgen.docstring_parsing import ClassDocstring, ParameterDocstring
 
 
 @pytest.mark.parametrize(
@@ -37,3 +39,48 @@ def test_parameter(
 
     assert parameter.is_required == is_required
     assert parameter.is_variadic == is_variadic
+
+
+@pytest.mark.parametrize(
+    argnames=("suffix", "expected_ids"),
+    argvalues=[
+        ("MyClass", ["package/module/MyClass", "package/other_module/MyClass"]),
+        ("Class", ["package/module/MyClass", "package/other_module/MyClass", "package/module/Class"]),
+        ("Unknown", []),
+        ("", ["package/module/MyClass", "package/other_module/MyClass", "package/module/Class"]),
+    ],
+)
+def test_api_get_class_ids_by_name_suffix(suffix: str, expected_ids: list[str]) -> None:
+    api = _create_api_with_classes()
+
+    # Adding a class again must not change the order
+    api.add_class(api.classes["package/module/MyClass"])
+
+    assert api.get_class_ids_by_name_suffix(suffix) == expected_ids
+
+
+@pytest.mark.parametrize("suffix", ["MyClass", "Unknown", ""])
+def test_api_get_class_ids_by_name_suffix_returns_copy(suffix: str) -> None:
+    api = _create_api_with_classes()
+    expected_ids = list(api.get_class_ids_by_name_suffix(suffix))
+
+    class_ids = api.get_class_ids_by_name_suffix(suffix)
+    class_ids.append("package/module/UnknownClass")
+    class_ids.reverse()
+
+    assert api.get_class_ids_by_name_suffix(suffix) == expected_ids
+
+
+def _create_api_with_classes() -> API:
+    api = API(distribution="", package="package", version="")
+    for class_id in ["package/module/MyClass", "package/other_module/MyClass", "package/module/Class"]:
+        api.add_class(
+            Class(
+                id=class_id,
+                name=class_id.split("/")[-1],
+                superclasses=[],
+                is_public=True,
+                docstring=ClassDocstring(),
+            ),
+        )
+    return api
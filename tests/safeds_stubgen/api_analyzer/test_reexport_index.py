@@ -0,0 +1,42 @@
+import pytest
+
+from safeds_stubgen.api_analyzer import Module, ReexportIndex
+
+
+@pytest.fixture
+def reexport_index() -> ReexportIndex:
+    index = ReexportIndex()
+    package = Module(id_="package", name="__init__")
+    subpackage = Module(id_="package/subpackage", name="__init__")
+    index.add("package.module.MyClass", package)
+    index.add("package.module.MyClass", subpackage)
+    index.add("package.module.Class", package)
+    index.add("package.other_module.*", subpackage)
+    return index
+
+
+def test_reexport_index_lookup(reexport_index: ReexportIndex) -> None:
+    assert "package.module.MyClass" in reexport_index
+    assert "package.module" not in reexport_index
+    assert len(reexport_index) == 3
+    assert list(reexport_index) == ["package.module.MyClass", "package.module.Class", "package.other_module.*"]
+    assert {module.id for module in reexport_index["package.module.MyClass"]} == {"package", "package/subpackage"}
+
+
+@pytest.mark.parametrize(
+    argnames=("suffix", "expected_names"),
+    argvalues=[
+        ("MyClass", ("package.module.MyClass",)),
+        ("Class", ("package.module.MyClass", "package.module.Class")),
+        ("*", ("package.other_module.*",)),
+        ("module.Class", ("package.module.Class",)),
+        ("Unknown", ()),
+    ],
+)
+def test_reexport_index_names_ending_with(
+    reexport_index: ReexportIndex,
+    suffix: str,
+    expected_names: tuple[str, ...],
+) -> None:
+    assert reexport_index.names_ending_with(suffix) == expected_names
+    assert reexport_index.names_ending_with(suffix) == tuple(name for name in reexport_index if name.endswith(suffix))
@@ -351,3 +351,38 @@ def test_tuple_type() -> None:
 def test_abstract_type_from_dict_exception() -> None:
     with pytest.raises(ValueError, match="Cannot parse unknown_type value."):
         AbstractType.from_dict({"kind": "unknown_type"})
+
+
+def test_interned_types() -> None:
+    int_type = NamedType("int", "builtins.int")
+    str_type = NamedType("str", "builtins.str")
+
+    assert NamedType("int", "builtins.int") is int_type
+    assert AbstractType.from_dict(int_type.to_dict()) is int_type
+    assert UnionType([int_type, str_type]) is UnionType([NamedType("int", "builtins.int"), str_type])
+    assert DictType(str_type, int_type) is DictType(str_type, int_type)
+    assert DictType(str_type, int_type) is not DictType(int_type, str_type)
+
+    # Equal types with a different order are still different objects, since the order is part of the stubs
+    assert UnionType([int_type, str_type]) == UnionType([str_type, int_type])
+    assert UnionType([int_type, str_type]) is not UnionType([str_type, int_type])
+
+    # Equal literals of different types are different objects
+    assert LiteralType([1]) is not LiteralType([True])
+    assert LiteralType([1]) is not LiteralType([1.0])
+
+
+def test_immutable_types() -> None:
+    literal_type = LiteralType(["a", 1])
+    union_type = UnionType([NamedType("int", "builtins.int"), literal_type])
+
+    assert union_type.types == (NamedType("int", "builtins.int"), literal_type)
+    assert literal_type.literals == ("a", 1)
+
+    # Changing the data of a type must not change the type itself
+    literal_type.to_dict()["literals"].append(None)
+    assert literal_type.literals == ("a", 1)
+
+    # The cached hash is computed again for copies of a type
+    assert hash(deepcopy(union_type)) == hash(union_type)
+    assert deepcopy(union_type) == union_type
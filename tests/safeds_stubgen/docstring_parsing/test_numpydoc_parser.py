@@ -975,3 +975,22 @@ def test_get_result_documentation(
     node = get_specific_mypy_node(mypy_file, function_name)
     assert isinstance(node, nodes.FuncDef)
     assert numpydoc_parser.get_result_documentation(node.fullname) == expected_result_documentation
+
+
+def test_cache_stats(numpydoc_parser: DocstringParser) -> None:
+    node = get_specific_mypy_node(mypy_file, "function_with_parameters")
+    assert isinstance(node, nodes.FuncDef)
+
+    numpydoc_parser.get_function_documentation(node)
+    for parameter_name in ["no_type_no_default", "type_no_default"]:
+        numpydoc_parser.get_parameter_documentation(
+            function_qname=node.fullname,
+            parameter_name=parameter_name,
+            parent_class_qname="",
+        )
+
+    # The node is only searched and the docstring only parsed once
+    assert numpydoc_parser.cache_stats.node_misses == 1
+    assert numpydoc_parser.cache_stats.node_hits == 2
+    assert numpydoc_parser.cache_stats.section_misses == 1
+    assert numpydoc_parser.cache_stats.section_hits == 2
@@ -5,9 +5,16 @@ from typing import TYPE_CHECKING
 
 import pytest
 
-from safeds_stubgen.api_analyzer import TypeSourcePreference, TypeSourceWarning, get_api
+from safeds_stubgen.api_analyzer import API, TypeSourcePreference, TypeSourceWarning, get_api
 from safeds_stubgen.docstring_parsing import DocstringStyle
-from safeds_stubgen.stubs_generator import NamingConvention, StubsStringGenerator, create_stub_files, generate_stub_data
+from safeds_stubgen.stubs_generator import (
+    NamingConvention,
+    StubFileWriteStats,
+    StubsStringGenerator,
+    create_stub_files,
+    generate_stub_data,
+    iter_stub_data,
+)
 
 # noinspection PyProtectedMember
 from safeds_stubgen.stubs_generator._generate_stubs import _convert_name_to_convention
@@ -177,3 +184,200 @@ def test_stub_docstring_creation(
             return
 
     raise pytest.fail(f"Could not find data for '{filename}'.")
+
+
+def test_create_stub_files_skip_unchanged(tmp_path: Path) -> None:
+    tmp_stubs_generator = StubsStringGenerator(api=api, convert_identifiers=True)
+    tmp_stubs_data = generate_stub_data(stubs_generator=tmp_stubs_generator, out_path=tmp_path)
+
+    # The first run also creates the stub file of a module that is removed later
+    removed_module_dir, _, removed_module_text, _ = tmp_stubs_data[0]
+    create_stub_files(
+        stubs_generator=tmp_stubs_generator,
+        stubs_data=[*tmp_stubs_data, (removed_module_dir, "removed_module", removed_module_text, False)],
+        out_path=tmp_path,
+        skip_unchanged=True,
+    )
+    outdated_file = Path(removed_module_dir / "removed_module.sdsstub")
+    assert outdated_file.is_file()
+    outdated_file.unlink()
+    stub_files = list(tmp_path.glob("**/*.sdsstub"))
+    outdated_file.write_text(removed_module_text, encoding="utf-8")
+    modification_times = {path: path.stat().st_mtime_ns for path in stub_files}
+
+    # Change one stub file, all other files should be left untouched
+    changed_file = next(path for path in stub_files if path.name == "class_module.sdsstub")
+    changed_file.write_text("", encoding="utf-8")
+    modification_times[changed_file] = changed_file.stat().st_mtime_ns
+
+    # Stub files that were not created by the stubs generator for this package, e.g. the ones of another package, are
+    #  kept
+    foreign_file = Path(tmp_path / "other_package" / "other_module" / "other_module.sdsstub")
+    foreign_file.parent.mkdir(parents=True)
+    foreign_file.write_text("package otherPackage\n", encoding="utf-8")
+
+    write_stats = create_stub_files(
+        stubs_generator=tmp_stubs_generator,
+        stubs_data=tmp_stubs_data,
+        out_path=tmp_path,
+        skip_unchanged=True,
+    )
+
+    assert changed_file.read_text(encoding="utf-8") != ""
+    assert not outdated_file.exists()
+    assert foreign_file.is_file()
+    for path in stub_files:
+        if path != changed_file:
+            assert path.stat().st_mtime_ns == modification_times[path]
+
+    # Only the changed stub file was written again
+    assert write_stats.updated == 1
+    assert write_stats.unchanged == len(stub_files) - 1
+    assert write_stats.created == 0
+    assert write_stats.deleted == 1
+    assert list(tmp_path.glob("**/*.tmp")) == []
+
+
+def test_create_stub_files_write_stats(tmp_path: Path) -> None:
+    tmp_stubs_generator = StubsStringGenerator(api=api, convert_identifiers=True)
+    tmp_stubs_data = generate_stub_data(stubs_generator=tmp_stubs_generator, out_path=tmp_path)
+
+    write_stats = create_stub_files(stubs_generator=tmp_stubs_generator, stubs_data=tmp_stubs_data, out_path=tmp_path)
+    stub_file_count = len(list(tmp_path.glob("**/*.sdsstub")))
+    assert stub_file_count > len(tmp_stubs_data)
+    assert write_stats == StubFileWriteStats(created=stub_file_count)
+
+    # The stub files of classes outside the package already contain all classes and are left unchanged
+    write_stats = create_stub_files(stubs_generator=tmp_stubs_generator, stubs_data=tmp_stubs_data, out_path=tmp_path)
+    outside_file_count = stub_file_count - len(tmp_stubs_data)
+    assert write_stats == StubFileWriteStats(unchanged=outside_file_count, updated=len(tmp_stubs_data))
+
+
+def test_create_outside_package_modules(tmp_path: Path) -> None:
+    tmp_stubs_generator = StubsStringGenerator(api=api, convert_identifiers=True)
+    tmp_stubs_generator.classes_outside_package = {
+        "outside_module.sub_module.ClassB",
+        "outside_module.sub_module.ClassA",
+        "outside_module.sub_module.class_c",
+        "outside_module.OuterClass",
+    }
+    create_stub_files(stubs_generator=tmp_stubs_generator, stubs_data=[], out_path=tmp_path)
+
+    assert Path(tmp_path / "outside_module" / "sub_module" / "sub_module.sdsstub").read_text(encoding="utf-8") == (
+        '@PythonModule("outside_module.sub_module")\n'
+        "package outsideModule.subModule\n"
+        "\nclass ClassA\n"
+        "\nclass ClassB\n"
+        '\n@PythonName("class_c")\nclass ClassC\n'
+    )
+    assert Path(tmp_path / "outside_module" / "outside_module.sdsstub").read_text(encoding="utf-8") == (
+        '@PythonModule("outside_module")\npackage outsideModule\n\nclass OuterClass\n'
+    )
+
+
+def test_create_outside_package_modules_existing_file(tmp_path: Path) -> None:
+    # An existing stub file, e.g. of another package in the same output directory, is kept and the classes are added
+    existing_file = Path(tmp_path / "outside_module" / "outside_module.sdsstub")
+    existing_file.parent.mkdir(parents=True)
+    existing_text = "package outsideModule\n\n// Existing docstring\nclass ExistingClass() {\n    attr a: Int\n}\n"
+    existing_file.write_text(existing_text, encoding="utf-8")
+
+    tmp_stubs_generator = StubsStringGenerator(api=api, convert_identifiers=True)
+    tmp_stubs_generator.classes_outside_package = {"outside_module.OuterClass"}
+    write_stats = create_stub_files(stubs_generator=tmp_stubs_generator, stubs_data=[], out_path=tmp_path)
+
+    assert existing_file.read_text(encoding="utf-8") == existing_text + "\nclass OuterClass\n"
+    assert write_stats == StubFileWriteStats(updated=1)
+
+    # Classes that are already in the file are not added again
+    write_stats = create_stub_files(stubs_generator=tmp_stubs_generator, stubs_data=[], out_path=tmp_path)
+    assert write_stats == StubFileWriteStats(unchanged=1)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_iter_stub_data(tmp_path: Path, workers: int) -> None:
+    # Both runs need their own API, since the stubs generator changes the names of reexported classes and functions
+    listed_stubs_generator = StubsStringGenerator(
+        api=get_api(_test_package_dir, is_test_run=True),
+        convert_identifiers=True,
+    )
+    listed_stubs_data = generate_stub_data(stubs_generator=listed_stubs_generator, out_path=tmp_path / "listed")
+    create_stub_files(
+        stubs_generator=listed_stubs_generator,
+        stubs_data=listed_stubs_data,
+        out_path=tmp_path / "listed",
+    )
+
+    streamed_stubs_generator = StubsStringGenerator(
+        api=get_api(_test_package_dir, is_test_run=True),
+        convert_identifiers=True,
+    )
+    streamed_stubs_data = iter_stub_data(
+        stubs_generator=streamed_stubs_generator,
+        out_path=tmp_path / "streamed",
+        workers=workers,
+    )
+    create_stub_files(
+        stubs_generator=streamed_stubs_generator,
+        stubs_data=streamed_stubs_data,
+        out_path=tmp_path / "streamed",
+    )
+
+    listed_files = {
+        path.relative_to(tmp_path / "listed"): path.read_text(encoding="utf-8")
+        for path in (tmp_path / "listed").glob("**/*.sdsstub")
+    }
+    streamed_files = {
+        path.relative_to(tmp_path / "streamed"): path.read_text(encoding="utf-8")
+        for path in (tmp_path / "streamed").glob("**/*.sdsstub")
+    }
+    assert streamed_files == listed_files
+
+
+@pytest.mark.parametrize("workers", [2, 3])
+def test_generate_stub_data_in_parallel(workers: int) -> None:
+    # Both runs need their own API, since the stubs generator changes the names of reexported classes and functions
+    serial_stubs_generator = StubsStringGenerator(
+        api=get_api(_test_package_dir, is_test_run=True),
+        convert_identifiers=True,
+    )
+    serial_stubs_data = generate_stub_data(stubs_generator=serial_stubs_generator, out_path=_out_dir)
+
+    parallel_stubs_generator = StubsStringGenerator(
+        api=get_api(_test_package_dir, is_test_run=True),
+        convert_identifiers=True,
+    )
+    parallel_stubs_data = generate_stub_data(
+        stubs_generator=parallel_stubs_generator,
+        out_path=_out_dir,
+        workers=workers,
+    )
+
+    assert parallel_stubs_data == serial_stubs_data
+    assert parallel_stubs_generator.classes_outside_package == serial_stubs_generator.classes_outside_package
+    assert parallel_stubs_generator.type_string_cache_stats == serial_stubs_generator.type_string_cache_stats
+
+
+def test_generate_stub_data_from_json_file(tmp_path: Path) -> None:
+    json_file = Path(tmp_path / "api.json")
+    analyzed_api = get_api(_test_package_dir, is_test_run=True)
+    analyzed_api.to_json_file(json_file)
+    analyzed_stubs_generator = StubsStringGenerator(api=analyzed_api, convert_identifiers=True)
+    analyzed_stubs_data = generate_stub_data(stubs_generator=analyzed_stubs_generator, out_path=_out_dir)
+
+    loaded_stubs_generator = StubsStringGenerator(api=API.from_json_file(json_file), convert_identifiers=True)
+    loaded_stubs_data = generate_stub_data(stubs_generator=loaded_stubs_generator, out_path=_out_dir)
+
+    # The entities of the loaded API are ordered by their IDs, so the stub files might be created in another order
+    assert sorted(loaded_stubs_data) == sorted(analyzed_stubs_data)
+    assert loaded_stubs_generator.classes_outside_package == analyzed_stubs_generator.classes_outside_package
+
+
+def test_type_string_cache_stats() -> None:
+    api_ = get_api(_test_package_dir, is_test_run=True)
+    stubs_generator_ = StubsStringGenerator(api=api_, convert_identifiers=True)
+    generate_stub_data(stubs_generator=stubs_generator_, out_path=_out_dir)
+
+    stats = stubs_generator_.type_string_cache_stats
+    assert stats.hits > 0
+    assert stats.misses > 0
@@ -1,10 +1,16 @@
 import json
+import shutil
 import sys
+import threading
+import time
 from pathlib import Path
 
 import pytest
 from syrupy import SnapshotAssertion
 
+from safeds_stubgen.api_analyzer import TypeSourcePreference, TypeSourceWarning
+from safeds_stubgen.api_analyzer.cli._cli import _watch_stub_generator
+from safeds_stubgen.docstring_parsing import DocstringStyle
 from safeds_stubgen.main import main
 
 _lib_dir = Path(__file__).parent.parent.parent
@@ -53,3 +59,168 @@ def test_main_empty() -> None:
 
     with pytest.raises(ValueError, match="No files found to analyse."):
         main()
+
+
+def test_main_watch(tmp_path: Path) -> None:
+    src_dir = Path(tmp_path / _test_package_name)
+    out_dir = Path(tmp_path / "out")
+    shutil.copytree(_test_package_dir, src_dir)
+    api_file = Path(out_dir / f"{_test_package_name}__api.json")
+
+    watch_thread = threading.Thread(
+        target=_watch_stub_generator,
+        kwargs={
+            "src_dir_path": src_dir,
+            "out_dir_path": out_dir,
+            "docstring_style": DocstringStyle.PLAINTEXT,
+            "is_test_run": True,
+            "convert_identifiers": True,
+            "type_source_preference": TypeSourcePreference.CODE,
+            "type_source_warning": TypeSourceWarning.WARN,
+            "max_runs": 2,
+        },
+    )
+    watch_thread.start()
+
+    # Wait for the first run
+    deadline = time.time() + 60
+    while not api_file.is_file() and time.time() < deadline:
+        time.sleep(0.1)
+    assert api_file.is_file()
+
+    # Change a module, which triggers the second run
+    changed_module = Path(src_dir / "main_module.py")
+    changed_module.write_text(
+        changed_module.read_text(encoding="utf-8") + "\n\nclass WatchedClass:\n    pass\n",
+        encoding="utf-8",
+    )
+    watch_thread.join(timeout=60)
+    assert not watch_thread.is_alive()
+
+    with Path.open(api_file, encoding="utf-8") as f:
+        json_data = json.load(f)
+
+    assert any(class_["name"] == "WatchedClass" for class_ in json_data["classes"])
+    assert Path(out_dir / ".mypy_cache").is_dir()
+
+
+@pytest.mark.parametrize("api_file_suffix", ["json", "bin"])
+def test_main_api_json(tmp_path: Path, api_file_suffix: str) -> None:
+    analyzed_out_dir = Path(tmp_path / "analyzed")
+    loaded_out_dir = Path(tmp_path / "loaded")
+    sys.argv = [str(_main_dir), "-s", str(_test_package_dir), "-o", str(analyzed_out_dir), "-tr", "-nc", "-ab"]
+    main()
+
+    # Generate the stubs again, only from the API data file of the first run
+    api_file = Path(analyzed_out_dir / f"{_test_package_name}__api.{api_file_suffix}")
+    sys.argv = [str(_main_dir), "-aj", str(api_file), "-o", str(loaded_out_dir), "-nc"]
+    main()
+
+    analyzed_stubs = {
+        path.relative_to(analyzed_out_dir): path.read_text(encoding="utf-8")
+        for path in analyzed_out_dir.glob("**/*.sdsstub")
+    }
+    loaded_stubs = {
+        path.relative_to(loaded_out_dir): path.read_text(encoding="utf-8")
+        for path in loaded_out_dir.glob("**/*.sdsstub")
+    }
+    assert analyzed_stubs
+    assert loaded_stubs == analyzed_stubs
+
+
+@pytest.mark.parametrize("flag", ["-lm", "-li"])
+def test_main_mypy_build_modes(tmp_path: Path, flag: str) -> None:
+    out_dir = Path(tmp_path / "out")
+    mode_out_dir = Path(tmp_path / "mode_out")
+    sys.argv = [str(_main_dir), "-s", str(_test_package_dir), "-o", str(out_dir), "-tr", "-nc"]
+    main()
+    sys.argv = [str(_main_dir), "-s", str(_test_package_dir), "-o", str(mode_out_dir), "-tr", "-nc", flag]
+    main()
+
+    out_files = {path.relative_to(out_dir): path.read_bytes() for path in out_dir.glob("**/*") if path.is_file()}
+    mode_out_files = {
+        path.relative_to(mode_out_dir): path.read_bytes() for path in mode_out_dir.glob("**/*") if path.is_file()
+    }
+    assert out_files
+    assert mode_out_files == out_files
+
+
+def test_main_profile_report(tmp_path: Path) -> None:
+    out_dir = Path(tmp_path / "out")
+    report_path = Path(tmp_path / "profile.json")
+    sys.argv = [str(_main_dir), "-s", str(_test_package_dir), "-o", str(out_dir), "-tr", "-nc", "-j", "2"]
+    sys.argv += ["--docstyle", "NUMPYDOC", "-pr", str(report_path)]
+    main()
+
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    assert report["version"] == 1
+    assert report["wall_time"] > 0
+    assert report["peak_memory"] > 0
+    assert [phase["name"] for phase in report["phases"]] == [
+        "file_discovery",
+        "mypy_build",
+        "aliases",
+        "griffe_load",
+        "docstring_preparsing",
+        "ast_walk",
+        "api_json",
+        "stub_files",
+        "stub_data",
+    ]
+    for phase in report["phases"]:
+        assert phase["calls"] >= 1
+        assert phase["wall_time"] >= 0
+        assert phase["cpu_time"] >= 0
+    # The stub data phase is entered once per created stub file
+    assert next(phase for phase in report["phases"] if phase["name"] == "stub_data")["calls"] > 1
+    assert (out_dir / f"{_test_package_name}__api.json").is_file()
+
+
+def test_main_walk_profile(tmp_path: Path) -> None:
+    out_dir = Path(tmp_path / "out")
+    report_path = Path(tmp_path / "profile.json")
+    sys.argv = [str(_main_dir), "-s", str(_test_package_dir), "-o", str(out_dir), "-tr", "-nc", "-pr", str(report_path)]
+    sys.argv += ["-wp", "2", "-wps", "nodes"]
+    main()
+
+    walk_profile = json.loads(report_path.read_text(encoding="utf-8"))["walk_profile"]
+    assert walk_profile["sort_by"] == "nodes"
+    assert len(walk_profile["symbols"]) == 2
+    assert walk_profile["symbols"][0]["nodes"] >= walk_profile["symbols"][1]["nodes"]
+    assert set(walk_profile["symbols"][0]) == {"kind", "name", "nodes", "time", "call_counts"}
+    assert "mypy_type_to_abstract_type" in walk_profile["method_times"]
+    assert (out_dir / f"{_test_package_name}__api.json").is_file()
+
+
+@pytest.mark.parametrize("flags", [["-wp", "2"], ["-w", "-wp", "2", "-pr", "profile.json"]])
+def test_main_walk_profile_invalid_flags(tmp_path: Path, flags: list[str]) -> None:
+    sys.argv = [str(_main_dir), "-s", str(_test_package_dir), "-o", str(tmp_path), *flags]
+
+    with pytest.raises(SystemExit):
+        main()
+
+
+@pytest.mark.parametrize("flag", ["-w", "-i", "-lm"])
+def test_main_api_json_with_source_analysis_flag(tmp_path: Path, flag: str) -> None:
+    api_file = Path(tmp_path / "api.json")
+    sys.argv = [str(_main_dir), "-aj", str(api_file), "-o", str(tmp_path / "out"), flag]
+
+    with pytest.raises(SystemExit):
+        main()
+    assert not Path(tmp_path / "out").exists()
+
+
+@pytest.mark.parametrize("workers", ["0", "-3"])
+def test_main_invalid_workers(tmp_path: Path, workers: str) -> None:
+    sys.argv = [str(_main_dir), "-s", str(_test_package_dir), "-o", str(tmp_path / "out"), "-j", workers]
+
+    with pytest.raises(SystemExit):
+        main()
+    assert not Path(tmp_path / "out").exists()
+
+
+def test_main_without_source() -> None:
+    sys.argv = [str(_main_dir), "-o", str(_out_dir)]
+
+    with pytest.raises(SystemExit):
+        main()
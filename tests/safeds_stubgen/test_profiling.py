@@ -0,0 +1,48 @@
+import time
+
+import pytest
+
+from safeds_stubgen._profiling import Profiler, profile_iterator, profile_phase
+
+
+def test_profile_phase_without_profiler() -> None:
+    with profile_phase("phase"):
+        pass
+    assert list(profile_iterator("iterator", [1, 2])) == [1, 2]
+
+
+def test_nested_phases_are_exclusive() -> None:
+    with Profiler() as profiler:
+        with profile_phase("outer"):
+            time.sleep(0.02)
+            with profile_phase("inner"):
+                time.sleep(0.05)
+        with profile_phase("outer"):
+            pass
+
+    outer = profiler.phases["outer"]
+    inner = profiler.phases["inner"]
+    assert outer.calls == 2
+    assert inner.calls == 1
+    assert inner.wall_time >= 0.05
+    assert 0.02 <= outer.wall_time < inner.wall_time
+
+    report = profiler.to_dict()
+    assert report["wall_time"] >= outer.wall_time + inner.wall_time
+    assert [phase["name"] for phase in report["phases"]] == ["outer", "inner"]
+
+
+def test_phase_is_recorded_on_error() -> None:
+    with Profiler() as profiler, pytest.raises(ValueError, match="error"), profile_phase("failing"):
+        raise ValueError("error")
+
+    assert profiler.phases["failing"].calls == 1
+
+
+def test_profile_iterator() -> None:
+    with Profiler() as profiler:
+        items = list(profile_iterator("items", iter([1, 2, 3])))
+
+    assert items == [1, 2, 3]
+    # Once per item and once for the end of the iterator
+    assert profiler.phases["items"].calls == 4